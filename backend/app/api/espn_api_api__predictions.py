@@ -1,7 +1,21 @@
-from fastapi import APIRouter
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+
+from app.services.predict_model import service
 
 router = APIRouter()
 
 @router.get('/predictions')
-async def get_predictions():
-    return {'message': 'Prediction endpoint'}
+def get_predictions(slate_date: Optional[date] = None, limit: Optional[int] = None):
+    """A slate's player predictions, scored once per (slate, model version) and then served from memory.
+
+    Declared sync so a cache miss scores in FastAPI's threadpool, not on the event loop.
+    """
+    if service.model is None:
+        raise HTTPException(status_code=503, detail='Model not loaded')
+    result = service.predictions(slate_date)
+    if limit is not None:
+        result = dict(result, predictions=result['predictions'][:limit])
+    return result
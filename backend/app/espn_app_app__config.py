@@ -3,3 +3,6 @@ import os
 
 load_dotenv()
 ALGORAND_API_KEY = os.getenv('ALGORAND_API_KEY')
+
+# Trained predictions artifact (written by services/train_model)
+MODEL_PATH = os.getenv('MODEL_PATH', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models', 'model.joblib'))
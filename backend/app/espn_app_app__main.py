@@ -1,6 +1,25 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-app = FastAPI()
+from app.api import blockchain, predictions
+from app.services.predict_model import service
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app):
+    # Load the model once per process so requests never pay for it
+    try:
+        service.load()
+    except FileNotFoundError:
+        logger.warning(f"No model artifact at {service.model_path}; /predictions returns 503 until one is trained")
+    yield
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(predictions.router)
+app.include_router(blockchain.router)
 
 @app.get('/')
 async def root():
@@ -1,2 +1,141 @@
-def load_model():
-    return {'message': 'Model loading placeholder'}
+import hashlib
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import date, datetime
+
+import joblib
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data_pipeline', 'model_training')))
+from app.config import MODEL_PATH
+from database.cache_invalidation import CACHE_VERSIONS_PATH, latest_invalidation, read_versions
+from feature_store import features_as_of
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_DAYS = 7  # players without a game in this many days aren't on the slate
+# Data a day's predictions depend on; the pipeline invalidates these when it writes
+SLATE_NAMESPACES = ('odds', 'roster', 'features')
+
+class LoadedModel:
+    """A trained artifact: the estimator, the feature columns it expects, and a version string."""
+
+    def __init__(self, estimator, features, version):
+        self.estimator = estimator
+        self.features = list(features)
+        self.version = version
+
+    def score(self, frame):
+        """One vectorized predict_proba over every row of `frame`."""
+        X = frame.reindex(columns=self.features).to_numpy(dtype=np.float64, na_value=np.nan)
+        X = np.where(np.isnan(X), 0.0, X)
+        return self.estimator.predict_proba(X)[:, 1]
+
+def artifact_version(path):
+    """Content hash of the artifact file, so a retrained model never reuses the old cache."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:12]
+
+def save_model(estimator, features, path=MODEL_PATH, version=None):
+    """Write an artifact load_model() can memory-map (uncompressed, arrays stored as .npy blocks)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    joblib.dump({'estimator': estimator, 'features': list(features), 'version': version}, path, compress=0)
+    return path
+
+def load_model(path=MODEL_PATH):
+    """Load the artifact once; its numpy arrays are memory-mapped read-only rather than copied."""
+    started = time.perf_counter()
+    artifact = joblib.load(path, mmap_mode='r')
+    model = LoadedModel(artifact['estimator'], artifact['features'], artifact.get('version') or artifact_version(path))
+    logger.info(f"Loaded model {model.version} ({len(model.features)} features) in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return model
+
+class PredictionService:
+    """Scores a whole slate once and serves it from memory.
+
+    Results are cached per (slate date, model version). An entry is dropped
+    when the pipeline invalidates odds, rosters or features after it was
+    computed (see database.cache_invalidation), and concurrent requests for
+    a slate that isn't cached yet wait for a single scoring run.
+    """
+
+    def __init__(self, model_path=MODEL_PATH, versions_path=CACHE_VERSIONS_PATH):
+        self.model_path = model_path
+        self.versions_path = versions_path
+        self.model = None
+        self._cache = {}  # (slate_date, model_version) -> (result, computed_at)
+        self._locks = {}
+        self._lock = threading.Lock()
+        self._versions = {}
+        self._versions_mtime = None
+
+    def load(self):
+        self.model = load_model(self.model_path)
+        return self.model
+
+    def _stale(self, computed_at):
+        # Re-read the invalidation file only when it changed; a hit stays a stat() and a dict lookup
+        try:
+            mtime = os.stat(self.versions_path).st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if mtime != self._versions_mtime:
+            self._versions_mtime, self._versions = mtime, read_versions(self.versions_path)
+        # A slate covers every team, so a per-team invalidation (fetch_roster writes those) counts too
+        return any(latest_invalidation(self._versions, namespace) >= computed_at for namespace in SLATE_NAMESPACES)
+
+    def _cached(self, key):
+        entry = self._cache.get(key)
+        if entry is None or self._stale(entry[1]):
+            return None
+        return entry[0]
+
+    def predictions(self, slate_date=None):
+        """Ranked predictions for a slate, computing them only on a cache miss."""
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+        slate_date = slate_date or date.today()
+        key = (slate_date.isoformat(), self.model.version)
+        result = self._cached(key)
+        if result is not None:
+            return dict(result, cached=True)
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            result = self._cached(key)  # another request may have scored it while we waited
+            if result is None:
+                computed_at = time.time()
+                result = self.score_slate(slate_date)
+                # Entries for a previous model can never be hit again
+                self._cache = {k: v for k, v in self._cache.items() if k[1] == self.model.version}
+                self._cache[key] = (result, computed_at)
+                return dict(result, cached=False)
+        return dict(result, cached=True)
+
+    def score_slate(self, slate_date):
+        """Every active player's features as of the slate date, scored in one batch."""
+        started = time.perf_counter()
+        features = features_as_of(slate_date)
+        features = features[features['days_since_last_game'] <= ACTIVE_DAYS].reset_index(drop=True)
+        probabilities = self.model.score(features) if len(features) else np.empty(0)
+        order = np.argsort(-probabilities, kind='stable')
+        columns = [column for column in ('player_id', 'player_name', 'team_id') if column in features]
+        predictions = features.loc[order, columns].assign(probability=probabilities[order].round(4))
+        elapsed = time.perf_counter() - started
+        logger.info(f"Scored {len(predictions)} players for {slate_date} with model {self.model.version} in {elapsed * 1000:.0f} ms")
+        return {
+            'slate_date': slate_date.isoformat(),
+            'model_version': self.model.version,
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'predictions': predictions.to_dict('records'),
+        }
+
+service = PredictionService()
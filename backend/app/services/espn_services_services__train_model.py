@@ -1,2 +1,22 @@
-def train_model():
-    return {'message': 'Model training placeholder'}
+import os
+import sys
+
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data_pipeline', 'model_training')))
+from app.config import MODEL_PATH
+from app.services.predict_model import save_model
+from feature_store import load_gamelogs, read_features, training_set
+
+def train_model(season=None, path=MODEL_PATH):
+    """Fit P(player gets a hit) on the feature store and write the artifact /predictions serves."""
+    games = load_gamelogs(season)
+    features = read_features(player_ids=games['player_id'].unique())
+    X, y = training_set(games, features, target='H')
+    X = X.fillna(0.0)
+    model = make_pipeline(StandardScaler(), LogisticRegression(max_iter=1000))
+    model.fit(X.to_numpy(), (y.fillna(0) > 0).astype(int).to_numpy())
+    save_model(model, X.columns, path)
+    return {'message': 'Model trained', 'rows': len(X), 'features': len(X.columns), 'path': path}
@@ -0,0 +1,201 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Node:
+    """One pipeline stage. `func` is called with its dependencies' results as keyword arguments."""
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    timeout: Optional[float] = None  # seconds per attempt
+    retries: int = 0
+    retry_delay: float = 1.0
+
+@dataclass
+class NodeResult:
+    name: str
+    status: str = "pending"  # ok, failed, timeout, skipped
+    value: Any = None
+    error: Optional[str] = None
+    attempts: int = 0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    @property
+    def seconds(self):
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+@dataclass
+class DagRun:
+    results: Dict[str, NodeResult] = field(default_factory=dict)
+    seconds: float = 0.0
+    critical_path: Tuple[str, ...] = ()
+
+    @property
+    def ok(self):
+        return all(result.status == "ok" for result in self.results.values())
+
+    def value(self, name):
+        return self.results[name].value
+
+    def failed(self):
+        return [name for name, result in self.results.items() if result.status != "ok"]
+
+class DAG:
+    """Runs pipeline stages as soon as their dependencies finish.
+
+    Independent stages run concurrently on a thread pool, so a refresh takes
+    as long as its slowest chain rather than the sum of every stage. A stage
+    that raises is retried up to `retries` times; if it still fails, or it
+    overruns its timeout, everything downstream of it is skipped while
+    unrelated stages carry on.
+
+        dag = DAG("pipeline")
+        dag.add("odds", fetch_odds)
+        dag.add("news", fetch_news)
+        dag.add("merge", lambda odds, news: merge(odds, news), deps=("odds", "news"))
+        run = dag.run()
+
+    A timed-out attempt can't be interrupted (it's a thread) and keeps
+    running with its result ignored, so a timeout is final rather than
+    retried: a second attempt would run alongside the first and repeat its
+    side effects (files, API quota).
+    """
+
+    def __init__(self, name="pipeline"):
+        self.name = name
+        self.nodes: Dict[str, Node] = {}
+
+    def add(self, name, func, deps=(), timeout=None, retries=0, retry_delay=1.0):
+        if name in self.nodes:
+            raise ValueError(f"Duplicate stage '{name}'")
+        for dep in deps:
+            if dep not in self.nodes:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+        self.nodes[name] = Node(name, func, tuple(deps), timeout, retries, retry_delay)
+        return self
+
+    def _ready(self, results):
+        return [
+            name for name, node in self.nodes.items()
+            if results[name].status == "pending" and results[name].attempts == 0
+            and all(results[dep].status == "ok" for dep in node.deps)
+        ]
+
+    def _skip_downstream(self, results):
+        changed = True
+        while changed:
+            changed = False
+            for name, node in self.nodes.items():
+                if results[name].status == "pending" and any(
+                    results[dep].status in ("failed", "timeout", "skipped") for dep in node.deps
+                ):
+                    results[name].status = "skipped"
+                    results[name].error = "upstream stage failed"
+                    changed = True
+
+    def run(self, max_workers=None):
+        """Run every stage; returns a DagRun with per-stage results, timings and the critical path."""
+        results = {name: NodeResult(name) for name in self.nodes}
+        started = time.perf_counter()
+        # Extra threads so an abandoned (timed-out) attempt doesn't starve the rest
+        executor = ThreadPoolExecutor(max_workers=max_workers or 2 * len(self.nodes) or 1,
+                                      thread_name_prefix=self.name)
+        running = {}  # future -> (name, deadline)
+        delayed = []  # (not_before, name) retries waiting for their delay
+
+        def submit(name):
+            node = self.nodes[name]
+            result = results[name]
+            result.attempts += 1
+            if result.started is None:
+                result.started = time.perf_counter()
+            kwargs = {dep: results[dep].value for dep in node.deps}
+            future = executor.submit(node.func, **kwargs)
+            deadline = time.perf_counter() + node.timeout if node.timeout else None
+            running[future] = (name, deadline)
+
+        def finish_attempt(name, status, value=None, error=None):
+            node = self.nodes[name]
+            result = results[name]
+            if status == "failed" and result.attempts <= node.retries:
+                logger.warning(f"[{self.name}] {name} attempt {result.attempts} {status}: {error}; retrying")
+                delayed.append((time.perf_counter() + node.retry_delay, name))
+                return
+            result.status, result.value, result.error = status, value, error
+            result.finished = time.perf_counter()
+            if status == "ok":
+                logger.info(f"[{self.name}] {name} ok in {result.seconds:.2f}s")
+            else:
+                logger.error(f"[{self.name}] {name} {status} after {result.attempts} attempt(s): {error}")
+                self._skip_downstream(results)
+
+        try:
+            for name in self._ready(results):
+                submit(name)
+            while running or delayed:
+                now = time.perf_counter()
+                for entry in [entry for entry in delayed if entry[0] <= now]:
+                    delayed.remove(entry)
+                    submit(entry[1])
+                deadlines = [deadline for _, deadline in running.values() if deadline is not None]
+                deadlines += [not_before for not_before, _ in delayed]
+                wait_for = max(0.0, min(deadlines) - time.perf_counter()) if deadlines else None
+                if not running:
+                    time.sleep(wait_for or 0)
+                    continue
+                done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name, _ = running.pop(future)
+                    try:
+                        finish_attempt(name, "ok", value=future.result())
+                    except Exception as e:
+                        finish_attempt(name, "failed", error=f"{type(e).__name__}: {e}")
+                now = time.perf_counter()
+                for future, (name, deadline) in list(running.items()):
+                    if deadline is not None and now >= deadline:
+                        running.pop(future)
+                        future.cancel()
+                        finish_attempt(name, "timeout", error=f"exceeded {self.nodes[name].timeout}s")
+                for name in self._ready(results):
+                    submit(name)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        run = DagRun(results, time.perf_counter() - started, self.critical_path(results))
+        self.report(run)
+        return run
+
+    def critical_path(self, results):
+        """Longest chain of stage durations through the graph (the floor on wall time)."""
+        best = {}
+        for name in self.nodes:  # insertion order is topological: deps must be added first
+            node = self.nodes[name]
+            parent = max(node.deps, key=lambda dep: best[dep][0], default=None)
+            base, path = best[parent] if parent else (0.0, ())
+            best[name] = (base + results[name].seconds, path + (name,))
+        return max(best.values(), key=lambda item: item[0], default=(0.0, ()))[1]
+
+    def report_lines(self, run):
+        """One timing line per stage plus wall time vs the serial sum."""
+        lines = [f"{self.name}: {len(run.results)} stages in {run.seconds:.2f}s"]
+        for name, result in run.results.items():
+            attempts = f", {result.attempts} attempts" if result.attempts > 1 else ""
+            lines.append(f"  {name}: {result.status} {result.seconds:.2f}s{attempts}")
+        serial = sum(result.seconds for result in run.results.values())
+        lines.append(f"  serial sum {serial:.2f}s, critical path {' -> '.join(run.critical_path)}")
+        return lines
+
+    def report(self, run):
+        """Log report_lines(run); run() does this once when it finishes."""
+        lines = self.report_lines(run)
+        logger.info("\n".join(lines))
+        return lines
@@ -1,17 +1,22 @@
-from supabase import create_client
 import os
-from dotenv import load_dotenv
+import sys
 
-load_dotenv()
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'fetch')))
+from database.supabase_client import get_client
+from supabase_writer import UpsertBuffer
 
 def store_mlb_odds():
-    supabase = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
+    supabase = get_client()
     odds = [
-        {"team_name": "Chicago Cubs", "opponent": "Milwaukee Brewers", "game_date": "2025-04-25", "moneyline_odds": -120, "spread": 1.5, "over_under": 7.5},
-        {"team_name": "New York Yankees", "opponent": "Boston Red Sox", "game_date": "2025-04-25", "moneyline_odds": -150, "spread": -1.5, "over_under": 8.0}
+        {"sport": "MLB", "event_id": "2025-04-25:milwaukee-brewers@chicago-cubs", "home_team": "Chicago Cubs",
+         "away_team": "Milwaukee Brewers", "home_odds": -120, "away_odds": None, "game_date": "2025-04-25"},
+        {"sport": "MLB", "event_id": "2025-04-25:boston-red-sox@new-york-yankees", "home_team": "New York Yankees",
+         "away_team": "Boston Red Sox", "home_odds": -150, "away_odds": None, "game_date": "2025-04-25"}
     ]
-    for game in odds:
-        supabase.table("odds_data").insert(game).execute()
+    # Upserted on odds_data's natural key in one request, so reruns overwrite instead of duplicating
+    with UpsertBuffer(supabase) as buffer:
+        buffer.add_many("odds_data", odds)
     return len(odds)
 
 if __name__ == "__main__":
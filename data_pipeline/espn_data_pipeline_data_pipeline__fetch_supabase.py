@@ -1,22 +1,41 @@
-from supabase import create_client
-from dotenv import load_dotenv
 import os
+import sys
 
-def fetch_supabase_data():
-    load_dotenv()
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fetch'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'storage'))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from database.supabase_client import get_client
+from supabase_reader import iter_rows
+from warehouse import get_warehouse
 
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_KEY")
+def fetch_supabase_data(columns=None, filters=None, stream=False, local=False):
+    """Read odds_data in keyset pages; pass stream=True to get a row generator instead of a list.
 
-    if not url or not key:
+    With local=True the rows come from the local warehouse, which is filled
+    from Supabase the first time it is empty.
+    """
+    if local:
+        warehouse = get_warehouse()
+        if not warehouse.count("odds_data"):
+            try:
+                warehouse.pull_from_supabase(get_client(), "odds_data")
+            except ValueError:
+                print("❌ Missing Supabase URL or Key.")
+                return None
+        rows = warehouse.select("odds_data", columns=columns, filters=filters, order_by="id")
+        return iter(rows) if stream else rows
+
+    try:
+        supabase = get_client()
+    except ValueError:
         print("❌ Missing Supabase URL or Key.")
         return None
 
-    supabase = create_client(url, key)
-
+    rows = iter_rows(supabase, "odds_data", columns=columns, filters=filters)
+    if stream:
+        return rows
     try:
-        response = supabase.table("odds_data").select("*").execute()
-        return response.data
+        return list(rows)
     except Exception as e:
         print("❌ Error fetching data from Supabase:", e)
-        return None
\ No newline at end of file
+        return None
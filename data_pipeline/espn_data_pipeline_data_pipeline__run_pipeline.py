@@ -1,27 +1,34 @@
+from dag import DAG
 from fetch_odds import fetch_odds
 from fetch_news import fetch_news
 from fetch_supabase import fetch_supabase_data
 from merge_data import merge_data
 from summarize import summarize_data
 
-def main():
-    print("🔄 Fetching betting odds...")
-    odds_data = fetch_odds()
-
-    print("📰 Fetching sports news...")
-    news_data = fetch_news()
+def build_pipeline():
+    """Odds, news and Supabase history are independent, so they are fetched concurrently."""
+    dag = DAG("run_pipeline")
+    dag.add("odds", fetch_odds, timeout=60, retries=1)
+    dag.add("news", fetch_news, timeout=60, retries=1)
+    dag.add("supabase", fetch_supabase_data, timeout=120, retries=1)
+    dag.add("merge", lambda odds, news, supabase: merge_data(odds, news, supabase), deps=("odds", "news", "supabase"))
+    dag.add("summary", lambda merge: summarize_data(merge), deps=("merge",), timeout=120)
+    return dag
 
-    print("📊 Fetching historical data from Supabase...")
-    supabase_data = fetch_supabase_data()
-
-    print("🔗 Merging data...")
-    merged_data = merge_data(odds_data, news_data, supabase_data)
+def main():
+    print("🔄 Fetching betting odds, sports news and historical data from Supabase...")
+    pipeline = build_pipeline()
+    run = pipeline.run()
+    # run() already logged the report; this only prints it
+    for line in pipeline.report_lines(run):
+        print(line)
 
-    print("🧠 Summarizing data with OpenAI...")
-    summary = summarize_data(merged_data)
+    if not run.ok:
+        print(f"❌ Pipeline stages failed: {', '.join(run.failed())}")
+        return
 
     print("✅ Summary ready:")
-    print(summary)
+    print(run.value("summary"))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,6 +1,8 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from dag import DAG
 from fetch_teamrankings import fetch_all_team_stats
 from fetch_odds_api import fetch_odds_data
 from fetch_espn_stats import fetch_all_player_stats
@@ -19,18 +21,24 @@ console_handler.setLevel(logging.DEBUG)
 console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logger.addHandler(console_handler)
 
+def build_refresh():
+    """The four MLB sources don't depend on each other, so they run side by side."""
+    dag = DAG("mlb_refresh")
+    dag.add("team_stats", fetch_all_team_stats, timeout=1800, retries=1)
+    dag.add("odds", fetch_odds_data, timeout=300, retries=2, retry_delay=5)
+    dag.add("player_stats", fetch_all_player_stats, timeout=3600, retries=1)
+    dag.add("player_splits", fetch_all_player_splits, timeout=3600, retries=1)
+    return dag
+
 def fetch_all_mlb_data():
-    """Fetches all MLB data."""
+    """Fetches all MLB data; one failed source no longer stops the others."""
     logger.info("Starting MLB data collection")
-    try:
-        fetch_all_team_stats()
-        fetch_odds_data()
-        fetch_all_player_stats()
-        fetch_all_player_splits()
-        logger.info("Completed MLB data collection")
-    except Exception as e:
-        logger.error(f"Error in data collection: {e}")
-        raise
+    run = build_refresh().run()
+    if not run.ok:
+        logger.error(f"Error in data collection: failed stages {', '.join(run.failed())}")
+        raise RuntimeError(f"MLB data collection failed: {', '.join(run.failed())}")
+    logger.info(f"Completed MLB data collection in {run.seconds:.1f}s")
+    return run
 
 if __name__ == "__main__":
     fetch_all_mlb_data()
\ No newline at end of file
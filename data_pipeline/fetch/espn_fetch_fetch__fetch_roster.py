@@ -1,9 +1,14 @@
 import requests
 from bs4 import BeautifulSoup
-from supabase import create_client
 import os
+import sys
 from dotenv import load_dotenv
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from database.cache_invalidation import invalidate
+from database.supabase_client import get_client
+from supabase_writer import UpsertBuffer
+
 load_dotenv()
 
 def fetch_mlb_roster(team_code, team_name):
@@ -23,9 +28,16 @@ def fetch_mlb_roster(team_code, team_name):
                     "position": cols[2].text.strip(),
                     "age": int(cols[5].text.strip()) if cols[5].text.strip() else None
                 })
-    supabase = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
-    for player in players:
-        supabase.table("roster_data").insert(player).execute()
+    supabase = get_client()
+    # Upsert first and only then drop players who left, so a failed write never empties the roster
+    if players:
+        with UpsertBuffer(supabase) as buffer:
+            buffer.add_many("roster_data", players)
+            if not buffer.flush():
+                raise RuntimeError(f"Failed to store the {team_name} roster")
+        current = [player["player_name"] for player in players]
+        supabase.table("roster_data").delete().eq("team_name", team_name).not_.in_("player_name", current).execute()
+        invalidate("roster", team_name)
     return len(players)
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
-from fetch_supabase import insert_player_splits
+from fetch_supabase import insert_player_splits, new_write_buffer
 import logging
 
 logging.basicConfig(
@@ -21,8 +21,8 @@ logger.addHandler(console_handler)
 
 PLAYERS = [{'id': '33192', 'name': 'Aaron Judge', 'team': 'New York Yankees'}]
 
-def fetch_espn_player_splits(player_id, player_name, team_name):
-    """Fetches player splits from ESPN."""
+def fetch_espn_player_splits(player_id, player_name, team_name, buffer=None):
+    """Fetches player splits from ESPN; rows are queued on `buffer` when given."""
     logger.info(f"Fetching splits for {player_name}")
     url = f"https://www.espn.com/mlb/player/splits/_/id/{player_id}"
     try:
@@ -85,21 +85,22 @@ def fetch_espn_player_splits(player_id, player_name, team_name):
         else:
             logger.warning(f"No splits table found for {player_name}")
 
-        result = insert_player_splits(splits_data)
+        result = insert_player_splits(splits_data, buffer=buffer)
         if result['success']:
-            logger.info(f"Inserted player splits for {player_name}: {splits_data}")
+            logger.info(f"{'Queued' if buffer else 'Upserted'} player splits for {player_name}: {splits_data}")
         else:
-            logger.error(f"Failed to insert player splits for {player_name}: {result['error']}")
+            logger.error(f"Failed to {'queue' if buffer else 'upsert'} player splits for {player_name}: {result['error']}")
         return splits_data
     except Exception as e:
         logger.error(f"Error fetching player splits for {player_name}: {e}")
         return None
 
 def fetch_all_player_splits():
-    """Fetches splits for all players."""
+    """Fetches splits for all players; raises if the batched upsert fails."""
     logger.info("Starting player splits collection")
-    for player in PLAYERS:
-        fetch_espn_player_splits(player['id'], player['name'], player['team'])
+    with new_write_buffer() as buffer:
+        for player in PLAYERS:
+            fetch_espn_player_splits(player['id'], player['name'], player['team'], buffer=buffer)
     logger.info("Completed player splits collection")
 
 if __name__ == "__main__":
@@ -4,9 +4,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
-from fetch_supabase import insert_player_stats
+from fetch_supabase import insert_player_stats, new_write_buffer
 from dotenv import load_dotenv
-from supabase import create_client
+from database import schema_registry
 import logging
 
 logging.basicConfig(
@@ -24,19 +24,11 @@ logger.addHandler(console_handler)
 PLAYERS = [{'id': '33192', 'name': 'Aaron Judge', 'team': 'New York Yankees'}]
 
 def validate_schema():
-    """Validate player_stats schema."""
-    logger.info("Validating player_stats schema")
-    try:
-        supabase = create_client(os.getenv('SUPABASE_URL'), os.getenv('SUPABASE_KEY'))
-        schema = supabase.table('player_stats').select('season,games,batting_avg').limit(1).execute()
-        logger.info("player_stats schema validated")
-        return True
-    except Exception as e:
-        logger.error(f"player_stats schema validation failed: {e}")
-        return False
+    """Validate player_stats schema (checked live at most once per TTL by the shared registry)."""
+    return schema_registry.validate_schema('player_stats', ('season', 'games', 'batting_avg'))
 
-def fetch_espn_player_stats(player_id, player_name, team_name):
-    """Fetches player stats from ESPN."""
+def fetch_espn_player_stats(player_id, player_name, team_name, buffer=None):
+    """Fetches player stats from ESPN; rows are queued on `buffer` when given."""
     logger.info(f"Fetching stats for {player_name}")
     if not validate_schema():
         logger.error("Skipping fetch due to schema validation failure")
@@ -104,21 +96,22 @@ def fetch_espn_player_stats(player_id, player_name, team_name):
         else:
             logger.warning(f"No stats table found for {player_name}")
 
-        result = insert_player_stats(stats)
+        result = insert_player_stats(stats, buffer=buffer)
         if result['success']:
-            logger.info(f"Inserted player stats for {player_name}: {stats}")
+            logger.info(f"{'Queued' if buffer else 'Upserted'} player stats for {player_name}: {stats}")
         else:
-            logger.error(f"Failed to insert player stats for {player_name}: {result['error']}")
+            logger.error(f"Failed to {'queue' if buffer else 'upsert'} player stats for {player_name}: {result['error']}")
         return stats
     except Exception as e:
         logger.error(f"Error fetching player stats for {player_name}: {e}")
         return None
 
 def fetch_all_player_stats():
-    """Fetches stats for all players."""
+    """Fetches stats for all players; raises if the batched upsert fails."""
     logger.info("Starting player stats collection")
-    for player in PLAYERS:
-        fetch_espn_player_stats(player['id'], player['name'], player['team'])
+    with new_write_buffer() as buffer:
+        for player in PLAYERS:
+            fetch_espn_player_stats(player['id'], player['name'], player['team'], buffer=buffer)
     logger.info("Completed player stats collection")
 
 if __name__ == "__main__":
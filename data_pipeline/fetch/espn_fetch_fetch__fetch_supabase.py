@@ -1,32 +1,20 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from supabase import create_client, Client
-from dotenv import load_dotenv
+from database.supabase_client import LazyClient
 import logging
 from datetime import datetime
+from supabase_writer import NATURAL_KEYS, DEFAULT_CHUNK_SIZE, UpsertBuffer
+from supabase_reader import DEFAULT_PAGE_SIZE, iter_frames, iter_rows
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'storage')))
+from snapshot_store import ENTITY_KEYS, get_snapshot_store
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, filename='data_pipeline/pipeline.log', format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-
-# Validate environment variables
-if not SUPABASE_URL or not SUPABASE_KEY:
-    logger.error("SUPABASE_URL or SUPABASE_KEY not set in .env file")
-    raise ValueError("Missing SUPABASE_URL or SUPABASE_KEY")
-
-# Initialize Supabase client
-try:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-    logger.info("Successfully connected to Supabase")
-except Exception as e:
-    logger.error(f"Failed to initialize Supabase client: {e}")
-    raise
+# Shared Supabase client, created on first use
+supabase = LazyClient("anon")
 
 def execute_sql_file(file_path):
     """
@@ -50,77 +38,87 @@ def execute_sql_file(file_path):
         logger.error(f"Error executing SQL file {file_path}: {e}")
         raise
 
-def insert_team_stats(data):
+def record_snapshots(table, rows):
+    """Keep every version written to Supabase in the local point-in-time store; the upsert overwrites it."""
+    if table in ENTITY_KEYS:
+        get_snapshot_store().record(table, rows)
+
+def new_write_buffer(chunk_size=DEFAULT_CHUNK_SIZE):
+    """Create a batched upsert buffer on this module's Supabase client."""
+    return UpsertBuffer(supabase, chunk_size=chunk_size, on_flush=record_snapshots)
+
+def upsert_row(table, data, buffer=None):
+    """Upsert one row on the table's natural key, or queue it on a write buffer."""
+    if buffer is not None:
+        buffer.add(table, data)
+    else:
+        supabase.table(table).upsert(data, on_conflict=','.join(NATURAL_KEYS[table])).execute()
+        record_snapshots(table, [data])
+
+def insert_team_stats(data, buffer=None):
     try:
-        supabase.table('team_stats').insert(data).execute()
-        logger.info(f"Inserted team stats for {data['team_name']}")
+        upsert_row('team_stats', data, buffer)
+        logger.info(f"{'Queued' if buffer else 'Upserted'} team stats for {data['team_name']}")
         return {"success": True, "data": data}
     except Exception as e:
         logger.error(f"Error inserting team stats: {e}")
         return {"success": False, "error": str(e)}
 
-def insert_odds_data(data):
+def insert_odds_data(data, buffer=None):
     try:
-        supabase.table('odds_data').insert(data).execute()
-        logger.info(f"Inserted odds data: {data['home_team']} vs {data['away_team']}")
+        upsert_row('odds_data', data, buffer)
+        logger.info(f"{'Queued' if buffer else 'Upserted'} odds data: {data['home_team']} vs {data['away_team']}")
         return {"success": True, "data": data}
     except Exception as e:
         logger.error(f"Error inserting odds data: {e}")
         return {"success": False, "error": str(e)}
 
-def insert_player_stats(data):
+def insert_player_stats(data, buffer=None):
     try:
-        supabase.table('player_stats').insert(data).execute()
-        logger.info(f"Inserted player stats for {data['player_name']}")
+        upsert_row('player_stats', data, buffer)
+        logger.info(f"{'Queued' if buffer else 'Upserted'} player stats for {data['player_name']}")
         return {"success": True, "data": data}
     except Exception as e:
         logger.error(f"Error inserting player stats: {e}")
         return {"success": False, "error": str(e)}
 
-def insert_player_splits(data):
+def insert_player_splits(data, buffer=None):
     try:
-        supabase.table('player_splits').insert(data).execute()
-        logger.info(f"Inserted player splits for {data['player_name']} - {data['split_type']}")
+        upsert_row('player_splits', data, buffer)
+        logger.info(f"{'Queued' if buffer else 'Upserted'} player splits for {data['player_name']} - {data['split_type']}")
         return {"success": True, "data": data}
     except Exception as e:
         logger.error(f"Error inserting player splits: {e}")
         return {"success": False, "error": str(e)}
 
-def fetch_team_stats():
-    try:
-        data = supabase.table('team_stats').select('*').execute().data
-        logger.info(f"Fetched {len(data)} team stats rows")
-        return data
-    except Exception as e:
-        logger.error(f"Error fetching team stats: {e}")
-        return []
+def stream_rows(table, columns=None, filters=None, page_size=DEFAULT_PAGE_SIZE):
+    """Yield rows from a table page by page; see supabase_reader.apply_filters for filters."""
+    return iter_rows(supabase, table, columns, filters, page_size)
 
-def fetch_odds_data():
-    try:
-        data = supabase.table('odds_data').select('*').execute().data
-        logger.info(f"Fetched {len(data)} odds data rows")
-        return data
-    except Exception as e:
-        logger.error(f"Error fetching odds data: {e}")
-        return []
+def stream_frames(table, columns=None, filters=None, page_size=DEFAULT_PAGE_SIZE):
+    """Yield a table as DataFrame chunks of at most page_size rows."""
+    return iter_frames(supabase, table, columns, filters, page_size)
 
-def fetch_player_stats():
+def fetch_rows(table, label, columns=None, filters=None):
     try:
-        data = supabase.table('player_stats').select('*').execute().data
-        logger.info(f"Fetched {len(data)} player stats rows")
+        data = list(stream_rows(table, columns, filters))
+        logger.info(f"Fetched {len(data)} {label} rows")
         return data
     except Exception as e:
-        logger.error(f"Error fetching player stats: {e}")
+        logger.error(f"Error fetching {label}: {e}")
         return []
 
-def fetch_player_splits():
-    try:
-        data = supabase.table('player_splits').select('*').execute().data
-        logger.info(f"Fetched {len(data)} player splits rows")
-        return data
-    except Exception as e:
-        logger.error(f"Error fetching player splits: {e}")
-        return []
+def fetch_team_stats(columns=None, filters=None):
+    return fetch_rows('team_stats', 'team stats', columns, filters)
+
+def fetch_odds_data(columns=None, filters=None):
+    return fetch_rows('odds_data', 'odds data', columns, filters)
+
+def fetch_player_stats(columns=None, filters=None):
+    return fetch_rows('player_stats', 'player stats', columns, filters)
+
+def fetch_player_splits(columns=None, filters=None):
+    return fetch_rows('player_splits', 'player splits', columns, filters)
 
 # Sample data for testing, aligned with updated schemas
 today = datetime.now().strftime('%Y-%m-%d')
@@ -154,6 +152,7 @@ team_stats_data = {
 
 odds_data = {
     'sport': 'MLB',
+    'event_id': 'test-event',
     'home_team': 'Testers',
     'away_team': 'Mockers',
     'home_odds': -120,
@@ -4,9 +4,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
-from fetch_supabase import insert_team_stats
-from dotenv import load_dotenv
-from supabase import create_client
+from fetch_supabase import insert_team_stats, new_write_buffer
+from database import schema_registry
 import logging
 
 logging.basicConfig(
@@ -24,20 +23,11 @@ logger.addHandler(console_handler)
 MLB_TEAMS = ['chicago-cubs']
 
 def validate_schema():
-    """Validate team_stats schema."""
-    logger.info("Validating team_stats schema")
-    load_dotenv()
-    try:
-        supabase = create_client(os.getenv('SUPABASE_URL'), os.getenv('SUPABASE_KEY'))
-        schema = supabase.table('team_stats').select('season,games,batting_avg').limit(1).execute()
-        logger.info("team_stats schema validated")
-        return True
-    except Exception as e:
-        logger.error(f"team_stats schema validation failed: {e}")
-        return False
+    """Validate team_stats schema (checked live at most once per TTL by the shared registry)."""
+    return schema_registry.validate_schema('team_stats', ('season', 'games', 'batting_avg'))
 
-def fetch_teamrankings_team_stats(team_slug):
-    """Fetches team stats from TeamRankings."""
+def fetch_teamrankings_team_stats(team_slug, buffer=None):
+    """Fetches team stats from TeamRankings; rows are queued on `buffer` when given."""
     logger.info(f"Fetching stats for {team_slug}")
     if not validate_schema():
         logger.error("Skipping fetch due to schema validation failure")
@@ -97,21 +87,22 @@ def fetch_teamrankings_team_stats(team_slug):
         else:
             logger.warning(f"No stats table found for {team_slug}")
 
-        result = insert_team_stats(stats)
+        result = insert_team_stats(stats, buffer=buffer)
         if result['success']:
-            logger.info(f"Inserted team stats for {team_slug}: {stats}")
+            logger.info(f"{'Queued' if buffer else 'Upserted'} team stats for {team_slug}: {stats}")
         else:
-            logger.error(f"Failed to insert team stats for {team_slug}: {result['error']}")
+            logger.error(f"Failed to {'queue' if buffer else 'upsert'} team stats for {team_slug}: {result['error']}")
         return stats
     except Exception as e:
         logger.error(f"Error fetching team stats for {team_slug}: {e}")
         return None
 
 def fetch_all_team_stats():
-    """Fetches stats for all MLB teams."""
+    """Fetches stats for all MLB teams; raises if the batched upsert fails."""
     logger.info("Starting team stats collection")
-    for team in MLB_TEAMS:
-        fetch_teamrankings_team_stats(team)
+    with new_write_buffer() as buffer:
+        for team in MLB_TEAMS:
+            fetch_teamrankings_team_stats(team, buffer=buffer)
     logger.info("Completed team stats collection")
 
 if __name__ == "__main__":
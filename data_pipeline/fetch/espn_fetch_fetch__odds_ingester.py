@@ -0,0 +1,202 @@
+import logging
+import os
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import requests
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from database.cache_invalidation import invalidate
+from supabase_reader import iter_rows
+from supabase_writer import UpsertBuffer
+
+logger = logging.getLogger(__name__)
+
+ODDS_URL = "https://api.the-odds-api.com/v4/sports/{sport_key}/odds/"
+MARKETS = ('h2h', 'spreads', 'totals')
+PRICE_COLUMNS = ('home_price', 'away_price', 'home_point', 'away_point', 'over_price', 'under_price', 'total_point')
+GAME_DAY_TZ = ZoneInfo('America/New_York')  # MLB slates are dated in Eastern time
+
+def parse_time(value):
+    """The Odds API's ISO-8601 'Z' timestamps as aware datetimes."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')) if value else None
+
+def game_date(commence_time):
+    """Local slate date of a game; a 7pm PT start is already the next day in UTC."""
+    return parse_time(commence_time).astimezone(GAME_DAY_TZ).strftime('%Y-%m-%d')
+
+def market_prices(market, home_team, away_team):
+    """Compact price columns for one bookmaker market."""
+    prices = {}
+    for outcome in market.get('outcomes', []):
+        name, price, point = outcome.get('name'), outcome.get('price'), outcome.get('point')
+        if market['key'] == 'totals':
+            side = 'over' if name == 'Over' else 'under' if name == 'Under' else None
+            if side:
+                prices[f'{side}_price'] = price
+                prices['total_point'] = point
+        else:
+            side = 'home' if name == home_team else 'away' if name == away_team else None
+            if side:
+                prices[f'{side}_price'] = price
+                if market['key'] == 'spreads':
+                    prices[f'{side}_point'] = point
+    return prices
+
+def snapshot_rows(games, captured_at, sport='MLB'):
+    """Flatten an odds response into one row per (event, bookmaker, market)."""
+    captured = captured_at.isoformat()
+    rows = []
+    for game in games:
+        home_team, away_team = game.get('home_team'), game.get('away_team')
+        for bookmaker in game.get('bookmakers', []):
+            for market in bookmaker.get('markets', []):
+                prices = market_prices(market, home_team, away_team)
+                if not prices:
+                    continue
+                rows.append({
+                    'sport': sport,
+                    'event_id': game['id'],
+                    'commence_time': game['commence_time'],
+                    'home_team': home_team,
+                    'away_team': away_team,
+                    'bookmaker': bookmaker['key'],
+                    'market': market['key'],
+                    **{column: prices.get(column) for column in PRICE_COLUMNS},
+                    'last_update': market.get('last_update') or bookmaker.get('last_update'),
+                    'captured_at': captured,
+                })
+    return rows
+
+def snapshot_key(row):
+    return (row['event_id'], row['bookmaker'], row['market'])
+
+def price_signature(row):
+    # Supabase hands NUMERIC back as strings/floats; compare as floats so -1.5 == '-1.5'
+    return tuple(None if row.get(column) is None else float(row[column]) for column in PRICE_COLUMNS)
+
+def legacy_odds_rows(games, sport='MLB'):
+    """odds_data rows (first book's moneyline per game), dated by first pitch rather than by the fetch.
+
+    Rows are keyed on the event id, so both games of a doubleheader keep their own row.
+    """
+    rows = []
+    for game in games:
+        for bookmaker in game.get('bookmakers', []):
+            h2h = next((m for m in bookmaker.get('markets', []) if m['key'] == 'h2h'), None)
+            prices = market_prices(h2h, game['home_team'], game['away_team']) if h2h else {}
+            if prices.get('home_price') is not None and prices.get('away_price') is not None:
+                rows.append({
+                    'sport': sport,
+                    'event_id': game['id'],
+                    'home_team': game['home_team'],
+                    'away_team': game['away_team'],
+                    'home_odds': int(prices['home_price']),
+                    'away_odds': int(prices['away_price']),
+                    'game_date': game_date(game['commence_time']),
+                })
+                break
+    return rows
+
+class OddsIngester:
+    """Polls every bookmaker's h2h, spreads and totals in one API request and keeps line movement.
+
+    Each poll writes a snapshot row only for (event, bookmaker, market)
+    combinations whose prices differ from the last stored snapshot, so polling
+    often costs one request per poll and storage grows only with actual moves.
+    The last snapshot per combination is held in memory, seeded on first use
+    from Supabase for games that haven't started yet:
+
+        ingester = OddsIngester(supabase, api_key)
+        ingester.poll()
+    """
+
+    def __init__(self, client, api_key, sport_key='baseball_mlb', sport='MLB', regions='us', markets=MARKETS,
+                 on_flush=None):
+        self.client = client
+        self.on_flush = on_flush
+        self.api_key = api_key
+        self.sport_key = sport_key
+        self.sport = sport
+        self.regions = regions
+        self.markets = tuple(markets)
+        self.last = None  # snapshot_key -> price_signature
+        self._lock = threading.Lock()
+
+    def fetch(self):
+        """One request for every bookmaker and market; returns the list of games."""
+        response = requests.get(
+            ODDS_URL.format(sport_key=self.sport_key),
+            params={
+                'apiKey': self.api_key,
+                'regions': self.regions,
+                'markets': ','.join(self.markets),
+                'oddsFormat': 'american',
+                'dateFormat': 'iso',
+            },
+            timeout=10,
+        )
+        response.raise_for_status()
+        logger.info(
+            f"The Odds API: {len(self.markets)} markets in 1 request "
+            f"(quota used {response.headers.get('x-requests-used')}, remaining {response.headers.get('x-requests-remaining')})"
+        )
+        return response.json()
+
+    def load_last(self, since=None):
+        """Latest stored prices per (event, bookmaker, market) for games starting after `since`."""
+        since = since or datetime.now(timezone.utc) - timedelta(hours=6)
+        last = {}
+        # Rows stream in id order, so each later snapshot overwrites the earlier one
+        for row in iter_rows(self.client, 'odds_snapshots',
+                             columns=['event_id', 'bookmaker', 'market', *PRICE_COLUMNS],
+                             filters={'sport': self.sport, 'commence_time': ('gte', since.isoformat())}):
+            last[snapshot_key(row)] = price_signature(row)
+        logger.info(f"Seeded {len(last)} last odds snapshots")
+        return last
+
+    def changed(self, rows):
+        """Rows whose prices differ from the last snapshot of the same (event, bookmaker, market)."""
+        with self._lock:
+            if self.last is None:
+                self.last = self.load_last()
+            return [row for row in rows if self.last.get(snapshot_key(row)) != price_signature(row)]
+
+    def remember(self, rows):
+        with self._lock:
+            for row in rows:
+                self.last[snapshot_key(row)] = price_signature(row)
+
+    def prune(self, event_ids):
+        """Forget events that are no longer on the board (started or cancelled)."""
+        live = set(event_ids)
+        with self._lock:
+            self.last = {key: value for key, value in self.last.items() if key[0] in live}
+
+    def poll(self, games=None, captured_at=None):
+        """Fetch (unless `games` is given), write changed snapshots and the legacy odds_data rows.
+
+        Returns {'games', 'snapshots', 'changed', 'written'}; `written` is 0 if the snapshot upsert
+        failed, in which case the same rows are retried on the next poll. The two tables are
+        flushed separately, so a failed odds_data upsert doesn't resend snapshots already stored.
+        """
+        games = self.fetch() if games is None else games
+        captured_at = captured_at or datetime.now(timezone.utc).replace(microsecond=0)
+        rows = snapshot_rows(games, captured_at, self.sport)
+        changed = self.changed(rows)
+
+        with UpsertBuffer(self.client, on_flush=self.on_flush) as buffer:
+            buffer.add_many('odds_snapshots', changed)
+            ok = buffer.flush('odds_snapshots')
+            buffer.add_many('odds_data', legacy_odds_rows(games, self.sport))
+            if not buffer.flush('odds_data'):
+                logger.warning("odds_data upsert failed; it is rewritten in full on the next poll")
+        if ok:
+            self.remember(changed)
+            self.prune(game['id'] for game in games)
+            if changed:
+                invalidate('odds')  # bot caches re-read on their next request
+        logger.info(f"Odds poll: {len(games)} games, {len(rows)} book/market lines, {len(changed)} changed")
+        return {'games': len(games), 'snapshots': len(rows), 'changed': len(changed), 'written': len(changed) if ok else 0}
@@ -0,0 +1,67 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 1000
+KEY_COLUMN = 'id'
+
+def apply_filters(query, filters):
+    """Apply filters to a Supabase query.
+
+    `filters` maps column -> value for equality, or column -> (operator, value)
+    for any PostgREST operator the client exposes (gte, lt, in_, ilike, ...).
+    """
+    for column, condition in (filters or {}).items():
+        if isinstance(condition, tuple):
+            operator, value = condition
+            query = getattr(query, operator)(column, value)
+        else:
+            query = query.eq(column, condition)
+    return query
+
+def iter_pages(client, table, columns=None, filters=None, page_size=DEFAULT_PAGE_SIZE):
+    """Yield a table as lists of at most `page_size` rows, keyset-paged on id.
+
+    Each page asks for rows with id greater than the last one seen, so deep
+    pages cost the same as the first and rows inserted mid-read aren't
+    skipped or repeated the way offset paging would. The read ends on the
+    first empty page.
+    """
+    projection = list(columns) if columns else ['*']
+    strip_key = columns is not None and KEY_COLUMN not in projection
+    if strip_key:
+        projection.append(KEY_COLUMN)
+    select = ','.join(projection)
+
+    last_id = None
+    pages = rows = 0
+    while True:
+        query = apply_filters(client.table(table).select(select), filters)
+        if last_id is not None:
+            query = query.gt(KEY_COLUMN, last_id)
+        page = query.order(KEY_COLUMN).range(0, page_size - 1).execute().data
+        if not page:
+            break
+        last_id = page[-1][KEY_COLUMN]
+        pages += 1
+        rows += len(page)
+        if strip_key:
+            for row in page:
+                del row[KEY_COLUMN]
+        # A short page isn't the end: PostgREST caps pages at its max-rows setting
+        # whatever page_size asks for, so only an empty page means we're done
+        yield page
+    logger.info(f"Streamed {rows} {table} rows in {pages} pages")
+
+def iter_rows(client, table, columns=None, filters=None, page_size=DEFAULT_PAGE_SIZE):
+    """Yield a table row by row while holding at most one page in memory."""
+    for page in iter_pages(client, table, columns, filters, page_size):
+        yield from page
+
+def iter_frames(client, table, columns=None, filters=None, page_size=DEFAULT_PAGE_SIZE):
+    """Yield a table as pandas DataFrame chunks of at most `page_size` rows."""
+    # Imported here so the write-side fetch scripts don't pay for pandas
+    import pandas as pd
+
+    for page in iter_pages(client, table, columns, filters, page_size):
+        yield pd.DataFrame.from_records(page, columns=columns)
@@ -0,0 +1,130 @@
+import logging
+import time
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+# Natural keys per table; must match the UNIQUE constraints in
+# sql/migrations/007_add_natural_key_constraints.sql (NULLs compare equal since 011;
+# 008 for odds_snapshots, 009 for roster_data, 010 for odds_data)
+NATURAL_KEYS = {
+    'team_stats': ('sport', 'team_name', 'stat_type', 'season', 'stat_date'),
+    'player_stats': ('sport', 'player_name', 'team_name', 'stat_type', 'season', 'stat_date'),
+    'player_splits': ('sport', 'player_name', 'split_type', 'split_value', 'season', 'stat_date'),
+    'odds_data': ('sport', 'event_id'),
+    'odds_snapshots': ('event_id', 'bookmaker', 'market', 'captured_at'),
+    'roster_data': ('team_name', 'player_name'),
+}
+
+DEFAULT_CHUNK_SIZE = 500
+
+def natural_key(table, row):
+    """Tuple of the row's natural-key values for a table."""
+    return tuple(row.get(column) for column in NATURAL_KEYS[table])
+
+class UpsertBuffer:
+    """Collects rows per table and writes them as chunked upserts on natural keys.
+
+    Rows with the same natural key are merged in the buffer (last one wins), so
+    a chunk never hits the same constraint twice and reruns overwrite instead
+    of duplicating. `on_flush(table, rows)`, if given, is called with every
+    chunk that was written (e.g. to record snapshots). Use as a context
+    manager to flush on exit:
+
+        with UpsertBuffer(supabase) as buffer:
+            buffer.add('player_stats', row)
+
+    flush() reports failed chunks through its return value. Failures no
+    flush() call has reported (a full chunk written by add(), or the flush
+    on exit) make the block raise, so a failed write can't pass for success.
+    """
+
+    def __init__(self, client, chunk_size=DEFAULT_CHUNK_SIZE, natural_keys=None, on_flush=None):
+        self.client = client
+        self.chunk_size = chunk_size
+        self.natural_keys = natural_keys or NATURAL_KEYS
+        self.on_flush = on_flush
+        self.pending = defaultdict(dict)
+        self.unreported_failures = set()  # tables whose failed chunks no caller has seen
+        self.stats = defaultdict(lambda: {'rows': 0, 'requests': 0, 'failed_rows': 0, 'seconds': 0.0})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.unreported_failures |= self._flush_tables(list(self.pending))
+        self.report()
+        if exc_type is None and self.unreported_failures:
+            raise RuntimeError(f"Failed to upsert rows into {', '.join(sorted(self.unreported_failures))}")
+
+    def add(self, table, row):
+        """Buffer one row; flushes the table once a full chunk is waiting."""
+        if table not in self.natural_keys:
+            raise ValueError(f"No natural key configured for table '{table}'")
+        key = tuple(row.get(column) for column in self.natural_keys[table])
+        self.pending[table][key] = row
+        if len(self.pending[table]) >= self.chunk_size:
+            self.unreported_failures |= self._flush_tables([table])
+
+    def add_many(self, table, rows):
+        """Buffer several rows for one table."""
+        for row in rows:
+            self.add(table, row)
+
+    def flush(self, table=None):
+        """Upsert everything buffered (for one table, or all).
+
+        Returns False if any chunk of those tables failed since they were last
+        flushed, including chunks add() wrote on its own.
+        """
+        tables = [table] if table else list(self.pending)
+        reported = {table} if table else set(self.unreported_failures)
+        failed = self._flush_tables(tables) | (self.unreported_failures & reported)
+        self.unreported_failures -= reported
+        return not failed
+
+    def _flush_tables(self, tables):
+        """Upsert the buffered rows of `tables`; returns the set of tables with a failed chunk."""
+        failed = set()
+        for name in tables:
+            rows = list(self.pending.pop(name, {}).values())
+            on_conflict = ','.join(self.natural_keys[name])
+            for start in range(0, len(rows), self.chunk_size):
+                if not self._write_chunk(name, rows[start:start + self.chunk_size], on_conflict):
+                    failed.add(name)
+        return failed
+
+    def _write_chunk(self, table, chunk, on_conflict):
+        """Send one upsert request and record its latency."""
+        stats = self.stats[table]
+        started = time.perf_counter()
+        try:
+            self.client.table(table).upsert(chunk, on_conflict=on_conflict).execute()
+        except Exception as e:
+            stats['failed_rows'] += len(chunk)
+            logger.error(f"Failed to upsert {len(chunk)} rows into {table}: {e}")
+            return False
+        elapsed = time.perf_counter() - started
+        stats['rows'] += len(chunk)
+        stats['requests'] += 1
+        stats['seconds'] += elapsed
+        logger.info(f"Upserted {len(chunk)} rows into {table} in {elapsed * 1000:.0f} ms ({len(chunk) / max(elapsed, 1e-9):.0f} rows/s)")
+        if self.on_flush is not None:
+            try:
+                self.on_flush(table, chunk)
+            except Exception as e:
+                # The upsert already succeeded; a failed side write shouldn't turn it into a failure
+                logger.error(f"on_flush failed for {len(chunk)} {table} rows: {e}")
+        return True
+
+    def report(self):
+        """Log and return per-table totals: rows, requests, failed rows, rows per second."""
+        summary = {}
+        for table, stats in self.stats.items():
+            rows_per_second = stats['rows'] / stats['seconds'] if stats['seconds'] else 0.0
+            summary[table] = dict(stats, rows_per_second=rows_per_second)
+            logger.info(
+                f"{table}: {stats['rows']} rows in {stats['requests']} requests "
+                f"({rows_per_second:.0f} rows/s, {stats['failed_rows']} failed)"
+            )
+        return summary
@@ -0,0 +1,293 @@
+import itertools
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'storage')))
+from parquet_store import game_log_scores, game_logs
+from storage_config import PARQUET_ROOT
+
+logger = logging.getLogger(__name__)
+
+TRENDS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'sports_scripts', 'teamrankings', 'MLB', 'trends'))
+GAME_DAY_TZ = 'America/New_York'
+# TeamRankings slugs whose Odds API name isn't just the title-cased slug
+TEAM_NAMES = {'st-louis-cardinals': 'St. Louis Cardinals'}
+CANDIDATE_COLUMNS = ['game_date', 'game_id', 'side', 'team', 'price_open', 'price_close', 'fair_open', 'won', 'push']
+REPLAY_PARAMS = ('min_edge', 'kelly_fraction', 'max_fraction', 'max_exposure', 'bankroll')
+DEFAULT_GRID = {
+    'shrink': [0.0, 0.5, 1.0],
+    'min_edge': [0.0, 0.02, 0.04, 0.06],
+    'kelly_fraction': [0.1, 0.25, 0.5],
+    'max_fraction': [0.02, 0.05],
+}
+
+def american_to_decimal(odds):
+    """American odds (-150, +130) as decimal odds (1.667, 2.30); vectorized."""
+    odds = np.asarray(odds, dtype=np.float64)
+    return np.where(odds > 0, 1 + odds / 100, 1 + 100 / np.abs(odds))
+
+def team_name(slug):
+    return TEAM_NAMES.get(slug, slug.replace('-', ' ').title())
+
+def load_results(trends_dir=TRENDS_DIR, root=PARQUET_ROOT):
+    """Final scores per game from each team's TeamRankings game log, seen from the home side.
+
+    Only home rows are used, so every game appears once with the home team's
+    full name; the log's dates carry no year, which comes from the scrape date.
+    """
+    frames = []
+    for team, df, scraped_at in game_logs(trends_dir, root):
+        if not {'Date', 'H/A/N', 'Score'} <= set(df.columns):
+            logger.warning(f"Skipping {team}: not a game log table")
+            continue
+        df = df[df['H/A/N'] == 'Home']
+        home_score, away_score = game_log_scores(df)
+        frames.append(pd.DataFrame({
+            'game_date': pd.to_datetime(df['Date'].astype(str) + f"/{scraped_at.year}", format='%m/%d/%Y', errors='coerce'),
+            'home_team': team_name(team),
+            'home_score': home_score,
+            'away_score': away_score,
+        }).dropna())
+    if not frames:
+        return pd.DataFrame(columns=['game_date', 'home_team', 'home_score', 'away_score'])
+    results = pd.concat(frames, ignore_index=True)
+    # A doubleheader can't be matched to its odds by (home team, date) alone
+    return results.drop_duplicates(['home_team', 'game_date'], keep=False).reset_index(drop=True)
+
+def odds_from_snapshots(rows):
+    """Opening and closing moneyline per game from odds_snapshots rows, averaged across books.
+
+    The close is each book's last snapshot captured before first pitch.
+    """
+    snapshots = pd.DataFrame(list(rows))
+    snapshots = snapshots[(snapshots['market'] == 'h2h')].dropna(subset=['home_price', 'away_price'])
+    commence = pd.to_datetime(snapshots['commence_time'], utc=True)
+    captured = pd.to_datetime(snapshots['captured_at'], utc=True)
+    snapshots = snapshots.assign(commence=commence, captured=captured,
+                                 home_dec=american_to_decimal(snapshots['home_price']),
+                                 away_dec=american_to_decimal(snapshots['away_price']))
+    snapshots = snapshots[snapshots['captured'] <= snapshots['commence']].sort_values('captured')
+    per_book = snapshots.groupby(['event_id', 'bookmaker'])
+    opening = per_book.first()
+    closing = per_book.last()
+    books = opening[['home_team', 'away_team', 'commence']].assign(
+        home_open=opening['home_dec'], away_open=opening['away_dec'],
+        home_close=closing['home_dec'], away_close=closing['away_dec'],
+    )
+    odds = books.groupby(level='event_id').agg(
+        home_team=('home_team', 'first'), away_team=('away_team', 'first'), commence=('commence', 'first'),
+        home_open=('home_open', 'mean'), away_open=('away_open', 'mean'),
+        home_close=('home_close', 'mean'), away_close=('away_close', 'mean'),
+    ).reset_index()
+    odds['game_date'] = odds['commence'].dt.tz_convert(GAME_DAY_TZ).dt.tz_localize(None).dt.normalize()
+    return odds.drop(columns='commence')
+
+def odds_from_odds_data(rows):
+    """One moneyline per game from odds_data; there is no line history, so no closing price."""
+    odds = pd.DataFrame(list(rows)).dropna(subset=['home_odds', 'away_odds'])
+    return pd.DataFrame({
+        'event_id': odds['home_team'] + '@' + odds['game_date'].astype(str),
+        'home_team': odds['home_team'],
+        'away_team': odds['away_team'],
+        'game_date': pd.to_datetime(odds['game_date']),
+        'home_open': american_to_decimal(odds['home_odds']),
+        'away_open': american_to_decimal(odds['away_odds']),
+        'home_close': np.nan,
+        'away_close': np.nan,
+    })
+
+def build_candidates(odds, results):
+    """Two candidate bets (home and away moneyline) per game that has both odds and a final score."""
+    games = odds.drop_duplicates(['home_team', 'game_date'], keep=False).merge(results, on=['home_team', 'game_date'])
+    # No-vig opening probabilities: normalize the two implied probabilities to sum to one
+    home_implied, away_implied = 1 / games['home_open'], 1 / games['away_open']
+    overround = home_implied + away_implied
+    home_won = (games['home_score'] > games['away_score']).astype(np.int8)
+    tie = (games['home_score'] == games['away_score'])
+    sides = []
+    for side, won, implied in (('home', home_won, home_implied), ('away', 1 - home_won, away_implied)):
+        sides.append(pd.DataFrame({
+            'game_date': games['game_date'], 'game_id': games['event_id'], 'side': side,
+            'team': games[f'{side}_team'],
+            'price_open': games[f'{side}_open'], 'price_close': games[f'{side}_close'],
+            'fair_open': implied / overround, 'won': won.where(~tie, 0), 'push': tie,
+        }))
+    candidates = pd.concat(sides, ignore_index=True)
+    return candidates.sort_values(['game_date', 'game_id', 'side'], kind='mergesort').reset_index(drop=True)[CANDIDATE_COLUMNS]
+
+def prepare(candidates):
+    """Arrays the replay needs, computed once and shared by every strategy variant."""
+    days, day_index = np.unique(candidates['game_date'].to_numpy(), return_inverse=True)
+    return {
+        'frame': candidates,
+        'days': days,
+        'day_index': day_index,
+        'game_codes': pd.factorize(candidates['game_id'])[0],
+        'price': candidates['price_open'].to_numpy(np.float64),
+        'close': candidates['price_close'].to_numpy(np.float64),
+        'fair': candidates['fair_open'].to_numpy(np.float64),
+        'won': candidates['won'].to_numpy(np.float64),
+        'push': candidates['push'].to_numpy(bool),
+        'favorite': (candidates['price_open'] < 2.0).to_numpy(),
+        'home': (candidates['side'] == 'home').to_numpy(),
+    }
+
+def past_residual(data, groups, prior=0):
+    """For each candidate, mean (won - fair_open) over earlier days within its group; 0 with no history.
+
+    Walk-forward by construction: a day's own results are excluded, so the
+    estimate is what was knowable that morning. `prior` adds that many
+    zero-residual pseudo-games so the first weeks don't swing the estimate.
+    One cumsum per group.
+    """
+    n_days = len(data['days'])
+    residual = data['won'] - data['fair']
+    estimate = np.zeros(len(residual))
+    for group in np.unique(groups):
+        mask = groups == group
+        graded = mask & ~data['push']
+        day_sum = np.bincount(data['day_index'][graded], residual[graded], minlength=n_days)
+        day_count = np.bincount(data['day_index'][graded], minlength=n_days)
+        # Totals strictly before each day
+        prior_sum = np.concatenate([[0.0], np.cumsum(day_sum)[:-1]])
+        prior_count = np.concatenate([[0], np.cumsum(day_count)[:-1]])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(prior_count > 0, prior_sum / (prior_count + prior), 0.0)
+        estimate[mask] = mean[data['day_index'][mask]]
+    return estimate
+
+def residual_strategy(data, params):
+    """Market probability plus a shrunken walk-forward bias for the candidate's (home/away, fav/dog) bucket."""
+    groups = data['home'].astype(int) * 2 + data['favorite'].astype(int)
+    bias = past_residual(data, groups, prior=params.get('prior', 50))
+    return np.clip(data['fair'] + params.get('shrink', 0.5) * bias, 0.01, 0.99)
+
+def column_strategy(data, params):
+    """Probabilities from a column of the candidates (e.g. a model's walk-forward predictions)."""
+    return data['frame'][params.get('column', 'model_prob')].to_numpy(np.float64)
+
+def replay(data, probability, min_edge=0.0, kelly_fraction=0.25, max_fraction=0.05, max_exposure=0.5, bankroll=1.0):
+    """Replay a season day by day with fractional Kelly stakes; returns per-bet arrays and the bankroll path.
+
+    At most one side per game is bet (the larger edge). All of a day's bets are
+    sized from that morning's bankroll, scaled down together if they exceed
+    `max_exposure`; the day's result compounds into the next day's bankroll.
+    """
+    price = data['price']
+    edge = probability * price - 1
+    eligible = (edge > min_edge) & np.isfinite(edge)
+    # Best side per game: order by edge and keep each game's first eligible candidate
+    order = np.lexsort((-edge, data['game_codes']))
+    best = np.zeros(len(edge), dtype=bool)
+    _, first = np.unique(data['game_codes'][order], return_index=True)
+    best[order[first]] = True
+    bet = eligible & best
+
+    kelly = np.where(bet, (probability * price - 1) / (price - 1), 0.0)
+    fraction = np.minimum(kelly_fraction * kelly, max_fraction)
+    n_days = len(data['days'])
+    exposure = np.bincount(data['day_index'], fraction, minlength=n_days)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scale = np.where(exposure > max_exposure, max_exposure / exposure, 1.0)
+    fraction = fraction * scale[data['day_index']]
+
+    returns = np.where(bet & ~data['push'], data['won'] * (price - 1) - (1 - data['won']), 0.0)
+    day_return = np.bincount(data['day_index'], fraction * returns, minlength=n_days)
+    path = bankroll * np.concatenate([[1.0], np.cumprod(1 + day_return)])
+    stakes = fraction * path[:-1][data['day_index']]
+    return {'bet': bet, 'probability': probability, 'stakes': stakes, 'profit': stakes * returns, 'bankroll': path}
+
+def calibration(probability, won, bins=10):
+    """(bin, mean predicted, observed win rate, count) rows for bets with a probability."""
+    edges = np.linspace(0, 1, bins + 1)
+    which = np.clip(np.digitize(probability, edges) - 1, 0, bins - 1)
+    counts = np.bincount(which, minlength=bins)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        predicted = np.bincount(which, probability, minlength=bins) / counts
+        observed = np.bincount(which, won, minlength=bins) / counts
+    return pd.DataFrame({'bin': edges[:-1], 'predicted': predicted, 'observed': observed, 'count': counts})[counts > 0]
+
+def metrics(data, run):
+    """ROI, closing line value, drawdown and calibration of one replay."""
+    bet, stakes, profit, path = run['bet'], run['stakes'], run['profit'], run['bankroll']
+    staked = stakes.sum()
+    peak = np.maximum.accumulate(path)
+    clv = data['price'][bet] / data['close'][bet] - 1
+    graded = ~data['push']
+    probability, won = run['probability'][graded], data['won'][graded]
+    table = calibration(run['probability'][bet & graded], data['won'][bet & graded])
+    ece = float((table['count'] * (table['predicted'] - table['observed']).abs()).sum() / table['count'].sum()) if len(table) else np.nan
+    return {
+        'bets': int(bet.sum()),
+        'staked': float(staked),
+        'profit': float(profit.sum()),
+        'roi': float(profit.sum() / staked) if staked else 0.0,
+        'final_bankroll': float(path[-1]),
+        'max_drawdown': float(np.max(1 - path / peak)),
+        'clv': float(np.nanmean(clv)) if np.isfinite(clv).any() else np.nan,
+        'beat_close': float(np.nanmean(clv > 0)) if np.isfinite(clv).any() else np.nan,
+        'brier': float(np.nanmean((probability - won) ** 2)) if len(won) else np.nan,
+        'calibration_error': ece,
+    }
+
+def evaluate(candidates, strategy=residual_strategy, **params):
+    """Run one strategy variant; returns (metrics, calibration table, bets frame)."""
+    data = candidates if isinstance(candidates, dict) else prepare(candidates)
+    probability = strategy(data, params)
+    run = replay(data, probability, **{key: value for key, value in params.items() if key in REPLAY_PARAMS})
+    bets = data['frame'][run['bet']].assign(probability=probability[run['bet']], stake=run['stakes'][run['bet']],
+                                            profit=run['profit'][run['bet']])
+    return metrics(data, run), calibration(probability[run['bet']], data['won'][run['bet']]), bets
+
+_worker = {}
+
+def _init_worker(candidates, strategy):
+    _worker['data'] = prepare(candidates)
+    _worker['strategy'] = strategy
+
+def _run_variant(params):
+    data = _worker['data']
+    probability = _worker['strategy'](data, params)
+    run = replay(data, probability, **{key: value for key, value in params.items() if key in REPLAY_PARAMS})
+    return dict(params, **metrics(data, run))
+
+def parameter_grid(grid):
+    """Every combination of a {param: [values]} grid as a list of dicts."""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+def run_grid(candidates, grid=DEFAULT_GRID, strategy=residual_strategy, processes=None, chunksize=8):
+    """Evaluate every variant in `grid` across a process pool; returns one metrics row per variant, best ROI first.
+
+    Candidates are sent to each worker once (pool initializer) and prepared
+    there, so a task is just a small params dict. `strategy` must be a
+    module-level function so it can be pickled.
+    """
+    variants = parameter_grid(grid)
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(candidates, strategy)) as pool:
+        rows = list(pool.map(_run_variant, variants, chunksize=chunksize))
+    logger.info(f"Evaluated {len(variants)} variants over {len(candidates)} candidates in {time.perf_counter() - started:.1f}s")
+    return pd.DataFrame(rows).sort_values('roi', ascending=False).reset_index(drop=True)
+
+def main():
+    from warehouse import get_warehouse
+
+    warehouse = get_warehouse()
+    snapshots = warehouse.select('odds_snapshots')
+    odds = odds_from_snapshots(snapshots) if snapshots else odds_from_odds_data(warehouse.select('odds_data'))
+    candidates = build_candidates(odds, load_results())
+    if candidates.empty:
+        print("❌ No games with both odds and results")
+        return
+    results = run_grid(candidates)
+    print(results.head(20).to_string(index=False))
+
+if __name__ == "__main__":
+    main()
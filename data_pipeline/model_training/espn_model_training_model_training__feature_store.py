@@ -0,0 +1,184 @@
+import logging
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'storage')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from database.cache_invalidation import invalidate
+from parquet_store import filter_expression, read_dataset
+from storage_config import FEATURE_ROOT
+
+logger = logging.getLogger(__name__)
+
+# Counting stats from the gamelog parser; rates are rebuilt from window sums
+COUNT_STATS = ["AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "HBP", "SO", "SB", "CS"]
+GAME_WINDOWS = (7, 15, 30)
+DAY_WINDOWS = (7, 15, 30)
+EWM_HALFLIFE = 10  # games
+EWM_STATS = ["H", "HR", "BB", "SO", "TB", "PA"]
+KEY_COLUMNS = ["player_id", "as_of_date"]
+# Carried through from the gamelog rows for display; never used as features
+META_COLUMNS = ["player_name", "team_id"]
+PARTITIONING = ds.partitioning(pa.schema([("season", pa.int32())]), flavor="hive")
+
+def load_gamelogs(season=None, player_ids=None):
+    """Typed gamelog rows from the espn_gamelog Parquet dataset, one per (player, game).
+
+    A game scraped on several days is kept once, from the latest scrape.
+    """
+    filters = {}
+    if season is not None:
+        filters["season"] = int(season)
+    if player_ids is not None:
+        filters["player_id"] = ("in_", [str(player_id) for player_id in player_ids])
+    games = read_dataset("espn_gamelog", filters=filters)
+    games = games.dropna(subset=["game_date"])
+    games = games.sort_values("scraped_at").drop_duplicates(["player_id", "game_id"], keep="last")
+    return games
+
+def add_derived(values):
+    """Total bases and plate appearances, from the counting stats (sacrifices aren't in the gamelog)."""
+    values["TB"] = values["H"] + values["2B"] + 2 * values["3B"] + 3 * values["HR"]
+    values["PA"] = values["AB"] + values["BB"] + values["HBP"]
+    return values
+
+def add_rates(features, prefix):
+    """AVG/OBP/SLG/OPS from a window's sums; NaN when the window has no at bats."""
+    ab, pa_ = features[f"{prefix}_AB"], features[f"{prefix}_PA"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        features[f"{prefix}_AVG"] = np.where(ab > 0, features[f"{prefix}_H"] / ab, np.nan)
+        features[f"{prefix}_OBP"] = np.where(
+            pa_ > 0, (features[f"{prefix}_H"] + features[f"{prefix}_BB"] + features[f"{prefix}_HBP"]) / pa_, np.nan
+        )
+        features[f"{prefix}_SLG"] = np.where(ab > 0, features[f"{prefix}_TB"] / ab, np.nan)
+    features[f"{prefix}_OPS"] = features[f"{prefix}_OBP"] + features[f"{prefix}_SLG"]
+
+def build_features(games, game_windows=GAME_WINDOWS, day_windows=DAY_WINDOWS, halflife=EWM_HALFLIFE):
+    """Rolling, expanding and EWMA features per player, one row per (player_id, as_of_date).
+
+    A row's as_of_date is the day after the player's game, and it covers only
+    games up to and including that game, so it can be joined to any later game
+    without leaking the result. Doubleheaders collapse into the day's last row.
+
+    Every window is a difference of one cumulative sum over the whole league:
+    a player's last-n-games total at row i is csum[i + 1] - csum[max(start, i + 1 - n)],
+    and the last-n-days boundary comes from one searchsorted over (player, day)
+    keys, so there is no per-player or per-row Python loop.
+    """
+    stats = COUNT_STATS + ["TB", "PA"]
+    games = games.assign(player_id=games["player_id"].astype(str),
+                         game_date=pd.to_datetime(games["game_date"]).dt.normalize())
+    games = games.sort_values(["player_id", "game_date", "game_id"], kind="mergesort").reset_index(drop=True)
+    values = add_derived(games[COUNT_STATS].apply(pd.to_numeric, errors="coerce").fillna(0.0).astype(np.float64))
+    matrix = values[stats].to_numpy()
+
+    n = len(games)
+    player_codes, players = pd.factorize(games["player_id"], sort=True)
+    index = np.arange(n)
+    starts = np.r_[0, np.flatnonzero(np.diff(player_codes)) + 1]
+    row_start = np.repeat(starts, np.diff(np.r_[starts, n]))
+    years = games["game_date"].dt.year.to_numpy()
+    season_starts = np.r_[0, np.flatnonzero((np.diff(player_codes) != 0) | (np.diff(years) != 0)) + 1]
+    season_start = np.repeat(season_starts, np.diff(np.r_[season_starts, n]))
+    csum = np.vstack([np.zeros((1, len(stats))), np.cumsum(matrix, axis=0)])
+
+    features = {"player_id": games["player_id"].to_numpy(),
+                "as_of_date": (games["game_date"] + pd.Timedelta(days=1)).to_numpy(),
+                "last_game_date": games["game_date"].to_numpy(),
+                "season_games": index - season_start + 1}
+    for column in META_COLUMNS:
+        if column in games:
+            features[column] = games[column].to_numpy()
+    # Season to date; the game windows below run across season boundaries
+    season_sums = csum[index + 1] - csum[season_start]
+    for j, stat in enumerate(stats):
+        features[f"season_{stat}"] = season_sums[:, j]
+
+    for window in game_windows:
+        lower = np.maximum(row_start, index + 1 - window)
+        sums = csum[index + 1] - csum[lower]
+        features[f"g{window}_games"] = index + 1 - lower
+        for j, stat in enumerate(stats):
+            features[f"g{window}_{stat}"] = sums[:, j]
+
+    # (player, day) as one sortable int; a player's games never mix with the next player's
+    days = (games["game_date"].to_numpy().astype("datetime64[D]").astype(np.int64))
+    span = days.max() - days.min() + max(day_windows, default=0) + 1 if n else 1
+    keys = player_codes.astype(np.int64) * span + (days - (days.min() if n else 0))
+    for window in day_windows:
+        lower = np.searchsorted(keys, keys - window + 1, side="left")
+        sums = csum[index + 1] - csum[lower]
+        features[f"d{window}_games"] = index + 1 - lower
+        for j, stat in enumerate(stats):
+            features[f"d{window}_{stat}"] = sums[:, j]
+
+    frame = pd.DataFrame(features)
+    for prefix in ["season"] + [f"g{w}" for w in game_windows] + [f"d{w}" for w in day_windows]:
+        add_rates(frame, prefix)
+
+    if halflife:
+        ewm = values[EWM_STATS].groupby(games["player_id"].to_numpy(), sort=False).ewm(halflife=halflife).mean()
+        ewm = ewm.reset_index(level=0, drop=True).sort_index()
+        for stat in EWM_STATS:
+            frame[f"ewm_{stat}"] = ewm[stat].to_numpy()
+
+    frame["season"] = years.astype("int32")
+    frame = frame.drop_duplicates(KEY_COLUMNS, keep="last").reset_index(drop=True)
+    logger.info(f"Built {len(frame.columns)} features for {len(frame)} player-days across {len(players)} players")
+    return frame
+
+def materialize(features, root=FEATURE_ROOT):
+    """Write features partitioned by season, replacing the seasons being written."""
+    table = pa.Table.from_pandas(features, preserve_index=False)
+    pq.write_to_dataset(table, root_path=root, partitioning=PARTITIONING,
+                        basename_template="features-{i}.parquet", existing_data_behavior="delete_matching")
+    logger.info(f"Materialized {len(features)} feature rows to {root}")
+    invalidate("features")  # served predictions were scored from the old rows
+    return len(features)
+
+def refresh(season, root=FEATURE_ROOT):
+    """Rebuild one season's feature table from the stored gamelogs."""
+    return materialize(build_features(load_gamelogs(season)), root)
+
+def read_features(player_ids=None, start=None, end=None, columns=None, root=FEATURE_ROOT):
+    """Stored features, optionally for some players and an as_of_date range [start, end]."""
+    expression = None
+    if player_ids is not None:
+        expression = filter_expression({"player_id": ("in_", [str(player_id) for player_id in player_ids])})
+    for operator, bound in (("gte", start), ("lte", end)):
+        if bound is not None:
+            term = filter_expression({"as_of_date": (operator, pd.Timestamp(bound))})
+            expression = term if expression is None else expression & term
+    dataset = ds.dataset(root, format="parquet", partitioning=PARTITIONING)
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+def features_as_of(date, player_ids=None, root=FEATURE_ROOT):
+    """Each player's latest feature row available on `date`, for scoring that day's games.
+
+    Day-window columns are as of the player's last game; days_since_last_game
+    says how stale they are.
+    """
+    date = pd.Timestamp(date).normalize()
+    features = read_features(player_ids, start=date - pd.Timedelta(days=366), end=date, root=root)
+    latest = features.sort_values("as_of_date").drop_duplicates("player_id", keep="last")
+    latest["days_since_last_game"] = (date - pd.to_datetime(latest["last_game_date"])).dt.days
+    return latest.reset_index(drop=True)
+
+def training_set(games, features, target="H"):
+    """(X, y): for every game, the player's features as of that morning and the game's `target` stat."""
+    games = games.assign(player_id=games["player_id"].astype(str),
+                         game_date=pd.to_datetime(games["game_date"]).dt.normalize())
+    games = games.sort_values("game_date")
+    features = features.assign(as_of_date=pd.to_datetime(features["as_of_date"])).sort_values("as_of_date")
+    joined = pd.merge_asof(games[["player_id", "game_date", target]], features, by="player_id",
+                           left_on="game_date", right_on="as_of_date", direction="backward")
+    joined = joined.dropna(subset=["as_of_date"])  # first game of a player's history has no features
+    feature_columns = [column for column in features.columns
+                       if column not in KEY_COLUMNS + META_COLUMNS + ["last_game_date", "season"]]
+    return joined[feature_columns], pd.to_numeric(joined[target], errors="coerce")
@@ -1,2 +1,12 @@
-def train_model():
-    return {'message': 'Model training placeholder'}
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from feature_store import load_gamelogs, read_features, training_set
+
+def train_model(season=None, target='H'):
+    """Assemble the training matrix from the materialized feature store (no window math here)."""
+    games = load_gamelogs(season)
+    features = read_features(player_ids=games['player_id'].unique())
+    X, y = training_set(games, features, target=target)
+    return {'message': 'Model training placeholder', 'rows': len(X), 'features': list(X.columns)}
@@ -0,0 +1,225 @@
+import glob
+import os
+import re
+import threading
+import uuid
+from contextlib import nullcontext
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from storage_config import PARQUET_ROOT, SCRAPE_STORAGE
+
+PARTITION_SCHEMA = pa.schema([("season", pa.int32()), ("scrape_date", pa.string())])
+PARTITIONING = ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+MISSING_VALUES = {"", "-", "--", "N/A", "n/a", "NA"}
+SCRAPED_ON_RE = re.compile(r"^#\s*Data scraped on:\s*(.+)$")
+# TeamRankings game-log scores read "W 5-3" from the team's side
+SCORE_RE = re.compile(r"^([WLT])\s+(\d+)-(\d+)")
+
+def dataset_path(dataset, root=PARQUET_ROOT):
+    return os.path.join(root, f"dataset={dataset}")
+
+def normalize_frame(df):
+    """Give scraped text columns real dtypes: numbers (incl. '45.2%' and '1,234') become floats/ints."""
+    df = df.copy()
+    df.columns = [str(column).strip() for column in df.columns]
+    for column in df.columns:
+        if not (pd.api.types.is_object_dtype(df[column]) or pd.api.types.is_string_dtype(df[column])):
+            continue
+        text = df[column].astype(str).str.strip()
+        text = text.where(~text.isin(MISSING_VALUES))
+        numeric = pd.to_numeric(text.str.replace(",", "", regex=False).str.rstrip("%"), errors="coerce")
+        # Only convert when every present value parsed; names and records like "12-5" stay text
+        if numeric.notna().sum() and numeric.notna().sum() == text.notna().sum():
+            df[column] = numeric
+    return df
+
+def read_scraped_csv(path):
+    """Read a legacy scraper CSV, returning (DataFrame, scraped_at) with the comment line handled."""
+    scraped_at = None
+    with open(path, "r") as f:
+        first_line = f.readline().strip()
+    match = SCRAPED_ON_RE.match(first_line)
+    if match:
+        scraped_at = pd.Timestamp(match.group(1))
+    df = pd.read_csv(path, comment=None, skiprows=1 if match else 0, dtype=str)
+    if scraped_at is None:
+        scraped_at = pd.Timestamp(datetime.fromtimestamp(os.path.getmtime(path)))
+    return df, scraped_at
+
+class ParquetSink:
+    """Buffers scraped frames per dataset and writes them as hive-partitioned Parquet.
+
+    Layout is <root>/dataset=<name>/season=<yyyy>/scrape_date=<yyyy-mm-dd>/part-*.parquet,
+    one file per partition per flush instead of one CSV per page or player.
+    Entity columns (team, player_id, stat, ...) and a scraped_at timestamp are
+    stored on every row:
+
+        with ParquetSink() as sink:
+            sink.add("team_stats", df, season=2025, stat="batting-average")
+    """
+
+    def __init__(self, root=PARQUET_ROOT):
+        self.root = root
+        self._frames = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+
+    def add(self, dataset, df, season, scraped_at=None, **entity):
+        """Queue one scraped table; `entity` values become constant columns."""
+        if df is None or df.empty:
+            return
+        scraped_at = pd.Timestamp(scraped_at or datetime.now())
+        frame = normalize_frame(df)
+        for column, value in entity.items():
+            frame[column] = value
+        frame["scraped_at"] = scraped_at
+        frame["season"] = int(season)
+        frame["scrape_date"] = scraped_at.strftime("%Y-%m-%d")
+        with self._lock:
+            self._frames.setdefault(dataset, []).append(frame)
+
+    def flush(self):
+        """Write everything queued; returns {dataset: rows written}."""
+        with self._lock:
+            frames, self._frames = self._frames, {}
+        written = {}
+        for dataset, parts in frames.items():
+            df = pd.concat(parts, ignore_index=True, sort=False)
+            # A column that is numeric on one page and text on another is stored as text
+            for column in df.columns:
+                if pd.api.types.is_object_dtype(df[column]):
+                    df[column] = df[column].map(lambda value: value if pd.isna(value) else str(value))
+            write_frame(df, dataset, self.root)
+            written[dataset] = len(df)
+        return written
+
+def write_frame(df, dataset, root=PARQUET_ROOT):
+    """Write a frame that already has season/scrape_date columns into its partitions."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_to_dataset(
+        table,
+        root_path=dataset_path(dataset, root),
+        partitioning=PARTITIONING,
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+
+def filter_expression(filters):
+    """Build a pyarrow filter from {column: value} or {column: (operator, value)}.
+
+    Operators follow the Supabase reader: eq, neq, gt, gte, lt, lte, in_.
+    """
+    expression = None
+    for column, condition in (filters or {}).items():
+        operator, value = condition if isinstance(condition, tuple) else ("eq", condition)
+        field = ds.field(column)
+        term = {
+            "eq": lambda: field == value,
+            "neq": lambda: field != value,
+            "gt": lambda: field > value,
+            "gte": lambda: field >= value,
+            "lt": lambda: field < value,
+            "lte": lambda: field <= value,
+            "in_": lambda: field.isin(list(value)),
+        }[operator]()
+        expression = term if expression is None else expression & term
+    return expression
+
+def unify_schemas(schemas):
+    """Union of the file schemas; numeric types widen, anything else that disagrees reads as text."""
+    try:
+        return pa.unify_schemas(schemas + [PARTITION_SCHEMA], promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    types = {}
+    for schema in schemas:
+        for schema_field in schema:
+            types.setdefault(schema_field.name, set()).add(schema_field.type)
+    fields = []
+    for name, found in types.items():
+        if name in PARTITION_SCHEMA.names:
+            continue
+        try:
+            fields.append(pa.unify_schemas([pa.schema([(name, t)]) for t in found], promote_options="permissive").field(name))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            fields.append(pa.field(name, pa.string()))
+    return pa.schema(fields + list(PARTITION_SCHEMA))
+
+def open_dataset(dataset, root=PARQUET_ROOT):
+    """pyarrow Dataset over every partition, with file schemas unified (pages differ in columns)."""
+    path = dataset_path(dataset, root)
+    discovered = ds.dataset(path, format="parquet", partitioning=PARTITIONING)
+    schemas = [fragment.physical_schema for fragment in discovered.get_fragments()]
+    if not schemas:
+        return discovered
+    return ds.dataset(path, schema=unify_schemas(schemas), format="parquet", partitioning=PARTITIONING)
+
+def read_dataset(dataset, columns=None, filters=None, root=PARQUET_ROOT):
+    """Load a dataset in one vectorized read; partition filters (season, scrape_date) prune files."""
+    table = open_dataset(dataset, root).to_table(columns=columns, filter=filter_expression(filters))
+    return table.to_pandas()
+
+def latest_scrapes(dataset, by, filters=None, root=PARQUET_ROOT):
+    """{`by` value: DataFrame} with only the most recent scrape of each entity; {} before the first write.
+
+    Columns no row of an entity's scrape filled (other pages' columns) are dropped.
+    """
+    if not os.path.isdir(dataset_path(dataset, root)):
+        return {}
+    df = read_dataset(dataset, filters=filters, root=root)
+    if df.empty:
+        return {}
+    df = df[df["scraped_at"] == df.groupby(by)["scraped_at"].transform("max")]
+    return {key: group.dropna(axis=1, how="all").reset_index(drop=True) for key, group in df.groupby(by)}
+
+def game_logs(trends_dir, root=PARQUET_ROOT):
+    """(team slug, game log, scraped_at) for each team's latest TeamRankings game log.
+
+    Logs come from the tr_team_trends dataset; a team's legacy
+    <trends_dir>/<team>/*_game_log.csv is only read when the dataset has no
+    game log for it.
+    """
+    logs = [(team, df, pd.Timestamp(df["scraped_at"].iloc[0]))
+            for team, df in latest_scrapes("tr_team_trends", "team", {"data_type": "game-log"}, root).items()]
+    teams = {team for team, _, _ in logs}
+    for path in sorted(glob.glob(os.path.join(trends_dir, "*", "*_game_log.csv"))):
+        team = os.path.basename(os.path.dirname(path))
+        if team not in teams:
+            logs.append((team, *read_scraped_csv(path)))
+    return logs
+
+def game_log_scores(df):
+    """(runs for, runs against) of each game-log row as numbers; NaN where the Score isn't a final."""
+    scores = df["Score"].astype(str).str.extract(SCORE_RE)
+    return pd.to_numeric(scores[1]), pd.to_numeric(scores[2])
+
+def import_csv_tree(paths, dataset, season, entity_from_path=None, root=PARQUET_ROOT):
+    """Convert existing scraper CSVs into the Parquet layout; returns rows imported.
+
+    `entity_from_path(path)` returns the entity columns for a file, e.g.
+    {"stat": "batting-average"} from its filename.
+    """
+    sink = ParquetSink(root)
+    for path in paths:
+        df, scraped_at = read_scraped_csv(path)
+        entity = entity_from_path(path) if entity_from_path else {"source_file": os.path.basename(path)}
+        sink.add(dataset, df, season, scraped_at=scraped_at, **entity)
+    return sum(sink.flush().values())
+
+def scrape_sink(root=PARQUET_ROOT):
+    """Context manager for a scraper run: a ParquetSink, or None when SCRAPE_STORAGE=csv."""
+    return ParquetSink(root) if SCRAPE_STORAGE in ("parquet", "both") else nullcontext()
+
+def keep_csv(sink):
+    """Whether a scraper should still write its per-page CSV."""
+    return sink is None or SCRAPE_STORAGE == "both"
@@ -0,0 +1,220 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date, datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'fetch')))
+from storage_config import SQLITE_DB_PATH
+from supabase_writer import NATURAL_KEYS
+
+logger = logging.getLogger(__name__)
+
+# What identifies "the same thing" across scrapes: the natural key without the scrape date
+ENTITY_KEYS = {
+    'team_stats': ('sport', 'team_name', 'stat_type', 'season'),
+    'player_stats': ('sport', 'player_name', 'team_name', 'stat_type', 'season'),
+    'player_splits': ('sport', 'player_name', 'split_type', 'split_value', 'season'),
+    'odds_data': NATURAL_KEYS['odds_data'],
+    'odds_snapshots': ('event_id', 'bookmaker', 'market'),
+}
+# Columns that change on every scrape without the data changing
+VOLATILE_COLUMNS = frozenset(['id', 'created_at', 'stat_date', 'captured_at', 'last_update'])
+LOOKUP_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    table_name TEXT NOT NULL,
+    entity TEXT NOT NULL,
+    valid_from TEXT NOT NULL,
+    valid_to TEXT,
+    row_hash TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_snapshots_entity_valid_from ON snapshots (table_name, entity, valid_from);
+CREATE INDEX IF NOT EXISTS idx_snapshots_valid_from ON snapshots (table_name, valid_from);
+"""
+
+def timestamp(value=None):
+    """ISO-8601 text (to the second) for datetimes, dates and strings; a bare date means its midnight.
+
+    Text compares in time order, which is what the indexes rely on.
+    """
+    if value is None:
+        value = datetime.now()
+    elif isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time())
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)  # stored in local time, like the scrapers' dates
+    return value.isoformat(timespec='seconds')
+
+def entity_of(table, row):
+    return json.dumps([row.get(column) for column in ENTITY_KEYS[table]], default=str)
+
+def filter_sql(table, filters):
+    """SQL conditions (and their parameters) for {column: value} equality filters.
+
+    Entity key columns are read from the short entity array, anything else
+    from the row JSON; SQLite evaluates both, so rows that don't match are
+    never decoded in Python. IS makes a None filter match a missing value.
+    """
+    keys = ENTITY_KEYS.get(table, ())
+    sql, params = '', []
+    for column, value in (filters or {}).items():
+        if column in keys:
+            sql += ' AND json_extract(entity, ?) IS ?'
+            params += [f'$[{keys.index(column)}]', value]
+        else:
+            sql += ' AND json_extract(data, ?) IS ?'
+            params += [f'$."{column}"', value]
+    return sql, params
+
+def content_hash(row):
+    payload = {key: value for key, value in row.items() if key not in VOLATILE_COLUMNS}
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+class SnapshotStore:
+    """Append-only, versioned history of the stats and odds tables.
+
+    Each row version is stored with valid_from (when it was first seen) and
+    valid_to (when a different version replaced it; NULL while current). A
+    scrape that finds the same values as the current version writes nothing,
+    so the store grows with changes, not with scrape frequency. Nothing is
+    ever overwritten, and as_of() only returns versions that existed at the
+    given moment, so a backtest can't see data from after its game date:
+
+        store = SnapshotStore()
+        store.record('player_stats', rows)
+        store.as_of('player_stats', '2025-06-01', filters={'player_name': 'Pete Alonso'})
+    """
+
+    def __init__(self, path=SQLITE_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        with self._db:
+            self._db.executescript(SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _current(self, table, entities):
+        """entity -> (row_hash, valid_from) of the open versions among `entities`."""
+        current = {}
+        for start in range(0, len(entities), LOOKUP_CHUNK):
+            chunk = entities[start:start + LOOKUP_CHUNK]
+            sql = (f'SELECT entity, row_hash, valid_from FROM snapshots WHERE table_name = ? '
+                   f'AND valid_to IS NULL AND entity IN ({",".join("?" * len(chunk))})')
+            for entity, row_hash, valid_from in self._db.execute(sql, [table, *chunk]):
+                current[entity] = (row_hash, valid_from)
+        return current
+
+    def record(self, table, rows, observed_at=None):
+        """Add the versions in `rows` observed at `observed_at` (default now); returns versions written.
+
+        Unchanged rows are skipped. A row observed no later than the version it
+        would replace is ignored rather than rewriting history.
+        """
+        if table not in ENTITY_KEYS:
+            raise ValueError(f"No entity key configured for table '{table}'")
+        observed = timestamp(observed_at)
+        latest = {}
+        for row in rows:
+            latest[entity_of(table, row)] = row  # last one wins within a batch
+        if not latest:
+            return 0
+
+        started = time.perf_counter()
+        with self._lock, self._db:
+            current = self._current(table, list(latest))
+            closes, inserts, stale = [], [], 0
+            for entity, row in latest.items():
+                row_hash = content_hash(row)
+                previous = current.get(entity)
+                if previous is not None:
+                    if previous[0] == row_hash:
+                        continue
+                    if previous[1] >= observed:
+                        stale += 1
+                        continue
+                    closes.append((observed, table, entity))
+                inserts.append((table, entity, observed, None, row_hash, json.dumps(row, default=str)))
+            self._db.executemany(
+                'UPDATE snapshots SET valid_to = ? WHERE table_name = ? AND entity = ? AND valid_to IS NULL', closes
+            )
+            self._db.executemany('INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?)', inserts)
+        if stale:
+            logger.warning(f"Ignored {stale} {table} rows older than their current version")
+        logger.info(f"Recorded {len(inserts)} new {table} versions ({len(latest) - len(inserts) - stale} unchanged) "
+                    f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return len(inserts)
+
+    def as_of(self, table, when, filters=None):
+        """Every entity's version that was current at `when` (a date means the start of that day).
+
+        `filters` are {column: value} equality checks on the row data.
+        """
+        moment = timestamp(when)
+        where, params = filter_sql(table, filters)
+        with self._lock:
+            cursor = self._db.execute(
+                'SELECT data FROM snapshots WHERE table_name = ? AND valid_from <= ? '
+                f'AND (valid_to IS NULL OR valid_to > ?){where}',
+                (table, moment, moment, *params),
+            )
+            return [json.loads(data) for (data,) in cursor]
+
+    def timeline(self, table, start, end, filters=None):
+        """Every version alive at some point in [start, end], with valid_from/valid_to added.
+
+        One indexed read for a whole backtest; slice it per day with at().
+        """
+        where, params = filter_sql(table, filters)
+        with self._lock:
+            cursor = self._db.execute(
+                'SELECT valid_from, valid_to, data FROM snapshots WHERE table_name = ? AND valid_from <= ? '
+                f'AND (valid_to IS NULL OR valid_to > ?){where} ORDER BY valid_from',
+                (table, timestamp(end), timestamp(start), *params),
+            )
+            return [dict(json.loads(data), valid_from=valid_from, valid_to=valid_to) for valid_from, valid_to, data in cursor]
+
+    def history(self, table, row):
+        """All versions of the entity `row` belongs to, oldest first."""
+        with self._lock:
+            cursor = self._db.execute(
+                'SELECT valid_from, valid_to, data FROM snapshots WHERE table_name = ? AND entity = ? ORDER BY valid_from',
+                (table, entity_of(table, row)),
+            )
+            return [dict(json.loads(data), valid_from=valid_from, valid_to=valid_to) for valid_from, valid_to, data in cursor]
+
+def at(timeline_rows, when):
+    """The as_of() view of rows returned by timeline(), without another query."""
+    moment = timestamp(when)
+    return [row for row in timeline_rows
+            if row['valid_from'] <= moment and (row['valid_to'] is None or row['valid_to'] > moment)]
+
+_default_store = None
+_default_lock = threading.Lock()
+
+def get_snapshot_store():
+    """The process-wide snapshot store on SQLITE_DB_PATH, opened on first use."""
+    global _default_store
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None:
+                _default_store = SnapshotStore()
+    return _default_store
@@ -1 +1,12 @@
-SQLITE_DB_PATH = 'sports_data.db'
+import os
+
+# Local warehouse (see warehouse); data_pipeline/sports_data.db unless overridden
+SQLITE_DB_PATH = os.getenv('SQLITE_DB_PATH', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sports_data.db'))
+
+# Partitioned Parquet datasets written by the scrapers (see parquet_store)
+PARQUET_ROOT = os.getenv('PARQUET_ROOT', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parquet'))
+# 'parquet' (default), 'csv' for the legacy per-page files, or 'both'
+SCRAPE_STORAGE = os.getenv('SCRAPE_STORAGE', 'parquet')
+
+# Rolling player features materialized from the gamelogs (see feature_store)
+FEATURE_ROOT = os.getenv('FEATURE_ROOT', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'features'))
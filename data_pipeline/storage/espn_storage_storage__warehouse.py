@@ -0,0 +1,256 @@
+import glob
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'fetch')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from database.schema_registry import CREATE_TABLE_RE, MIGRATIONS_DIR
+from storage_config import SQLITE_DB_PATH
+from supabase_reader import iter_pages
+from supabase_writer import NATURAL_KEYS, UpsertBuffer
+
+logger = logging.getLogger(__name__)
+
+# Supabase tables mirrored locally
+WAREHOUSE_TABLES = ('team_stats', 'player_stats', 'player_splits', 'odds_data', 'odds_snapshots')
+DEFAULT_BATCH_SIZE = 5000
+
+# Secondary indexes for the hot read paths (natural-key indexes are added per table)
+INDEXES = {
+    'player_stats': [('player_name', 'season'), ('team_name', 'stat_type')],
+    'player_splits': [('player_name', 'season')],
+    'team_stats': [('team_name', 'stat_type'), ('season',)],
+    'odds_data': [('game_date',)],
+    'odds_snapshots': [('commence_time',), ('event_id', 'bookmaker', 'market')],
+}
+
+# Postgres -> SQLite column types used by the migrations
+TYPE_REWRITES = [
+    (re.compile(r'\bSERIAL\s+PRIMARY\s+KEY\b', re.IGNORECASE), 'INTEGER PRIMARY KEY AUTOINCREMENT'),
+    (re.compile(r'\b(?:VARCHAR|CHAR)\s*\(\s*\d+\s*\)', re.IGNORECASE), 'TEXT'),
+    (re.compile(r'\b(?:NUMERIC|DECIMAL)\s*\(\s*\d+\s*,\s*\d+\s*\)', re.IGNORECASE), 'REAL'),
+    (re.compile(r'\b(?:FLOAT|DOUBLE PRECISION)\b', re.IGNORECASE), 'REAL'),
+    (re.compile(r'\b(?:DATE|TIMESTAMP(?:TZ)?)\b', re.IGNORECASE), 'TEXT'),
+]
+ADD_COLUMN_DDL_RE = re.compile(
+    r'ALTER TABLE\s+(?:public\.)?(\w+)\s+ADD COLUMN(?: IF NOT EXISTS)?\s+(\w+)\s+([^;,]+)', re.IGNORECASE
+)
+# Run before a table's natural-key index is rebuilt, as the matching migration does in Supabase
+KEY_BACKFILLS = {
+    'odds_data': "UPDATE odds_data SET event_id = 'legacy-' || id WHERE event_id IS NULL",  # migration 010
+}
+OPERATORS = {'eq': '=', 'neq': '!=', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<=', 'like': 'LIKE'}
+
+def sqlite_type(ddl):
+    for pattern, replacement in TYPE_REWRITES:
+        ddl = pattern.sub(replacement, ddl)
+    return ddl
+
+def migration_ddl(migrations_dir=MIGRATIONS_DIR, tables=WAREHOUSE_TABLES):
+    """SQLite CREATE TABLE statements and added columns for the mirrored tables, from the .sql migrations."""
+    creates, added = {}, []
+    for path in sorted(glob.glob(os.path.join(migrations_dir, '*.sql'))):
+        with open(path, 'r') as file:
+            sql = file.read()
+        for table, body in CREATE_TABLE_RE.findall(sql):
+            if table.lower() in tables:
+                creates[table.lower()] = f"CREATE TABLE IF NOT EXISTS {table.lower()} ({sqlite_type(body)})"
+        for table, column, column_type in ADD_COLUMN_DDL_RE.findall(sql):
+            if table.lower() in tables:
+                added.append((table.lower(), column.lower(), sqlite_type(column_type.strip())))
+    return creates, added
+
+def where_clause(filters):
+    """SQL and parameters for {column: value} / {column: (operator, value)}, as in the Supabase reader."""
+    clauses, params = [], []
+    for column, condition in (filters or {}).items():
+        operator, value = condition if isinstance(condition, tuple) else ('eq', condition)
+        if operator == 'in_':
+            values = list(value)
+            clauses.append(f'"{column}" IN ({",".join("?" * len(values))})')
+            params.extend(values)
+        elif value is None and operator in ('eq', 'is_'):
+            clauses.append(f'"{column}" IS NULL')
+        else:
+            clauses.append(f'"{column}" {OPERATORS[operator]} ?')
+            params.append(value)
+    return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+class Warehouse:
+    """Local SQLite copy of the Supabase stats tables.
+
+    Tables and columns come from sql/migrations, so the two stay in step.
+    Each natural key (see supabase_writer.NATURAL_KEYS) is a unique index and
+    loads are INSERT OR REPLACE, so reloading a scrape overwrites rather than
+    duplicates. A replaced row gets a new id, which is what lets sync_to_supabase
+    push only rows written since the last sync:
+
+        warehouse = Warehouse()
+        warehouse.bulk_load('player_stats', rows)
+        warehouse.select('player_stats', filters={'player_name': 'Pete Alonso', 'season': 2025})
+    """
+
+    def __init__(self, path=SQLITE_DB_PATH, migrations_dir=MIGRATIONS_DIR):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        # WAL lets readers (bot, pipeline) run while a loader writes
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self.create_schema(migrations_dir)
+        self.columns = {table: self._table_columns(table) for table in WAREHOUSE_TABLES}
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _table_columns(self, table):
+        return [row['name'] for row in self._db.execute(f'PRAGMA table_info({table})')]
+
+    def create_schema(self, migrations_dir=MIGRATIONS_DIR):
+        """Create the mirrored tables, added columns and indexes if they don't exist yet."""
+        creates, added = migration_ddl(migrations_dir)
+        with self._lock, self._db:
+            for ddl in creates.values():
+                self._db.execute(ddl)
+            for table, column, column_type in added:
+                if column not in self._table_columns(table):
+                    self._db.execute(f'ALTER TABLE {table} ADD COLUMN {column} {column_type}')
+            self._db.execute('CREATE TABLE IF NOT EXISTS sync_state (table_name TEXT PRIMARY KEY, last_id INTEGER, synced_at REAL)')
+            for table in creates:
+                # COALESCE so NULL key columns (stat_date, ...) collide, as UNIQUE NULLS NOT DISTINCT does
+                # in Supabase since migration 011; odds keys are NOT NULL there (008, 010). Unlike Postgres,
+                # a NULL and an empty string count as the same key here
+                key = ', '.join(f"COALESCE({column}, '')" for column in NATURAL_KEYS[table])
+                ddl = f'CREATE UNIQUE INDEX {table}_natural_key ON {table} ({key})'
+                existing = self._db.execute(
+                    "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = ?", (f'{table}_natural_key',)
+                ).fetchone()
+                if existing is None or existing[0] != ddl:
+                    # New table, or the natural key changed since this database was created
+                    self._db.execute(f'DROP INDEX IF EXISTS {table}_natural_key')
+                    if table in KEY_BACKFILLS:
+                        self._db.execute(KEY_BACKFILLS[table])
+                    self._db.execute(ddl)
+                for columns in INDEXES.get(table, []):
+                    name = f"idx_{table}_{'_'.join(columns)}"
+                    self._db.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({", ".join(columns)})')
+
+    def bulk_load(self, table, rows, batch_size=DEFAULT_BATCH_SIZE):
+        """Insert or replace rows (dicts) in one transaction per batch; returns rows written.
+
+        Keys that aren't columns of the table (e.g. Supabase's id) are ignored.
+        """
+        columns = [column for column in self.columns[table] if column not in ('id', 'created_at')]
+        sql = (f'INSERT OR REPLACE INTO {table} ({", ".join(columns)}) '
+               f'VALUES ({", ".join("?" * len(columns))})')
+        written, started = 0, time.perf_counter()
+        batch = []
+        for row in rows:
+            batch.append(tuple(row.get(column) for column in columns))
+            if len(batch) >= batch_size:
+                written += self._execute_batch(sql, batch)
+                batch = []
+        if batch:
+            written += self._execute_batch(sql, batch)
+        elapsed = time.perf_counter() - started
+        logger.info(f"Loaded {written} rows into local {table} in {elapsed * 1000:.0f} ms")
+        return written
+
+    def _execute_batch(self, sql, batch):
+        with self._lock, self._db:
+            self._db.executemany(sql, batch)
+        return len(batch)
+
+    def load_frame(self, table, df, batch_size=DEFAULT_BATCH_SIZE):
+        """bulk_load a DataFrame (NaN becomes NULL)."""
+        frame = df.astype(object).where(df.notna(), None)
+        return self.bulk_load(table, frame.to_dict('records'), batch_size)
+
+    def select(self, table, columns=None, filters=None, order_by=None, limit=None):
+        """Rows as dicts; filters use the Supabase reader's {column: value | (operator, value)} form."""
+        projection = ', '.join(f'"{column}"' for column in columns) if columns else '*'
+        where, params = where_clause(filters)
+        sql = f'SELECT {projection} FROM {table}{where}'
+        if order_by:
+            sql += f' ORDER BY {order_by}'
+        if limit:
+            sql += f' LIMIT {int(limit)}'
+        return self.query(sql, params)
+
+    def query(self, sql, params=()):
+        with self._lock:
+            return [dict(row) for row in self._db.execute(sql, params)]
+
+    def count(self, table):
+        return self.query(f'SELECT COUNT(*) AS n FROM {table}')[0]['n']
+
+    def _last_synced_id(self, table):
+        state = self.query('SELECT last_id FROM sync_state WHERE table_name = ?', (table,))
+        return state[0]['last_id'] if state else 0
+
+    def _max_id(self, table):
+        return self.query(f'SELECT COALESCE(MAX(id), 0) AS id FROM {table}')[0]['id']
+
+    def _mark_synced(self, table, last_id):
+        with self._lock, self._db:
+            self._db.execute('INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)', (table, last_id, time.time()))
+
+    def pull_from_supabase(self, client, table, filters=None):
+        """Mirror a Supabase table (or a filtered slice) locally, one keyset page per transaction.
+
+        Pulled rows get new local ids; they're marked as synced so the next
+        sync_to_supabase doesn't send them straight back. If local rows were
+        still waiting to be synced, the mark stays put and the pulled rows go
+        out again with them (upserts, so that's only extra traffic).
+        """
+        up_to_date = self._max_id(table) <= self._last_synced_id(table)
+        written = 0
+        for page in iter_pages(client, table, filters=filters):
+            written += self.bulk_load(table, page)
+        if up_to_date:
+            self._mark_synced(table, self._max_id(table))
+        elif written:
+            logger.warning(f"Local {table} had unsynced rows; the next sync will resend the {written} pulled rows too")
+        return written
+
+    def sync_to_supabase(self, client, tables=WAREHOUSE_TABLES, chunk_size=500):
+        """Upsert rows written locally since the last sync, in chunks; returns rows sent per table."""
+        sent = {}
+        for table in tables:
+            last_id = self._last_synced_id(table)
+            rows = self.query(f'SELECT * FROM {table} WHERE id > ? ORDER BY id', (last_id,))
+            if not rows:
+                continue
+            with UpsertBuffer(client, chunk_size=chunk_size) as buffer:
+                buffer.add_many(table, ({k: v for k, v in row.items() if k not in ('id', 'created_at')} for row in rows))
+                ok = buffer.flush()
+            if not ok:
+                logger.error(f"Sync of {table} failed; will retry from id {last_id}")
+                continue
+            self._mark_synced(table, rows[-1]['id'])
+            sent[table] = len(rows)
+        return sent
+
+_default_warehouse = None
+_default_lock = threading.Lock()
+
+def get_warehouse():
+    """The process-wide warehouse on SQLITE_DB_PATH, opened on first use."""
+    global _default_warehouse
+    if _default_warehouse is None:
+        with _default_lock:
+            if _default_warehouse is None:
+                _default_warehouse = Warehouse()
+    return _default_warehouse
@@ -0,0 +1,50 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+# Shared between the ingestion pipeline (writers) and the Discord bot (reader)
+CACHE_VERSIONS_PATH = os.getenv(
+    "CACHE_VERSIONS_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data_pipeline", "cache_versions.json"),
+)
+ALL_KEYS = "*"
+
+_lock = threading.Lock()
+
+def cache_key(value: str) -> str:
+    """Normalized cache key for a team/sport name, so "cubs" and "Cubs " share an entry."""
+    return " ".join(value.split()).casefold()
+
+def read_versions(path: str = CACHE_VERSIONS_PATH) -> Dict[str, Dict[str, float]]:
+    """{namespace: {key: time it was last invalidated}}; empty if nothing was ever invalidated."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def invalidate(namespace: str, key: Optional[str] = None, path: str = CACHE_VERSIONS_PATH):
+    """Mark cached reads of `namespace` (one key, or all of it) stale after new data was written.
+
+    Readers compare these times with when they loaded an entry, so the
+    writer doesn't need to know who is caching what.
+    """
+    with _lock:
+        versions = read_versions(path)
+        versions.setdefault(namespace, {})[cache_key(key) if key else ALL_KEYS] = time.time()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(versions, f)
+        os.replace(tmp_path, path)
+
+def invalidated_at(versions: Dict[str, Dict[str, float]], namespace: str, key: Optional[str] = None) -> float:
+    """Latest invalidation time that applies to one cached key."""
+    entries = versions.get(namespace, {})
+    return max(entries.get(ALL_KEYS, 0.0), entries.get(cache_key(key), 0.0) if key else 0.0)
+
+def latest_invalidation(versions: Dict[str, Dict[str, float]], namespace: str) -> float:
+    """Latest invalidation of any key in `namespace`, for caches built from all of it."""
+    return max(versions.get(namespace, {}).values(), default=0.0)
@@ -1,9 +1,11 @@
-import requests
 import csv
 import os
 from bs4 import BeautifulSoup
 import sys
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'sports_scripts')))
+from http_cache import cached_get
+
 def fetch_player_splits(player_id, player_name):
     """Fetch player splits data from ESPN"""
     url = f"https://www.espn.com/mlb/player/splits/_/id/{player_id}/{player_name.lower().replace(' ', '-')}"
@@ -12,7 +14,7 @@ def fetch_player_splits(player_id, player_name):
     }
     
     print(f"Fetching data for {player_name} (ID: {player_id}) from {url}")
-    response = requests.get(url, headers=headers)
+    response = cached_get(url, headers=headers)
 
     print(f"Status Code: {response.status_code}")
     if response.status_code != 200:
@@ -0,0 +1,102 @@
+import glob
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from typing import Dict, Iterable, Set
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from database.supabase_client import get_client
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'sql', 'migrations'))
+SCHEMA_TTL = 3600  # seconds between live checks of the same table
+
+CREATE_TABLE_RE = re.compile(r'CREATE TABLE(?: IF NOT EXISTS)?\s+(?:public\.)?(\w+)\s*\((.*?)\);', re.IGNORECASE | re.DOTALL)
+ADD_COLUMN_RE = re.compile(r'ALTER TABLE\s+(?:public\.)?(\w+)\s+ADD COLUMN(?: IF NOT EXISTS)?\s+(\w+)', re.IGNORECASE)
+IDENTIFIER_RE = re.compile(r'^[A-Za-z_]\w*$')
+NOT_A_COLUMN = {'constraint', 'primary', 'unique', 'foreign', 'check'}
+
+def load_migration_columns(migrations_dir: str = MIGRATIONS_DIR) -> Dict[str, Set[str]]:
+    """Columns per table as declared by the .sql migrations, applied in file order."""
+    tables: Dict[str, Set[str]] = {}
+    for path in sorted(glob.glob(os.path.join(migrations_dir, '*.sql'))):
+        with open(path, 'r') as file:
+            sql = file.read()
+        for table, body in CREATE_TABLE_RE.findall(sql):
+            columns = set()
+            for line in body.split(','):
+                words = line.split()
+                # Skips constraints and the tail of split types like NUMERIC(5,2)
+                if words and IDENTIFIER_RE.match(words[0]) and words[0].lower() not in NOT_A_COLUMN:
+                    columns.add(words[0].lower())
+            tables[table.lower()] = columns
+        for table, column in ADD_COLUMN_RE.findall(sql):
+            tables.setdefault(table.lower(), set()).add(column.lower())
+    return tables
+
+class SchemaRegistry:
+    """Answers "does this table have these columns?" without a round trip per item.
+
+    Requested columns are checked locally against the migrations; the live
+    table is probed at most once per `ttl` seconds to confirm the migrations
+    were actually applied. Results, good or bad, are cached for the TTL.
+    """
+
+    def __init__(self, migrations_dir: str = MIGRATIONS_DIR, ttl: float = SCHEMA_TTL, client_getter=get_client):
+        self.migrations_dir = migrations_dir
+        self.ttl = ttl
+        self.client_getter = client_getter
+        self._expected = None
+        self._checked = {}  # table -> (ok, checked_at)
+        self._lock = threading.Lock()
+
+    def expected_columns(self, table: str) -> Set[str]:
+        """Columns the migrations declare for a table (parsed once)."""
+        if self._expected is None:
+            self._expected = load_migration_columns(self.migrations_dir)
+        return self._expected.get(table, set())
+
+    def _probe(self, table: str) -> bool:
+        """Select every migration column once; fails if any is missing from the live table."""
+        columns = sorted(self.expected_columns(table))
+        try:
+            self.client_getter().table(table).select(','.join(columns)).limit(1).execute()
+            logger.info(f"{table} schema validated against migrations")
+            return True
+        except Exception as e:
+            logger.error(f"{table} schema validation failed: {e}")
+            return False
+
+    def validate(self, table: str, columns: Iterable[str]) -> bool:
+        """True if the table has all `columns`, per the migrations and a cached live check."""
+        missing = set(columns) - self.expected_columns(table)
+        if missing:
+            logger.error(f"{table} has no migration for columns: {', '.join(sorted(missing))}")
+            return False
+        with self._lock:
+            cached = self._checked.get(table)
+            if cached and time.monotonic() - cached[1] < self.ttl:
+                return cached[0]
+            ok = self._probe(table)
+            self._checked[table] = (ok, time.monotonic())
+            return ok
+
+    def invalidate(self, table: str = None):
+        """Force the next validate() to re-probe one table, or all tables and migrations."""
+        with self._lock:
+            if table:
+                self._checked.pop(table, None)
+            else:
+                self._checked.clear()
+                self._expected = None
+
+# Process-wide registry the fetchers share
+registry = SchemaRegistry()
+
+def validate_schema(table: str, columns: Iterable[str]) -> bool:
+    """Check a table's columns through the shared registry."""
+    return registry.validate(table, columns)
@@ -0,0 +1,73 @@
+from dotenv import load_dotenv
+import os
+import threading
+from typing import Callable, Dict, Optional
+
+from supabase import create_client, Client
+
+# Which environment variable holds the key for each role
+ROLE_KEYS = {
+    "anon": "SUPABASE_KEY",
+    "service": "SUPABASE_SERVICE_ROLE_KEY",
+}
+
+_clients: Dict[str, Client] = {}
+_lock = threading.Lock()
+_factory: Optional[Callable[[str], Client]] = None
+
+def default_factory(role: str) -> Client:
+    """Build a real Supabase client for a role from SUPABASE_URL and the role's key."""
+    load_dotenv()
+    load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), ".env"))
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv(ROLE_KEYS[role])
+    if not url or not key:
+        raise ValueError(f"Missing SUPABASE_URL or {ROLE_KEYS[role]} in environment variables.")
+    return create_client(url, key)
+
+def set_client_factory(factory: Optional[Callable[[str], Client]]):
+    """Swap in a factory(role) -> client, e.g. a local stand-in for offline runs and tests.
+
+    Clients already handed out are dropped so the next get_client() uses the
+    new factory. Pass None to go back to real Supabase clients.
+    """
+    global _factory
+    with _lock:
+        _factory = factory
+        _clients.clear()
+
+def get_client(role: str = "anon") -> Client:
+    """Return the process-wide client for a role, creating it on first use.
+
+    Every caller shares one client per role, and with it one HTTP connection
+    pool, instead of paying a TLS handshake per module or per call.
+    """
+    if role not in ROLE_KEYS:
+        raise ValueError(f"Unknown Supabase role '{role}', expected one of {sorted(ROLE_KEYS)}")
+    client = _clients.get(role)
+    if client is None:
+        with _lock:
+            client = _clients.get(role)
+            if client is None:
+                client = (_factory or default_factory)(role)
+                _clients[role] = client
+    return client
+
+def reset_clients():
+    """Forget every cached client; the next get_client() builds fresh ones."""
+    with _lock:
+        _clients.clear()
+
+class LazyClient:
+    """Module-level stand-in for a client that is only created on first attribute access.
+
+    Lets modules keep `supabase.table(...)` call sites without connecting at import:
+
+        supabase = LazyClient("anon")
+    """
+
+    def __init__(self, role: str = "anon"):
+        self.role = role
+
+    def __getattr__(self, name):
+        return getattr(get_client(self.role), name)
@@ -1,21 +1,12 @@
-from dotenv import load_dotenv
 import os
-from supabase import create_client, Client
+import sys
 from typing import List, Dict
 
-# Load environment variables from .env file in the same directory
-load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), ".env"))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from database.supabase_client import LazyClient
 
-# Retrieve credentials
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-
-# Validate credentials
-if not SUPABASE_URL or not SUPABASE_KEY:
-    raise Exception("Missing SUPABASE_URL or SUPABASE_KEY in environment variables.")
-
-# Create Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Shared Supabase client; credentials are read from database/.env on first use
+supabase = LazyClient("anon")
 
 def insert_rows(table_name: str, rows: List[Dict]):
     """Insert multiple rows into a Supabase table."""
@@ -1,14 +1,10 @@
 import discord
 from discord.ext import commands
-from supabase import create_client
 import os
-from dotenv import load_dotenv
+import sys
 
-# Load environment variables
-load_dotenv()
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from discord_bot.utils.db import fetch_roster
 
 class Roster(commands.Cog):
     def __init__(self, bot):
@@ -20,8 +16,7 @@ class Roster(commands.Cog):
         !roster Yankees -> returns player list for Yankees from Supabase
         """
         try:
-            response = supabase.table("roster_data").select("*").eq("team_name", team_name).execute()
-            players = response.data
+            players = await fetch_roster(team_name)
 
             if not players:
                 await ctx.send(f"No roster found for `{team_name}`.")
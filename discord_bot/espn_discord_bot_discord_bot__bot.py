@@ -1,10 +1,13 @@
 import discord
 from discord.ext import commands
-from supabase import create_client
 import os
+import sys
 from dotenv import load_dotenv
 import logging
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from discord_bot.utils.db import fetch_team_odds
+
 # Set up logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -45,14 +48,16 @@ async def on_ready():
 async def odds(ctx, *, team_name):
     logger.info(f"Received !odds command for {team_name}")
     try:
-        supabase = create_client(supabase_url, supabase_key)
-        logger.info("Supabase client initialized")
-        response = supabase.table("odds_data").select("*").eq("team_name", team_name).execute()
-        if response.data:
-            for game in response.data:
+        # Cached and coalesced per team; the query itself runs off the event loop
+        games = await fetch_team_odds(team_name)
+        if games:
+            for game in games:
+                markets = game["markets"]
+                h2h, spreads, totals = markets.get("h2h", {}), markets.get("spreads", {}), markets.get("totals", {})
                 await ctx.send(
-                    f"{game['team_name']} vs {game['opponent']} ({game['game_date']}): "
-                    f"Moneyline: {game['moneyline_odds']}, Spread: {game['spread']}, O/U: {game['over_under']}"
+                    f"{game['away_team']} @ {game['home_team']} ({game['commence_time'][:10]}, {game['bookmaker']}): "
+                    f"Moneyline: {h2h.get('away_price')}/{h2h.get('home_price')}, "
+                    f"Spread: {spreads.get('home_point')}, O/U: {totals.get('total_point')}"
                 )
         else:
             await ctx.send(f"No odds found for {team_name}")
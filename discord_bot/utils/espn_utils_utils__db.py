@@ -1,5 +1,158 @@
 # This will manage database interactions for odds, users, and predictions
+import asyncio
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from database.cache_invalidation import CACHE_VERSIONS_PATH, cache_key, invalidated_at, read_versions
+from database.supabase_client import get_client
+
+logger = logging.getLogger(__name__)
+
+ODDS_TTL = 30  # seconds; lines move quickly around first pitch
+ROSTER_TTL = 3600
+PREFERRED_BOOKMAKER = os.getenv("ODDS_BOOKMAKER", "draftkings")
+
+class TTLCache:
+    """In-memory cache for bot reads, keyed by (namespace, key), e.g. ("odds", "cubs").
+
+    - Loaders are blocking Supabase calls and run in a worker thread, never on the event loop.
+    - Concurrent requests for the same key share one in-flight load instead of each querying.
+    - Entries expire after their TTL, or as soon as the pipeline calls
+      database.cache_invalidation.invalidate() for their namespace/key; the
+      versions file is re-read only when its mtime changes.
+    """
+
+    def __init__(self, versions_path=CACHE_VERSIONS_PATH):
+        self.versions_path = versions_path
+        self._entries = {}  # (namespace, key) -> (value, expires_at, loaded_at)
+        self._inflight = {}  # (namespace, key) -> asyncio.Future
+        self._versions = {}
+        self._versions_mtime = None
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+    def _refresh_versions(self):
+        try:
+            mtime = os.stat(self.versions_path).st_mtime
+        except FileNotFoundError:
+            return
+        if mtime != self._versions_mtime:
+            self._versions_mtime = mtime
+            self._versions = read_versions(self.versions_path)
+
+    def _fresh(self, namespace, key):
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        value, expires_at, loaded_at = entry
+        self._refresh_versions()
+        if time.monotonic() >= expires_at or invalidated_at(self._versions, namespace, key) >= loaded_at:
+            del self._entries[(namespace, key)]
+            return None
+        return entry
+
+    async def get(self, namespace, key, loader, ttl, cache_empty=True):
+        """Cached value for (namespace, key), calling the blocking `loader()` off-loop on a miss.
+
+        With cache_empty=False an empty result is returned but not stored, so
+        a lookup that found nothing is retried on the next request.
+        """
+        key = cache_key(key)
+        entry = self._fresh(namespace, key)
+        if entry is not None:
+            self.stats["hits"] += 1
+            return entry[0]
+        inflight = self._inflight.get((namespace, key))
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        self.stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[(namespace, key)] = future
+        loaded_at = time.time()
+        try:
+            value = await asyncio.to_thread(loader)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # retrieved here so waiter-less failures aren't logged as unhandled
+            else:
+                future.cancel()  # the leader was cancelled; don't leave followers waiting forever
+            raise
+        else:
+            if value or cache_empty:
+                self._entries[(namespace, key)] = (value, time.monotonic() + ttl, loaded_at)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop((namespace, key), None)
+
+    def invalidate(self, namespace, key=None):
+        """Drop cached entries for a namespace (or one key of it) in this process."""
+        for cached in [k for k in self._entries if k[0] == namespace and (key is None or k[1] == cache_key(key))]:
+            del self._entries[cached]
+
+cache = TTLCache()
+
+def team_filter(team_name):
+    # Commas and parentheses would break PostgREST's or=() syntax
+    team = "".join(ch for ch in team_name if ch not in ",()").strip()
+    return f"home_team.ilike.*{team}*,away_team.ilike.*{team}*"
+
+def load_team_odds(team_name, sport="MLB", bookmaker=PREFERRED_BOOKMAKER):
+    """Latest moneyline, spread and total for a team's upcoming games (blocking)."""
+    now = datetime.now(timezone.utc)
+    rows = (
+        get_client().table("odds_snapshots")
+        .select("event_id,commence_time,home_team,away_team,bookmaker,market,home_price,away_price,"
+                "home_point,over_price,under_price,total_point,captured_at")
+        .eq("sport", sport)
+        .or_(team_filter(team_name))
+        .gte("commence_time", (now - timedelta(hours=4)).isoformat())
+        .lte("commence_time", (now + timedelta(days=3)).isoformat())
+        .order("captured_at")
+        .execute()
+        .data
+    )
+    games = {}
+    for row in rows:
+        game = games.setdefault(row["event_id"], {
+            "home_team": row["home_team"], "away_team": row["away_team"],
+            "commence_time": row["commence_time"], "markets": {}, "bookmaker": None,
+        })
+        # Stick to one book per game so the three markets are comparable; prefer the configured one
+        if game["bookmaker"] is None or (row["bookmaker"] == bookmaker and game["bookmaker"] != bookmaker):
+            game["bookmaker"], game["markets"] = row["bookmaker"], {}
+        if row["bookmaker"] == game["bookmaker"]:
+            game["markets"][row["market"]] = row  # rows are in capture order, so the last one wins
+    return sorted(games.values(), key=lambda game: game["commence_time"])
+
+def load_odds(sport="MLB"):
+    """Today's odds_data rows for a sport (blocking)."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    return get_client().table("odds_data").select("*").eq("sport", sport).gte("game_date", today).order("game_date").execute().data
+
+def load_roster(team_name):
+    """roster_data rows for a team (blocking), matched the way the cache keys it: case and spacing ignored."""
+    team = " ".join(team_name.split())
+    # Escape LIKE wildcards so ilike is a case-insensitive equality
+    pattern = "".join(f"\\{ch}" if ch in "\\%_" else ch for ch in team)
+    return get_client().table("roster_data").select("player_name,position,age").ilike("team_name", pattern).execute().data
+
+async def fetch_team_odds(team_name, sport="MLB"):
+    return await cache.get("odds", f"{sport}:{team_name}", lambda: load_team_odds(team_name, sport), ODDS_TTL)
+
+async def fetch_odds(sport="MLB"):
+    return await cache.get("odds", sport, lambda: load_odds(sport), ODDS_TTL)
+
+async def fetch_roster(team_name):
+    # A misspelled team shouldn't hide the roster for an hour once it's stored
+    return await cache.get("roster", team_name, lambda: load_roster(team_name), ROSTER_TTL, cache_empty=False)
 
 def get_user_data(discord_id):
     # TODO: Connect to DB and fetch user info
-    return None
\ No newline at end of file
+    return None
@@ -0,0 +1,215 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from urllib.parse import urlparse
+
+import aiohttp
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from http_cache import default_cache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+}
+
+# site.web.api athlete endpoints
+ATHLETE_URL = "https://site.web.api.espn.com/apis/common/v3/sports/baseball/mlb/athletes/{athlete_id}/{endpoint}?season={season}"
+ENDPOINTS = ("gamelog", "splits")
+
+# Status codes worth retrying (throttled or transient upstream errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second with bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class RetryableStatus(Exception):
+    """Raised for responses that should be retried."""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+class ESPNAthleteClient:
+    """Concurrent client for the ESPN athlete gamelog/splits endpoints.
+
+    Use as an async context manager so one keep-alive connection pool is shared
+    by every request:
+
+        async with ESPNAthleteClient() as client:
+            data = await client.fetch_athlete("4142424", "gamelog")
+    """
+
+    def __init__(self, max_concurrency=16, rate_per_host=8.0, burst=16, max_retries=4, backoff_base=0.5, timeout=15,
+                 cache=None, use_cache=True):
+        self.max_concurrency = max_concurrency
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+        # Shared on-disk HTTP cache: fresh hits skip the network, stale ones revalidate
+        self.cache = (cache or default_cache()) if use_cache else None
+        self._buckets = {}
+        self._semaphore = None
+        self._session = None
+
+    async def __aenter__(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=30)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+        self._session = None
+
+    def _bucket(self, url):
+        """Token bucket for the URL's host, created on first use."""
+        host = urlparse(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate_per_host, self.burst)
+        return self._buckets[host]
+
+    def _backoff(self, attempt, retry_after=None):
+        """Full-jitter exponential backoff, never shorter than a server Retry-After."""
+        delay = random.uniform(0, self.backoff_base * (2 ** attempt))
+        if retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+    async def get_json(self, url):
+        """GET a JSON URL with rate limiting and retries; returns None on failure.
+
+        A body that isn't JSON (an HTML error page, a truncated 200) counts as
+        a failure and is never cached; a cached one is refetched.
+        """
+        conditional = {}
+        if self.cache is not None:
+            cached = self.cache.fresh(url)
+            if cached is not None:
+                try:
+                    return cached.json()
+                except ValueError:
+                    # Refetch without validators, or a 304 would serve the same body
+                    logger.debug(f"Cached body for {url} is not JSON; refetching")
+            else:
+                conditional = self.cache.validators(url)
+            if self.cache.offline:
+                logger.warning(f"{url} has no usable cached JSON and HTTP_CACHE_OFFLINE is set")
+                return None
+        bucket = self._bucket(url)
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await bucket.acquire()
+                retry_after = None
+                try:
+                    async with self._session.get(url, headers=conditional) as response:
+                        if response.status == 304 and self.cache is not None:
+                            revalidated = self.cache.revalidated_response(url)
+                            if revalidated is not None:
+                                try:
+                                    return revalidated.json()
+                                except ValueError:
+                                    pass  # a cached body that isn't JSON is fetched again in full
+                            conditional = {}
+                            raise RetryableStatus(304, None)
+                        if response.status in RETRY_STATUSES:
+                            header = response.headers.get("Retry-After", "")
+                            raise RetryableStatus(response.status, float(header) if header.isdigit() else None)
+                        response.raise_for_status()
+                        body = await response.read()
+                        try:
+                            data = json.loads(body)
+                        except ValueError:
+                            logger.warning(f"Giving up on {url}: response is not JSON")
+                            return None
+                        if self.cache is not None:
+                            self.cache.store(url, body, response.headers)
+                        return data
+                except RetryableStatus as e:
+                    retry_after = e.retry_after
+                    error = e
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    status = getattr(e, "status", None)
+                    if status is not None and status < 500:
+                        logger.warning(f"Giving up on {url}: {e}")
+                        return None
+                    error = e
+                if attempt == self.max_retries:
+                    logger.warning(f"Failed to fetch {url} after {attempt + 1} attempts: {error}")
+                    return None
+                delay = self._backoff(attempt, retry_after)
+                logger.debug(f"Retrying {url} in {delay:.2f}s ({error})")
+                await asyncio.sleep(delay)
+        return None
+
+    async def fetch_athlete(self, athlete_id, endpoint, season=2025):
+        """Fetch one athlete endpoint ('gamelog' or 'splits')."""
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown athlete endpoint: {endpoint}")
+        return await self.get_json(ATHLETE_URL.format(athlete_id=athlete_id, endpoint=endpoint, season=season))
+
+    async def fetch_many(self, athlete_ids, endpoints=ENDPOINTS, season=2025):
+        """Fetch every (athlete, endpoint) pair concurrently.
+
+        Returns {(athlete_id, endpoint): payload or None}.
+        """
+        keys = [(athlete_id, endpoint) for athlete_id in athlete_ids for endpoint in endpoints]
+        results = await asyncio.gather(*(self.fetch_athlete(athlete_id, endpoint, season) for athlete_id, endpoint in keys),
+                                       return_exceptions=True)
+        payloads = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to fetch {key[1]} for athlete {key[0]}: {result}")
+                result = None
+            payloads[key] = result
+        return payloads
+
+def fetch_athletes(athlete_ids, endpoints=ENDPOINTS, season=2025, **client_options):
+    """Blocking wrapper around ESPNAthleteClient.fetch_many for synchronous callers."""
+    async def _run():
+        async with ESPNAthleteClient(**client_options) as client:
+            return await client.fetch_many(athlete_ids, endpoints, season)
+
+    started = time.monotonic()
+    results = asyncio.run(_run())
+    failed = sum(1 for payload in results.values() if payload is None)
+    logger.info(f"Fetched {len(results) - failed}/{len(results)} athlete payloads in {time.monotonic() - started:.1f}s")
+    return results
+
+if __name__ == "__main__":
+    payloads = fetch_athletes(["4142424"])
+    for (athlete_id, endpoint), payload in payloads.items():
+        print(f"{athlete_id} {endpoint}: {'ok' if payload else 'failed'}")
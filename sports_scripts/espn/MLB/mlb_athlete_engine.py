@@ -0,0 +1,302 @@
+import csv
+import json
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from mlb_async_client import fetch_athletes
+from mlb_gamelog_parser import GAMELOG_HEADERS, parse_gamelog
+from mlb_splits_normalizer import splits_table
+from mlb_teams import BASE_DIR, fetch_team_rosters
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from http_cache import cached_get
+from run_report import RunReport, verbose_requested
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../data_pipeline/storage')))
+from parquet_store import keep_csv, scrape_sink
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SEASON = 2025
+MAX_WORKERS = 8
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+}
+
+# API endpoints and pages, formatted per athlete
+SPLITS_URL = "https://site.web.api.espn.com/apis/common/v3/sports/baseball/mlb/athletes/{player_id}/splits?season={season}"
+GAMELOG_URL = "https://site.web.api.espn.com/apis/common/v3/sports/baseball/mlb/athletes/{player_id}/gamelog?season={season}"
+STATS_URL = "https://www.espn.com/mlb/player/stats/_/id/{player_id}/{player_name_slug}"
+
+STATS_COLUMNS = ["SEASON", "TEAM", "G", "AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "SO", "SB", "CS", "AVG", "OBP", "SLG", "OPS"]
+PERCENTAGE_COLUMNS = ["AVG", "OBP", "SLG", "OPS"]
+
+# One HTTP session per worker thread so connections are kept alive between athletes
+_thread_state = threading.local()
+
+def get_session():
+    """Return the calling worker's shared HTTP session."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_state.session = session
+    return session
+
+def player_name_dir(player_name):
+    """Folder-safe version of a player name (matches the generated script layout)."""
+    return player_name.lower().replace(" ", "_").replace(".", "").replace("'", "").encode('ascii', 'ignore').decode('ascii')
+
+def player_name_slug(player_name):
+    """URL slug version of a player name."""
+    return player_name.lower().replace(" ", "-").replace(".", "").replace("'", "").encode('ascii', 'ignore').decode('ascii')
+
+def build_athletes(team_rosters):
+    """Flatten fetch_team_rosters() output into one record per athlete."""
+    athletes = []
+    for team, team_data in team_rosters.items():
+        team_name = team.replace("-", " ").title()
+        for player in team_data["players"]:
+            name_dir = player_name_dir(player["name"])
+            athletes.append({
+                "player_id": player["id"],
+                "player_name": player["name"],
+                "player_name_dir": name_dir,
+                "player_name_slug": player_name_slug(player["name"]),
+                "team": team,
+                "team_id": team_data["team_id"] or "N/A",
+                "team_name": team_name,
+                "output_dir": os.path.join(BASE_DIR, team, name_dir)
+            })
+    return athletes
+
+def fetch_json(url, entry=None):
+    """GET a JSON endpoint through the HTTP cache; counts bytes on the job entry."""
+    response = cached_get(url, session=get_session())
+    response.raise_for_status()
+    if entry is not None:
+        entry.bytes += len(response.content)
+    return response.json()
+
+def fetch_html(url, entry=None):
+    """GET an HTML page through the HTTP cache; counts bytes on the job entry."""
+    response = cached_get(url, session=get_session())
+    response.raise_for_status()
+    if entry is not None:
+        entry.bytes += len(response.content)
+    return response.text
+
+def athlete_json(athlete, endpoint, url, entry=None):
+    """Use the prefetched payload for an endpoint when there is one, else GET it."""
+    payload = athlete.get("payloads", {}).get(endpoint)
+    if payload is None:
+        return fetch_json(url, entry)
+    if entry is not None:
+        entry.extra["prefetched"] = True
+    return payload
+
+def prefetch_payloads(athletes):
+    """Pull every athlete's gamelog and splits JSON concurrently before the jobs run."""
+    payloads = fetch_athletes([athlete["player_id"] for athlete in athletes], season=SEASON)
+    for athlete in athletes:
+        athlete["payloads"] = {
+            endpoint: payloads.get((athlete["player_id"], endpoint))
+            for endpoint in ("gamelog", "splits")
+        }
+
+def coerce_columns(df, numeric_columns):
+    """Convert counting stats to numbers and keep rate stats as formatted strings."""
+    for col in numeric_columns:
+        if col in df:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    for col in PERCENTAGE_COLUMNS:
+        if col in df:
+            df[col] = df[col].astype(str)
+    return df
+
+def save_csv(df, athlete, dataset):
+    """Store one athlete's table: into the run's Parquet sink, and/or a dated per-athlete CSV
+    in the same place the generated scripts used."""
+    sink = athlete.get("sink")
+    if sink is not None:
+        sink.add(f"espn_{dataset}", df, season=SEASON, player_id=str(athlete["player_id"]),
+                 player_name=athlete["player_name"], team_id=str(athlete["team_id"]))
+    if not keep_csv(sink):
+        return None
+    os.makedirs(athlete["output_dir"], exist_ok=True)
+    output_file = os.path.join(
+        athlete["output_dir"],
+        f"{athlete['player_name_dir']}_{dataset}_{SEASON}_{datetime.now().strftime('%Y%m%d')}.csv"
+    )
+    df.to_csv(output_file, index=False)
+    logger.debug(f"Saved {dataset} for {athlete['player_name']} to {output_file}")
+    return output_file
+
+def parse_splits(data):
+    """Parse the splits API response into a DataFrame of requested splits."""
+    return splits_table(data)
+
+def parse_stats(html):
+    """Parse the player stats page into a DataFrame."""
+    soup = BeautifulSoup(html, "html.parser")
+    rows = []
+    for table in soup.find_all("table"):
+        for row in table.find_all("tr")[1:]:  # Skip header
+            row_data = [col.text.strip() for col in row.find_all("td") if col.text.strip()]
+            if len(row_data) >= 2:  # Ensure at least SEASON and TEAM
+                rows.append(row_data)
+    if not rows:
+        return pd.DataFrame()
+    width = len(rows[0])
+    df = pd.DataFrame([row[:width] for row in rows], columns=STATS_COLUMNS[:width])
+    return coerce_columns(df, ["G", "AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "SO", "SB", "CS"])
+
+def run_splits_job(athlete, entry):
+    """Fetch, parse and save one athlete's splits."""
+    data = athlete_json(athlete, "splits", SPLITS_URL.format(player_id=athlete["player_id"], season=SEASON), entry)
+    with entry.parsing():
+        df = parse_splits(data)
+    if df.empty:
+        return 0
+    save_csv(df, athlete, "splits")
+    return len(df)
+
+def run_stats_job(athlete, entry):
+    """Fetch, parse and save one athlete's season stats table."""
+    html = fetch_html(STATS_URL.format(player_id=athlete["player_id"], player_name_slug=athlete["player_name_slug"]), entry)
+    with entry.parsing():
+        df = parse_stats(html)
+    if df.empty:
+        return 0
+    save_csv(df, athlete, "stats")
+    return len(df)
+
+def run_batvspitch_job(athlete, entry):
+    """Fetch (through the day's MatchupCache), parse and save one athlete's bat vs pitch table.
+
+    Pages crawled here are reused by mlb_batvspitch.build_matrix and vice
+    versa. The rows go into the run's BatVsPitchMatrix, which run_engine
+    stores as espn_batvspitch; only the legacy per-athlete CSV is written here.
+    """
+    from mlb_batvspitch import fetch_matchups  # mlb_batvspitch imports this module
+    player_id, team_id = str(athlete["player_id"]), str(athlete["team_id"])
+    matchups = fetch_matchups(player_id, team_id, athlete["matchup_cache"], entry)
+    athlete["matrix"].add(player_id, athlete["player_name"], team_id, matchups)
+    if matchups and keep_csv(athlete.get("sink")):
+        df = pd.DataFrame(matchups).rename(columns={"pitcher_name": "PITCHER"})
+        df = coerce_columns(df, ["AB", "H", "2B", "3B", "HR", "RBI", "BB", "SO"])
+        save_csv(df, dict(athlete, sink=None), "batvspitch")
+    return len(matchups)
+
+def sink_gamelog_rows(sink, athlete, rows, season=SEASON):
+    """Queue an athlete's game rows (not the season totals) as espn_gamelog; no-op without a sink."""
+    games = [row for row in rows if row.month != "Total"]
+    if sink is None or not games:
+        return
+    # Typed stats go to Parquet directly; no round trip through the formatted strings
+    frame = pd.DataFrame([
+        dict(row.stats, game_id=row.game_id, month=row.month, game_date=row.date, teams=row.teams, result=row.result)
+        for row in games
+    ])
+    sink.add("espn_gamelog", frame, season=season, player_id=str(athlete["player_id"]),
+             player_name=athlete["player_name"], team_id=str(athlete["team_id"]))
+
+def run_gamelog_job(athlete, entry):
+    """Fetch, parse and save one athlete's gamelog plus debug output."""
+    player_id = athlete["player_id"]
+    data = athlete_json(athlete, "gamelog", GAMELOG_URL.format(player_id=player_id, season=SEASON), entry)
+
+    output_dir = athlete["output_dir"]
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, f"raw_response_{player_id}_{SEASON}.json"), 'w') as f:
+        json.dump(data, f, indent=2)
+
+    with entry.parsing():
+        rows, problematic_games = parse_gamelog(data, athlete["team_id"], athlete["team_name"], SEASON)
+        csv_data = [row.csv_row() for row in rows]
+    sink = athlete.get("sink")
+    sink_gamelog_rows(sink, athlete, rows)
+    if csv_data and keep_csv(sink):
+        output_file = os.path.join(output_dir, f"{athlete['player_name_dir']}_gamelog.csv")
+        with open(output_file, 'w', newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=GAMELOG_HEADERS)
+            writer.writeheader()
+            writer.writerows(csv_data)
+    if problematic_games:
+        with open(os.path.join(output_dir, f"debug_player_{player_id}_{SEASON}.json"), 'w') as f:
+            json.dump(problematic_games, f, indent=2)
+    return len(csv_data)
+
+# The four per-athlete jobs that used to be generated as separate scripts
+JOBS = {
+    "splits": run_splits_job,
+    "stats": run_stats_job,
+    "batvspitch": run_batvspitch_job,
+    "gamelog": run_gamelog_job
+}
+
+def run_job(report, job, athlete):
+    """Run one job under the report; failures are recorded rather than raised."""
+    try:
+        with report.job(athlete["player_id"], job) as entry:
+            entry.extra["player_name"] = athlete["player_name"]
+            entry.rows = JOBS[job](athlete, entry)
+    except Exception as e:
+        logger.debug(f"{job} failed for {athlete['player_name']} (ID: {athlete['player_id']}): {e}")
+
+def run_engine(team_rosters, jobs=None, max_workers=MAX_WORKERS, prefetch=True, verbose=False):
+    """Run every requested job for every athlete in this process.
+
+    With prefetch, the JSON endpoints (gamelog, splits) are pulled up front by
+    the rate-limited async client; failed prefetches fall back to a plain GET.
+    Each job is written as a JSON line by the run report; only the summary is
+    printed unless verbose. Returns {job: {"ok", "empty", "failed", "rows",
+    "bytes", "parse_ms"}}.
+    """
+    from mlb_batvspitch import BatVsPitchMatrix, MatchupCache  # mlb_batvspitch imports this module
+    jobs = jobs or list(JOBS)
+    athletes = build_athletes(team_rosters)
+    if prefetch and ({"gamelog", "splits"} & set(jobs)):
+        prefetch_payloads(athletes)
+    matchup_cache, matrix = (MatchupCache(), BatVsPitchMatrix()) if "batvspitch" in jobs else (None, None)
+    logger.info(f"Running {len(jobs)} jobs for {len(athletes)} athletes with {max_workers} workers")
+
+    with RunReport("mlb_athlete_engine", verbose=verbose) as report, scrape_sink() as sink:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for athlete in athletes:
+                # Like the prefetched payloads, the run's sink and matchup state travel with the athlete
+                athlete.update(sink=sink, matchup_cache=matchup_cache, matrix=matrix)
+                for job in jobs:
+                    executor.submit(run_job, report, job, athlete)
+        if sink is not None and matrix is not None and matrix.cells:
+            # One typed, ID-keyed table instead of a frame per athlete
+            sink.add("espn_batvspitch", matrix.to_frame(), season=SEASON)
+    return report.totals()
+
+def main():
+    """Refresh every MLB athlete's splits, stats, bat vs pitch and gamelog in one process."""
+    logger.info("Starting MLB athlete refresh...")
+    team_rosters = fetch_team_rosters()
+    if not team_rosters:
+        logger.error("No rosters found. Exiting.")
+        return
+    run_engine(team_rosters, verbose=verbose_requested())
+    logger.info("MLB athlete refresh complete.")
+
+if __name__ == "__main__":
+    main()
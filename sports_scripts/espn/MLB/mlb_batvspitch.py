@@ -0,0 +1,247 @@
+# League-wide batter vs pitcher matrix built from ESPN's batvspitch pages
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from mlb_athlete_engine import build_athletes, fetch_html
+from mlb_teams import BASE_DIR, fetch_team_rosters
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = 16
+CACHE_DIR = os.path.join(BASE_DIR, "batvspitch_cache")
+CACHE_DAYS = 2  # day directories kept; older ones are removed when a cache is opened
+MATRIX_FILE = os.path.join(BASE_DIR, "batvspitch_matrix_{day}.csv")
+
+BATVSPITCH_URL = "https://www.espn.com/mlb/player/batvspitch/_/id/{player_id}/teamId/{team_id}"
+PITCHER_ID_RE = re.compile(r"/id/(\d+)")
+STAT_COLUMNS = ["AB", "H", "2B", "3B", "HR", "RBI", "BB", "SO", "AVG", "OBP", "SLG", "OPS"]
+COUNT_COLUMNS = ["AB", "H", "2B", "3B", "HR", "RBI", "BB", "SO"]
+
+def parse_batvspitch(html):
+    """Pitcher rows from a batvspitch page, keyed by ESPN pitcher ID where the row links one."""
+    soup = BeautifulSoup(html, "lxml")
+    matchups = []
+    for table in soup.find_all("div", class_="ResponsiveTable"):
+        tbody = table.find("tbody")
+        if not tbody:
+            continue
+        for row in tbody.find_all("tr"):
+            cols = row.find_all("td")
+            if len(cols) <= 1:
+                continue
+            name = cols[0].text.strip()
+            if name.lower() == "totals":
+                continue
+            link = cols[0].find("a", href=True)
+            match = PITCHER_ID_RE.search(link["href"]) if link else None
+            matchup = {"pitcher_id": match.group(1) if match else None, "pitcher_name": name}
+            matchup.update(zip(STAT_COLUMNS, (col.text.strip() for col in cols[1:])))
+            matchups.append(matchup)
+    return matchups
+
+def stat_value(column, value):
+    """A matchup stat as a number: counts are ints (0 when blank), rates floats (None when blank)."""
+    number = pd.to_numeric(value, errors="coerce")
+    if pd.isna(number):
+        return 0 if column in COUNT_COLUMNS else None
+    return int(number) if column in COUNT_COLUMNS else float(number)
+
+class MatchupCache:
+    """Parsed batvspitch pages on disk, one file per (player_id, team_id, date).
+
+    Career matchup lines only move when games are played, so a page fetched
+    today is reused by every later lookup today instead of being crawled again.
+    Each day is a directory of ~24k files; only the last `keep_days` are kept.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, day=None, keep_days=CACHE_DAYS):
+        day = day or date.today()
+        self.root = cache_dir
+        self.day = day.isoformat()
+        self.cache_dir = os.path.join(cache_dir, self.day)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.prune(day - timedelta(days=keep_days - 1))
+
+    def prune(self, oldest):
+        """Remove the day directories from before `oldest`; returns how many were removed."""
+        removed = 0
+        for name in os.listdir(self.root):
+            try:
+                day = date.fromisoformat(name)
+            except ValueError:
+                continue
+            if day < oldest:
+                shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+                removed += 1
+        if removed:
+            logger.info(f"Removed {removed} old batvspitch cache days from {self.root}")
+        return removed
+
+    def path(self, player_id, team_id):
+        return os.path.join(self.cache_dir, f"{player_id}_{team_id}.json")
+
+    def get(self, player_id, team_id):
+        try:
+            with open(self.path(player_id, team_id), "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, player_id, team_id, matchups):
+        tmp_path = self.path(player_id, team_id) + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(matchups, f)
+        os.replace(tmp_path, self.path(player_id, team_id))
+
+def fetch_matchups(player_id, team_id, cache, entry=None):
+    """One (batter, opposing team) page, from the cache when it was already fetched today.
+
+    With a run report `entry`, bytes and parse time are counted on it.
+    """
+    matchups = cache.get(player_id, team_id)
+    if matchups is None:
+        html = fetch_html(BATVSPITCH_URL.format(player_id=player_id, team_id=team_id), entry)
+        if entry is not None:
+            with entry.parsing():
+                matchups = parse_batvspitch(html)
+        else:
+            matchups = parse_batvspitch(html)
+        cache.put(player_id, team_id, matchups)
+    return matchups
+
+class BatVsPitchMatrix:
+    """Sparse batter x pitcher matrix of career matchup lines.
+
+    Only observed pairs are stored, keyed by (batter_id, pitcher_id), so a
+    lookup is a dict hit and a lineup vs tonight's starter is a handful of them.
+    """
+
+    def __init__(self):
+        self.cells = {}
+        self.batters = {}
+        self.pitchers = {}
+        self._lock = threading.Lock()
+
+    def add(self, batter_id, batter_name, team_id, matchups):
+        """Store one page's parsed rows; safe to call from the engine's worker threads."""
+        pitchers, cells = {}, {}
+        for matchup in matchups:
+            # Rows without a pitcher link fall back to the name so they still line up
+            pitcher_id = matchup.get("pitcher_id") or f"name:{matchup['pitcher_name']}"
+            pitchers[pitcher_id] = matchup["pitcher_name"]
+            cells[(batter_id, pitcher_id)] = dict(
+                {column: stat_value(column, matchup.get(column)) for column in STAT_COLUMNS}, team_id=team_id
+            )
+        with self._lock:
+            self.batters[batter_id] = batter_name
+            self.pitchers.update(pitchers)
+            self.cells.update(cells)
+
+    def matchup(self, batter_id, pitcher_id):
+        """Career line for one batter vs one pitcher, or None if they haven't faced each other."""
+        return self.cells.get((str(batter_id), str(pitcher_id)))
+
+    def lineup_vs(self, batter_ids, pitcher_id):
+        """DataFrame of a lineup's career lines against one pitcher (unfaced batters omitted)."""
+        rows = []
+        for batter_id in batter_ids:
+            cell = self.matchup(batter_id, pitcher_id)
+            if cell:
+                rows.append(dict(cell, batter_id=str(batter_id), batter_name=self.batters.get(str(batter_id))))
+        return pd.DataFrame(rows)
+
+    def to_frame(self):
+        """Long format: one row per observed (batter, pitcher) pair."""
+        rows = [
+            dict(cell, batter_id=batter_id, batter_name=self.batters.get(batter_id),
+                 pitcher_id=pitcher_id, pitcher_name=self.pitchers.get(pitcher_id))
+            for (batter_id, pitcher_id), cell in self.cells.items()
+        ]
+        df = pd.DataFrame(rows, columns=["batter_id", "batter_name", "pitcher_id", "pitcher_name", "team_id"] + STAT_COLUMNS)
+        df[COUNT_COLUMNS] = df[COUNT_COLUMNS].fillna(0).astype(int)
+        df[STAT_COLUMNS[len(COUNT_COLUMNS):]] = df[STAT_COLUMNS[len(COUNT_COLUMNS):]].astype(float)
+        return df
+
+    def to_sparse(self, stat="OPS"):
+        """Wide batter x pitcher frame of one stat, stored with a sparse dtype."""
+        df = self.to_frame()
+        wide = df.pivot(index="batter_id", columns="pitcher_id", values=stat)
+        return wide.astype(pd.SparseDtype("float", float("nan")))
+
+    def save(self, path):
+        self.to_frame().to_csv(path, index=False)
+
+    @classmethod
+    def load(cls, path):
+        """Rebuild a matrix from a saved long-format CSV."""
+        matrix = cls()
+        df = pd.read_csv(path, dtype={"batter_id": str, "pitcher_id": str, "team_id": str})
+        for row in df.to_dict("records"):
+            matrix.batters[row["batter_id"]] = row["batter_name"]
+            matrix.pitchers[row["pitcher_id"]] = row["pitcher_name"]
+            matrix.cells[(row["batter_id"], row["pitcher_id"])] = dict(
+                {column: stat_value(column, row[column]) for column in STAT_COLUMNS}, team_id=row["team_id"]
+            )
+        return matrix
+
+def build_matrix(athletes, opponents=None, max_workers=MAX_WORKERS, cache=None):
+    """Fetch every needed (batter, opposing team) page concurrently and assemble the matrix.
+
+    `opponents` maps player_id -> list of team IDs (e.g. only tonight's opponent);
+    by default each batter is crawled against every other club on the rosters.
+    """
+    cache = cache or MatchupCache()
+    league = sorted({str(athlete["team_id"]) for athlete in athletes if athlete["team_id"] != "N/A"})
+    jobs = []
+    for athlete in athletes:
+        team_ids = (opponents or {}).get(athlete["player_id"])
+        if team_ids is None:
+            team_ids = [team_id for team_id in league if team_id != str(athlete["team_id"])]
+        jobs.extend((athlete, team_id) for team_id in team_ids)
+    logger.info(f"Building bat vs pitch matrix from {len(jobs)} pages with {max_workers} workers")
+
+    matrix = BatVsPitchMatrix()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch_matchups, athlete["player_id"], team_id, cache): (athlete, team_id)
+            for athlete, team_id in jobs
+        }
+        failed = 0
+        for future, (athlete, team_id) in futures.items():
+            try:
+                matchups = future.result()
+            except Exception as e:
+                failed += 1
+                logger.debug(f"batvspitch failed for {athlete['player_id']} vs team {team_id}: {e}")
+                continue
+            matrix.add(str(athlete["player_id"]), athlete["player_name"], str(team_id), matchups)
+    logger.info(f"Matrix has {len(matrix.batters)} batters, {len(matrix.pitchers)} pitchers, "
+                f"{len(matrix.cells)} matchups ({failed} pages failed)")
+    return matrix
+
+def load_or_build_matrix(day=None, **kwargs):
+    """Today's saved matrix if it exists, otherwise crawl (through the page cache) and save it."""
+    path = MATRIX_FILE.format(day=(day or date.today()).isoformat())
+    if os.path.exists(path):
+        return BatVsPitchMatrix.load(path)
+    team_rosters = fetch_team_rosters()
+    matrix = build_matrix(build_athletes(team_rosters), cache=MatchupCache(day=day), **kwargs)
+    matrix.save(path)
+    return matrix
+
+def main():
+    matrix = load_or_build_matrix()
+    logger.info(f"Saved {len(matrix.cells)} matchups to {MATRIX_FILE.format(day=date.today().isoformat())}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# Incremental gamelog refresh: append only games played since each player's high-water mark
+import csv
+import json
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pandas as pd
+
+from mlb_athlete_engine import (GAMELOG_URL, MAX_WORKERS, SEASON, build_athletes, fetch_json, get_session,
+                                sink_gamelog_rows)
+from mlb_gamelog_parser import GAMELOG_HEADERS, parse_gamelog
+from mlb_teams import BASE_DIR, fetch_team_rosters
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from http_cache import cached_get
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../data_pipeline/storage')))
+from parquet_store import dataset_path, keep_csv, read_dataset, scrape_sink
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard?dates={day}"
+STATE_FILE = os.path.join(BASE_DIR, "gamelog_watermarks_{season}.json")
+
+class Watermarks:
+    """Per-player high-water marks: the last stored game date and the event IDs on that date.
+
+    Kept in one JSON file for the league so a refresh is a single read and write.
+    """
+
+    def __init__(self, season=SEASON, path=None):
+        self.path = path or STATE_FILE.format(season=season)
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, "r") as f:
+                self.marks = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.marks = {}
+
+    def get(self, player_id):
+        mark = self.marks.get(str(player_id))
+        if not mark:
+            return None, set()
+        return date.fromisoformat(mark["last_game_date"]), set(mark["event_ids"])
+
+    def advance(self, player_id, last_game_date, event_ids):
+        with self._lock:
+            self.marks[str(player_id)] = {"last_game_date": last_game_date.isoformat(), "event_ids": sorted(event_ids)}
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with self._lock:
+            with open(tmp_path, "w") as f:
+                json.dump(self.marks, f)
+        os.replace(tmp_path, self.path)
+
+def teams_played_since(since, until=None):
+    """{team_id: last completed game date} for games after `since`, from one scoreboard call per day."""
+    until = until or date.today()
+    played = {}
+    day = since + timedelta(days=1)
+    while day <= until:
+        response = cached_get(SCOREBOARD_URL.format(day=day.strftime("%Y%m%d")), session=get_session())
+        response.raise_for_status()
+        for event in response.json().get("events", []):
+            if not event.get("status", {}).get("type", {}).get("completed"):
+                continue
+            for competition in event.get("competitions", []):
+                for competitor in competition.get("competitors", []):
+                    team_id = str(competitor.get("team", {}).get("id", competitor.get("id", "")))
+                    played[team_id] = day
+        day += timedelta(days=1)
+    return played
+
+def seed_marks(watermarks, season=SEASON, root=None):
+    """Mark unmarked players at the games a full run already stored in espn_gamelog.
+
+    Without a mark a player's first refresh returns the whole season, which
+    would be stored a second time. Returns the number of players seeded.
+    """
+    if root is None or not os.path.isdir(dataset_path("espn_gamelog", root)):
+        return 0
+    stored = read_dataset("espn_gamelog", columns=["player_id", "game_id", "game_date"],
+                          filters={"season": season}, root=root).dropna(subset=["game_date"])
+    stored["game_date"] = pd.to_datetime(stored["game_date"]).dt.date
+    seeded = 0
+    for player_id, games in stored.groupby("player_id"):
+        if watermarks.get(player_id)[0] is not None:
+            continue
+        newest = games["game_date"].max()
+        watermarks.advance(player_id, newest, set(games.loc[games["game_date"] == newest, "game_id"].astype(str)))
+        seeded += 1
+    return seeded
+
+def new_rows(rows, last_game_date, seen_event_ids):
+    """Game rows after the mark (same-day rows count only if their event is new), oldest first."""
+    fresh = [
+        row for row in rows
+        if row.date is not None and row.month != "Total"
+        and (last_game_date is None or row.date > last_game_date
+             or (row.date == last_game_date and row.game_id not in seen_event_ids))
+    ]
+    return sorted(fresh, key=lambda row: row.date)
+
+def csv_key(row):
+    # The CSV has no event ID; date, matchup and result tell its games apart
+    return row["Date"], row["Teams"], row["Result"]
+
+def merge_rows(path, rows, totals=None):
+    """Add game rows to the player's gamelog CSV, keeping the season totals row last.
+
+    Rows already in the file are skipped and only the totals line is replaced,
+    so the file stays the one run_gamelog_job writes. Returns the rows added.
+    """
+    existing = []
+    if os.path.exists(path):
+        with open(path, "r", newline="") as csvfile:
+            existing = [row for row in csv.DictReader(csvfile) if row.get("Month") != "Total"]
+    stored = {csv_key(row) for row in existing}
+    added = [row for row in rows if csv_key(row.csv_row()) not in stored]
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=GAMELOG_HEADERS)
+        writer.writeheader()
+        writer.writerows(existing)
+        writer.writerows(row.csv_row() for row in added)
+        if totals is not None:
+            writer.writerow(totals.csv_row())
+    os.replace(tmp_path, path)
+    return added
+
+def refresh_athlete(athlete, watermarks, season=SEASON, checked_on=None):
+    """Fetch one gamelog and store the games past the player's mark; returns rows added.
+
+    The mark then moves to the newest game or to `checked_on` (default
+    yesterday), whichever is later, so a player who hasn't played is only
+    refetched once their team plays again.
+    """
+    player_id = athlete["player_id"]
+    last_game_date, seen_event_ids = watermarks.get(player_id)
+    data = fetch_json(GAMELOG_URL.format(player_id=player_id, season=season))
+    rows, _ = parse_gamelog(data, athlete["team_id"], athlete["team_name"], season)
+    games = [row for row in rows if row.date is not None and row.month != "Total"]
+    fresh = new_rows(games, last_game_date, seen_event_ids)
+
+    if fresh:
+        sink = athlete.get("sink")
+        output_dir = athlete["output_dir"]
+        os.makedirs(output_dir, exist_ok=True)
+        if keep_csv(sink):
+            totals = next((row for row in rows if row.month == "Total"), None)
+            fresh = merge_rows(os.path.join(output_dir, f"{athlete['player_name_dir']}_gamelog.csv"), fresh, totals)
+        sink_gamelog_rows(sink, athlete, fresh, season)
+        # Raw events are appended compactly rather than re-dumping the whole season
+        events = data.get("events", {})
+        with open(os.path.join(output_dir, f"raw_events_{player_id}_{season}.jsonl"), "a") as f:
+            for row in fresh:
+                f.write(json.dumps({"eventId": row.game_id, "event": events.get(row.game_id)}) + "\n")
+
+    # Every parsed game is stored now, so the mark can cover all of them
+    checked_on = checked_on or date.today() - timedelta(days=1)
+    mark = max([row.date for row in games] + [checked_on] + ([last_game_date] if last_game_date else []))
+    marked_ids = {row.game_id for row in games if row.date == mark}
+    if mark == last_game_date:
+        marked_ids |= seen_event_ids
+    watermarks.advance(player_id, mark, marked_ids)
+    return len(fresh)
+
+def needs_refresh(athlete, watermarks, played):
+    """A player without a mark always refreshes; otherwise only if the team played after it."""
+    last_game_date, _ = watermarks.get(athlete["player_id"])
+    if last_game_date is None:
+        return True
+    team_last_played = played.get(str(athlete["team_id"]))
+    return team_last_played is not None and team_last_played >= last_game_date
+
+def run_incremental(team_rosters, season=SEASON, max_workers=MAX_WORKERS, until=None):
+    """Refresh every athlete whose team has played since their mark.
+
+    Returns {"refreshed": n, "skipped": n, "failed": n, "rows": n}.
+    """
+    athletes = build_athletes(team_rosters)
+    watermarks = Watermarks(season)
+    checked_on = (until or date.today()) - timedelta(days=1)
+
+    # New games land in the same espn_gamelog dataset the full engine writes
+    with scrape_sink() as sink:
+        if sink is not None:
+            seed_marks(watermarks, season, sink.root)
+        marked = [watermarks.get(athlete["player_id"])[0] for athlete in athletes]
+        known = [mark for mark in marked if mark is not None]
+        played = teams_played_since(min(known), until) if known else {}
+
+        todo = [athlete for athlete in athletes if needs_refresh(athlete, watermarks, played)]
+        summary = {"refreshed": 0, "skipped": len(athletes) - len(todo), "failed": 0, "rows": 0}
+        logger.info(f"{len(todo)} of {len(athletes)} athletes have new games to fetch")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for athlete in todo:
+                athlete["sink"] = sink
+            futures = {executor.submit(refresh_athlete, athlete, watermarks, season, checked_on): athlete
+                       for athlete in todo}
+            for future, athlete in futures.items():
+                try:
+                    summary["rows"] += future.result()
+                    summary["refreshed"] += 1
+                except Exception as e:
+                    summary["failed"] += 1
+                    logger.debug(f"Incremental gamelog failed for {athlete['player_name']} (ID: {athlete['player_id']}): {e}")
+    watermarks.save()
+    logger.info(f"Gamelog refresh: {summary['refreshed']} refreshed, {summary['skipped']} skipped, "
+                f"{summary['failed']} failed, {summary['rows']} new rows")
+    return summary
+
+def main():
+    team_rosters = fetch_team_rosters()
+    if not team_rosters:
+        logger.error("No rosters found. Exiting.")
+        return
+    run_incremental(team_rosters)
+
+if __name__ == "__main__":
+    main()
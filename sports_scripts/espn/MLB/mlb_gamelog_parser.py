@@ -0,0 +1,200 @@
+# Single-pass parser for ESPN athlete gamelog API responses
+import calendar
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dateutil import parser
+
+logger = logging.getLogger(__name__)
+
+# Stat mapping for gamelog headers, in the order ESPN returns the stats
+STAT_MAPPING = [
+    ("AB", "At Bats"),
+    ("R", "Runs"),
+    ("H", "Hits"),
+    ("2B", "Doubles"),
+    ("3B", "Triples"),
+    ("HR", "Home Runs"),
+    ("RBI", "Runs Batted In"),
+    ("BB", "Walks"),
+    ("HBP", "Hit By Pitch"),
+    ("SO", "Strikeouts"),
+    ("SB", "Stolen Bases"),
+    ("CS", "Caught Stealing"),
+    ("AVG", "Batting Average"),
+    ("OBP", "On Base Percentage"),
+    ("SLG", "Slugging Percentage"),
+    ("OPS", "OPS")
+]
+GAMELOG_HEADERS = ["Season", "Month", "Date", "Teams", "Result"] + [stat[1] for stat in STAT_MAPPING]
+RATE_STATS = frozenset(["AVG", "OBP", "SLG", "OPS"])
+
+@dataclass
+class GameRow:
+    """One gamelog line (a game, or the season totals) with typed stats."""
+    game_id: str
+    season: str
+    month: str
+    date: Optional[date]
+    teams: str
+    result: str
+    stats: Dict[str, Optional[float]] = field(default_factory=dict)
+
+    def csv_row(self):
+        """Render the row with the legacy CSV headers and ESPN-style numbers."""
+        row = {
+            "Season": self.season,
+            "Month": self.month,
+            "Date": self.date.isoformat() if self.date else "N/A",
+            "Teams": self.teams,
+            "Result": self.result,
+        }
+        for abbrev, name in STAT_MAPPING:
+            row[name] = format_stat(abbrev, self.stats.get(abbrev))
+        return row
+
+def parse_stat(abbrev, raw):
+    """ESPN stat string -> int (counting stats), float (rate stats) or None.
+
+    Pitcher gamelogs reuse the batting positions for values like IP "5.1",
+    so a non-integral counting stat is kept as a float rather than dropped.
+    """
+    if raw is None or raw in ("", "-", "--", "N/A"):
+        return None
+    try:
+        if abbrev in RATE_STATS:
+            return float(raw)
+        try:
+            return int(raw)
+        except ValueError:
+            return float(raw)
+    except (TypeError, ValueError):
+        return None
+
+def format_stat(abbrev, value):
+    """Inverse of parse_stat: '.300' style for rates, plain ints otherwise."""
+    if value is None:
+        return 'N/A'
+    if abbrev in RATE_STATS:
+        text = f"{value:.3f}"
+        return text[1:] if text.startswith("0.") else text
+    return str(value)
+
+def typed_stats(raw_stats):
+    """Map ESPN's positional stat list onto STAT_MAPPING abbreviations."""
+    return {abbrev: parse_stat(abbrev, raw_stats[i]) if i < len(raw_stats) else None
+            for i, (abbrev, name) in enumerate(STAT_MAPPING)}
+
+def parse_game_date(raw_date):
+    """ESPN gameDate -> date. ISO strings ("2025-04-01T23:05Z") take a slice-and-int
+    fast path; anything else falls back to dateutil."""
+    if not raw_date:
+        return None
+    if len(raw_date) >= 10 and raw_date[4] == '-' and raw_date[7] == '-':
+        try:
+            return date(int(raw_date[0:4]), int(raw_date[5:7]), int(raw_date[8:10]))
+        except ValueError:
+            pass
+    try:
+        return parser.parse(raw_date).date()
+    except Exception as e:
+        logger.error(f"Date parsing failed for {raw_date}: {e}")
+        return None
+
+def get_game_result(event, team_id):
+    """Format the W/L result from the athlete's team point of view."""
+    try:
+        home_score = event.get('homeTeamScore')
+        away_score = event.get('awayTeamScore')
+        if home_score is None or away_score is None:
+            return 'N/A'
+        if event.get('homeTeamId') == team_id:
+            result = 'W' if int(home_score) > int(away_score) else 'L'
+            return f"{result} {home_score}-{away_score}"
+        result = 'W' if int(away_score) > int(home_score) else 'L'
+        return f"{result} {away_score}-{home_score}"
+    except Exception as e:
+        logger.error(f"Error extracting result for event {event.get('id', 'Unknown')}: {e}")
+        return 'N/A'
+
+def index_event_stats(data):
+    """eventId -> raw stats list, built in one pass over seasonTypes/categories/events."""
+    index = {}
+    for season_type in data.get('seasonTypes', []):
+        for category in season_type.get('categories', []):
+            if category.get('type') != 'event':
+                continue
+            for evt in category.get('events', []):
+                index[evt.get('eventId')] = evt.get('stats', [])
+    return index
+
+def parse_gamelog(data, team_id, team_name, season) -> Tuple[List[GameRow], Dict[str, dict]]:
+    """Parse a gamelog response into GameRows plus a dict of incomplete games.
+
+    Events without inline stats are filled from an eventId index built once,
+    instead of rescanning every category for each game.
+    """
+    season_display_name = str(season)
+    for season_type in data.get('seasonTypes', []):
+        season_display_name = season_type.get('displayName', season_display_name)
+
+    rows = []
+    problematic_games = {}
+
+    def build_row(game_id, event, month, game_date, raw_stats):
+        opponent_name = event.get('opponent', {}).get('displayName', 'Unknown')
+        game_result = get_game_result(event, team_id)
+        rows.append(GameRow(
+            game_id=game_id,
+            season=season_display_name,
+            month=month,
+            date=game_date,
+            teams=f"{team_name} {event.get('atVs', 'vs')} {opponent_name}",
+            result=game_result,
+            stats=typed_stats(raw_stats),
+        ))
+        if opponent_name == "Unknown" or game_date is None or game_result == "N/A" or not raw_stats:
+            problematic_games[game_id] = {"event": event, "stats_found": bool(raw_stats)}
+
+    events_dict = data.get('events', {})
+    if events_dict:
+        stats_index = None
+        for game_id, event in events_dict.items():
+            if 'stats' in event:
+                raw_stats = event['stats']
+            else:
+                if stats_index is None:
+                    stats_index = index_event_stats(data)
+                raw_stats = stats_index.get(event.get('id', game_id), [])
+            game_date = parse_game_date(event.get('gameDate'))
+            month = calendar.month_name[game_date.month] if game_date else 'Unknown'
+            build_row(game_id, event, month, game_date, raw_stats)
+    else:
+        for season_type in data.get('seasonTypes', []):
+            season_display_name = season_type.get('displayName', season_display_name)
+            for category in season_type.get('categories', []):
+                if category.get('type') != 'event':
+                    continue
+                month = category.get('displayName', 'Unknown').capitalize()
+                for event in category.get('events', []):
+                    build_row(event.get('eventId', 'Unknown'), event, month,
+                              parse_game_date(event.get('gameDate')), event.get('stats', []))
+
+    summary_stats = data.get('summary', {}).get('stats', [])
+    if summary_stats and isinstance(summary_stats[0], dict):
+        summary_stats = next((group.get('stats', []) for group in summary_stats if group.get('type') == 'total'), [])
+    if summary_stats:
+        rows.append(GameRow("total", season_display_name, "Total", None, "Season Totals", "N/A", typed_stats(summary_stats)))
+
+    return rows, problematic_games
+
+def parse_gamelog_files(paths: Iterable[str], team_id, team_name, season):
+    """Re-parse cached raw_response_*.json gamelogs; yields (path, rows, problematic_games)."""
+    for path in paths:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        rows, problematic_games = parse_gamelog(data, team_id, team_name, season)
+        yield path, rows, problematic_games
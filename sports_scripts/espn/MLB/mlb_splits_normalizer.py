@@ -0,0 +1,154 @@
+# Vectorized normalizer for ESPN athlete splits API responses
+import logging
+from itertools import chain
+from typing import Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mlb_gamelog_parser import RATE_STATS, format_stat
+
+logger = logging.getLogger(__name__)
+
+# Requested splits categories
+REQUESTED_SPLITS = frozenset([
+    "Overall", "All Splits", "Breakdown", "vs. Left", "vs. Right", "Home", "Away",
+    "Day", "Night", "March", "April", "May", "Last 7 Days", "Last 15 Days", "Last 30 Days",
+    "vs. ARI", "vs. CHW", "vs. LAD", "vs. MIA", "vs. MIL", "vs. NYM", "vs. OAK",
+    "vs. PHI", "vs. PIT", "vs. SD", "vs. SF", "vs. TEX",
+    "American Family Field", "Chase Field", "Citi Field", "Dodger Stadium",
+    "PETCO Park", "PNC Park", "Wrigley Field",
+    "As LF", "As RF", "As DH",
+    "Count 0-0", "Count 0-1", "Count 0-2", "Count 1-0", "Count 1-1", "Count 1-2",
+    "Count 2-0", "Count 2-1", "Count 2-2", "Count 3-0", "Count 3-1", "Count 3-2",
+    "Batting #2", "Batting #3",
+    "None On", "Runners On", "Scoring Position", "Bases Loaded", "Lead Off Inning",
+    "Scoring Position, 2 out"
+])
+
+KEY_COLUMNS = ["player_id", "category", "split", "abbreviation"]
+LONG_COLUMNS = KEY_COLUMNS + ["stat", "value"]
+SPLITS_COLUMNS = [
+    "Category", "Split", "Abbreviation",
+    "AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "HBP", "SO", "SB", "CS",
+    "AVG", "OBP", "SLG", "OPS"
+]
+
+def _payload_items(payloads):
+    return payloads.items() if isinstance(payloads, Mapping) else payloads
+
+def normalize_splits(payloads, splits: Optional[Iterable[str]] = None,
+                     categories: Optional[Iterable[str]] = None, overall: bool = True) -> pd.DataFrame:
+    """Every player's splits as one long frame: player_id, category, split, abbreviation, stat, value.
+
+    `payloads` maps player_id -> splits API JSON (or is an iterable of such
+    pairs). `splits` / `categories` are sets of display names to keep; None
+    keeps everything. With `overall`, the "All Splits" line is also reported
+    as an "Overall" row, as the per-player scripts did.
+
+    The JSON walk only records one key tuple and one stats list per split;
+    the per-stat expansion, label lookup and numeric conversion are done once
+    over flat arrays for the whole league.
+    """
+    splits = None if splits is None else frozenset(splits)
+    categories = None if categories is None else frozenset(categories)
+    keys, counts, values, stat_codes = [], [], [], []
+    # Every key and stat label is coded to an int as it is seen, so the frame is built from int arrays
+    players, category_names, split_names, abbreviations, stat_vocabulary = {}, {}, {}, {}, {}
+
+    for player_id, data in _payload_items(payloads):
+        if not data:
+            continue
+        player_code = players.setdefault(player_id, len(players))
+        names = data.get("names", [])
+        stat_mapping = dict(zip(names, data.get("labels", [])))
+        # Stat labels are coded once per player; each split then only contributes a slice
+        player_codes = [stat_vocabulary.setdefault(stat_mapping.get(name, name), len(stat_vocabulary)) for name in names]
+        for category in data.get("splitCategories", []):
+            category_name = category.get("displayName", "Unknown")
+            category_code = category_names.setdefault(category_name, len(category_names))
+            keep_category = categories is None or category_name in categories
+            keep_overall = overall and category.get("name") == "split" and \
+                (splits is None or "Overall" in splits) and (categories is None or "Overall" in categories)
+            for split in category.get("splits", []):
+                stats = split.get("stats")
+                if not stats:
+                    continue
+                split_name = split.get("displayName", "Unknown")
+                width = min(len(stats), len(player_codes))
+                if keep_category and (splits is None or split_name in splits):
+                    keys.append((player_code, category_code, split_names.setdefault(split_name, len(split_names)),
+                                 abbreviations.setdefault(split.get("abbreviation", split_name), len(abbreviations))))
+                    counts.append(width)
+                    values.append(stats[:width])
+                    stat_codes.append(player_codes[:width])
+                if keep_overall and split_name == "All Splits":
+                    keys.append((player_code, category_names.setdefault("Overall", len(category_names)),
+                                 split_names.setdefault("Overall", len(split_names)),
+                                 abbreviations.setdefault(split.get("abbreviation", "Total"), len(abbreviations))))
+                    counts.append(width)
+                    values.append(stats[:width])
+                    stat_codes.append(player_codes[:width])
+
+    if not keys:
+        return pd.DataFrame({column: pd.Series(dtype="category") for column in LONG_COLUMNS[:-1]}
+                            | {"value": pd.Series(dtype="float64")})
+
+    repeats = np.asarray(counts)
+    total = int(repeats.sum())
+    # One code row per split, repeated out to one row per stat
+    key_codes = np.repeat(np.array(keys, dtype=np.int32), repeats, axis=0)
+    vocabularies = (players, category_names, split_names, abbreviations)
+    frame = {
+        column: pd.Categorical.from_codes(key_codes[:, i], categories=list(vocabulary))
+        for i, (column, vocabulary) in enumerate(zip(KEY_COLUMNS, vocabularies))
+    }
+    frame["stat"] = pd.Categorical.from_codes(
+        np.fromiter(chain.from_iterable(stat_codes), dtype=np.int32, count=total), categories=list(stat_vocabulary)
+    )
+    flat = list(chain.from_iterable(values))
+    try:
+        frame["value"] = np.array(flat, dtype=np.float64)
+    except (TypeError, ValueError):
+        # Placeholders like "-" or "" only cost the slower coercing path
+        frame["value"] = pd.to_numeric(pd.Series(flat, dtype=object), errors="coerce").astype("float64").to_numpy()
+    return pd.DataFrame(frame, columns=LONG_COLUMNS)
+
+def to_wide(long: pd.DataFrame) -> pd.DataFrame:
+    """One row per (player, category, split) with a column per stat, in the original order."""
+    if long.empty:
+        return pd.DataFrame(columns=KEY_COLUMNS)
+    row = long.groupby(KEY_COLUMNS, observed=True, sort=False).ngroup().to_numpy()
+    cells = pd.DataFrame({"row": row, "stat": long["stat"].astype(object), "value": long["value"]})
+    wide = cells.drop_duplicates(["row", "stat"]).pivot(index="row", columns="stat", values="value")
+    wide = wide[list(pd.unique(cells["stat"]))]
+    keys = long[KEY_COLUMNS].astype(object).assign(row=row).drop_duplicates("row").set_index("row")
+    wide = keys.join(wide).sort_index().reset_index(drop=True)
+    wide.columns.name = None
+    return wide
+
+def splits_table(data, splits: Optional[Iterable[str]] = REQUESTED_SPLITS,
+                 categories: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """One player's splits in the legacy CSV layout (Category, Split, Abbreviation, AB ... OPS).
+
+    Counting stats are nullable ints; rate stats keep ESPN's '.300' formatting.
+    """
+    wide = to_wide(normalize_splits([("", data)], splits=splits, categories=categories))
+    if wide.empty:
+        return pd.DataFrame()
+    wide = wide.drop(columns="player_id").rename(
+        columns={"category": "Category", "split": "Split", "abbreviation": "Abbreviation"}
+    )
+    wide = wide[[column for column in SPLITS_COLUMNS if column in wide.columns]]
+    for column in wide.columns[3:]:
+        if column in RATE_STATS:
+            wide[column] = [format_stat(column, None if pd.isna(value) else value) for value in wide[column]]
+        else:
+            wide[column] = wide[column].astype("Int64")
+    return wide
+
+def league_splits(athletes, payloads: Mapping[Tuple[str, str], dict], **kwargs) -> pd.DataFrame:
+    """Long splits frame for every athlete from fetch_athletes() output ({(player_id, endpoint): json})."""
+    return normalize_splits(
+        ((athlete["player_id"], payloads.get((athlete["player_id"], "splits"))) for athlete in athletes), **kwargs
+    )
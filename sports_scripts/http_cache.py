@@ -0,0 +1,244 @@
+# On-disk HTTP cache with per-endpoint TTLs, conditional revalidation and an LRU size cap
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.getenv("HTTP_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "http_cache"))
+MAX_CACHE_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", 1024 * 1024 * 1024))
+HOUR = 3600
+DAY = 24 * HOUR
+
+def gamelog_ttl(now=None):
+    """Hourly while the season is on (games can land any day), daily in the offseason."""
+    month = (now or datetime.now()).month
+    return HOUR if 3 <= month <= 10 else DAY
+
+# First matching pattern wins; a TTL is seconds or a callable returning seconds
+TTL_RULES = [
+    (re.compile(r"/roster"), DAY),
+    (re.compile(r"/teams(\?|$)"), DAY),
+    (re.compile(r"/batvspitch/"), 7 * DAY),
+    (re.compile(r"/gamelog"), gamelog_ttl),
+    (re.compile(r"/splits"), 6 * HOUR),
+    (re.compile(r"teamrankings\.com"), 6 * HOUR),
+]
+DEFAULT_TTL = HOUR
+CHARSET_RE = re.compile(r"charset=([\w-]+)", re.IGNORECASE)
+
+class OfflineCacheMiss(requests.RequestException):
+    """Raised in offline mode when a URL has never been cached."""
+
+class CachedResponse:
+    """The parts of requests.Response the fetchers use, served from the cache or the network."""
+
+    def __init__(self, url, status_code, content, headers, from_cache):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        match = CHARSET_RE.search(self.headers.get("Content-Type") or "")
+        return self.content.decode(match.group(1) if match else "utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+class HttpCache:
+    """Cache of successful GET responses keyed by URL.
+
+    Fresh entries (younger than the URL's TTL) are served without touching
+    the network. Stale entries are revalidated with If-None-Match /
+    If-Modified-Since, so an unchanged page costs a 304 instead of a full
+    download. Bodies live in files; a small SQLite index tracks validators,
+    sizes and last use, and the least recently used bodies are evicted once
+    the cache grows past `max_bytes`.
+
+    With offline=True (or HTTP_CACHE_OFFLINE=1) nothing is fetched: cached
+    responses are replayed regardless of age, which is what tests use.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES, ttl_rules=TTL_RULES,
+                 default_ttl=DEFAULT_TTL, offline=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl_rules = ttl_rules
+        self.default_ttl = default_ttl
+        self.offline = os.getenv("HTTP_CACHE_OFFLINE") == "1" if offline is None else offline
+        self.hits = self.revalidated = self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(cache_dir, "index.sqlite"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, url TEXT, etag TEXT, last_modified TEXT, content_type TEXT, "
+            "fetched_at REAL, last_used REAL, size INTEGER)"
+        )
+        self._db.commit()
+
+    def ttl_for(self, url):
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl() if callable(ttl) else ttl
+        return self.default_ttl
+
+    @staticmethod
+    def key(url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _body_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _entry(self, key):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, content_type, fetched_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            with open(self._body_path(key), "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "content_type": row[2], "fetched_at": row[3], "content": content}
+
+    def _touch(self, key, fetched_at=None):
+        with self._lock:
+            if fetched_at is None:
+                self._db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+            else:
+                self._db.execute("UPDATE entries SET last_used = ?, fetched_at = ? WHERE key = ?", (time.time(), fetched_at, key))
+            self._db.commit()
+
+    def _response(self, url, entry, from_cache=True):
+        headers = {"Content-Type": entry["content_type"] or ""}
+        return CachedResponse(url, 200, entry["content"], headers, from_cache)
+
+    def fresh(self, url):
+        """Cached response if it is within its TTL (or we're offline), else None."""
+        key = self.key(url)
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        if self.offline or time.time() - entry["fetched_at"] < self.ttl_for(url):
+            self._touch(key)
+            self.hits += 1
+            return self._response(url, entry)
+        return None
+
+    def validators(self, url):
+        """Conditional request headers for a stale entry, e.g. {"If-None-Match": etag}."""
+        entry = self._entry(self.key(url))
+        headers = {}
+        if entry and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def revalidated_response(self, url):
+        """Mark a stale entry fresh after a 304 and return it."""
+        key = self.key(url)
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        self._touch(key, fetched_at=time.time())
+        self.revalidated += 1
+        return self._response(url, entry)
+
+    def store(self, url, content, headers):
+        """Save a 200 response body and its validators, then enforce the size cap."""
+        key = self.key(url)
+        path = self._body_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, headers.get("ETag"), headers.get("Last-Modified"), headers.get("Content-Type"), now, now, len(content)),
+            )
+            self._db.commit()
+        self.misses += 1
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used bodies until the cache is under max_bytes."""
+        with self._lock:
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            victims = []
+            for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY last_used").fetchall():
+                if total <= self.max_bytes:
+                    break
+                victims.append(key)
+                total -= size
+            self._db.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in victims])
+            self._db.commit()
+        for key in victims:
+            try:
+                os.remove(self._body_path(key))
+            except FileNotFoundError:
+                pass
+        logger.debug(f"Evicted {len(victims)} cached responses")
+
+    def get(self, url, session=None, headers=None, timeout=10):
+        """GET through the cache; returns a CachedResponse (call raise_for_status as usual)."""
+        cached = self.fresh(url)
+        if cached is not None:
+            return cached
+        if self.offline:
+            raise OfflineCacheMiss(f"{url} is not cached and HTTP_CACHE_OFFLINE is set")
+
+        request_headers = dict(headers or {})
+        request_headers.update(self.validators(url))
+        response = (session or requests).get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304:
+            revalidated = self.revalidated_response(url)
+            if revalidated is not None:
+                return revalidated
+            # The body vanished between the lookup and the 304; fetch it unconditionally
+            response = (session or requests).get(url, headers=headers, timeout=timeout)
+        if response.status_code == 200:
+            self.store(url, response.content, response.headers)
+        return CachedResponse(url, response.status_code, response.content, response.headers, False)
+
+    def stats(self):
+        return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+def default_cache():
+    """The process-wide cache every fetcher shares."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = HttpCache()
+    return _default_cache
+
+def cached_get(url, session=None, headers=None, timeout=10):
+    """requests.get replacement that goes through the shared on-disk cache."""
+    return default_cache().get(url, session=session, headers=headers, timeout=timeout)
@@ -0,0 +1,145 @@
+# Run reporting for the scrapers: one JSON line per job, a summary at the end
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_logs")
+
+def verbose_requested(argv=None):
+    """True when the run was started with -v/--verbose or SCRAPER_VERBOSE=1."""
+    argv = sys.argv[1:] if argv is None else argv
+    return "-v" in argv or "--verbose" in argv or os.getenv("SCRAPER_VERBOSE") == "1"
+
+class JobEntry:
+    """What one job did; filled in by the job and written as one JSON line."""
+
+    def __init__(self, entity, endpoint):
+        self.entity = entity
+        self.endpoint = endpoint
+        self.status = "ok"
+        self.rows = 0
+        self.bytes = 0
+        self.parse_ms = 0.0
+        self.total_ms = 0.0
+        self.extra = {}
+
+    @contextmanager
+    def parsing(self):
+        """Time a parse step; repeated blocks add up."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.parse_ms += (time.perf_counter() - started) * 1000
+
+    def as_dict(self):
+        return dict({
+            "entity": self.entity,
+            "endpoint": self.endpoint,
+            "status": self.status,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "parse_ms": round(self.parse_ms, 2),
+            "total_ms": round(self.total_ms, 2),
+        }, **self.extra)
+
+class RunReport:
+    """Collects per-job results for a scraper run.
+
+    By default nothing is printed until summary(); every job still goes to
+    run_logs/<name>_<timestamp>.jsonl. With verbose=True the JSON lines and
+    detail() messages are echoed to stderr as well.
+
+        with RunReport("team_stats", verbose=verbose_requested()) as report:
+            with report.job("chicago-cubs", "batting-average") as entry:
+                entry.rows = len(df)
+    """
+
+    def __init__(self, name, verbose=False, log_dir=LOG_DIR, stream=None):
+        self.name = name
+        self.verbose = verbose
+        self.stream = stream or sys.stderr
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._totals = defaultdict(lambda: {"ok": 0, "empty": 0, "failed": 0, "rows": 0, "bytes": 0, "parse_ms": 0.0})
+        self._log = None
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+            path = os.path.join(log_dir, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+            self._log = open(path, "a")
+            self.log_path = path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.summary()
+        self.close()
+
+    @contextmanager
+    def job(self, entity, endpoint):
+        """Track one job; an exception marks it failed (and is re-raised)."""
+        entry = JobEntry(entity, endpoint)
+        started = time.perf_counter()
+        try:
+            yield entry
+        except BaseException as e:
+            entry.status = "failed"
+            entry.extra["error"] = str(e)
+            raise
+        finally:
+            entry.total_ms = (time.perf_counter() - started) * 1000
+            if entry.status == "ok" and not entry.rows:
+                entry.status = "empty"
+            self.record(entry)
+
+    def record(self, entry):
+        """Add a finished job to the totals and write its JSON line."""
+        line = json.dumps(entry.as_dict(), default=str)
+        with self._lock:
+            totals = self._totals[entry.endpoint]
+            totals[entry.status] += 1
+            totals["rows"] += entry.rows
+            totals["bytes"] += entry.bytes
+            totals["parse_ms"] += entry.parse_ms
+            if self._log:
+                self._log.write(line + "\n")
+            if self.verbose:
+                print(line, file=self.stream)
+
+    def detail(self, message):
+        """Human-readable detail (tables, per-stat lines) shown only in verbose mode."""
+        if self.verbose:
+            with self._lock:
+                print(message, file=self.stream)
+
+    def totals(self):
+        """{endpoint: {"ok", "empty", "failed", "rows", "bytes", "parse_ms"}} so far."""
+        with self._lock:
+            return {endpoint: dict(counts) for endpoint, counts in self._totals.items()}
+
+    def summary(self):
+        """Print one line per endpoint plus the wall time; returns the totals dict."""
+        elapsed = time.perf_counter() - self.started
+        totals = self.totals()
+        lines = [f"{self.name}: {sum(c['ok'] + c['empty'] + c['failed'] for c in totals.values())} jobs in {elapsed:.1f}s"]
+        for endpoint, c in sorted(totals.items()):
+            lines.append(
+                f"  {endpoint}: {c['ok']} ok, {c['empty']} empty, {c['failed']} failed, "
+                f"{c['rows']} rows, {c['bytes'] / 1024:.0f} KiB, {c['parse_ms']:.0f} ms parsing"
+            )
+        if self._log:
+            lines.append(f"  job log: {self.log_path}")
+            self._log.flush()
+        print("\n".join(lines), file=self.stream)
+        return totals
+
+    def close(self):
+        if self._log:
+            self._log.close()
+            self._log = None
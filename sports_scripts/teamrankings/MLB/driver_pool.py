@@ -0,0 +1,162 @@
+# Reusable pool of warm headless browsers for the TeamRankings scrapers
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+POOL_SIZE = 4
+PAGE_TIMEOUT = 10
+CHECKOUT_POLL = 5  # seconds a waiter blocks before re-checking for a free slot
+_VACANT = object()  # queued in place of a discarded driver
+# WebDriverExceptions about the page, not the browser: the driver is still fine to reuse
+PAGE_ERRORS = (TimeoutException, NoSuchElementException)
+
+def new_chrome_driver():
+    """Start a headless Chrome with the options the scrapers have always used."""
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--user-agent=Mozilla/5.0")
+    # Don't wait for ads/analytics; the wait below decides when the table is ready
+    options.page_load_strategy = "eager"
+    return webdriver.Chrome(options=options)
+
+def table_rows_loaded(driver):
+    """Wait condition: a tr-table exists and its first body row has rendered text."""
+    cells = driver.find_elements(By.CSS_SELECTOR, "table.tr-table tbody tr td")
+    return bool(cells) and bool(cells[0].text.strip())
+
+def wait_for_table(driver, timeout=PAGE_TIMEOUT):
+    """Block until the page's tr-table is populated (replaces the fixed sleeps)."""
+    WebDriverWait(driver, timeout, poll_frequency=0.2).until(table_rows_loaded)
+
+class DriverPool:
+    """Fixed-size pool of browsers that pages are farmed out to in parallel.
+
+    Drivers are started lazily, reused across pages, and replaced if one dies:
+
+        with DriverPool(4) as pool:
+            pool.map(fetch_and_save_table, [(url, category, filename), ...])
+    """
+
+    def __init__(self, size=POOL_SIZE, driver_factory=new_chrome_driver):
+        self.size = size
+        self.driver_factory = driver_factory
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._starting = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _start(self):
+        """Start a driver into a free slot, or return None if the pool is full.
+
+        The slot is reserved under the lock and the browser launched outside
+        it, so several drivers can start at once.
+        """
+        with self._lock:
+            if len(self._drivers) + self._starting >= self.size:
+                return None
+            self._starting += 1
+        try:
+            driver = self.driver_factory()
+        except Exception:
+            with self._lock:
+                self._starting -= 1
+            raise
+        with self._lock:
+            self._starting -= 1
+            self._drivers.append(driver)
+        return driver
+
+    def _checkout(self):
+        """Take an idle driver, starting a new one while the pool is below size.
+
+        Waiters poll with a timeout, so a slot freed by a discarded driver is
+        picked up even if its _VACANT marker went to another thread.
+        """
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self._start()
+                if driver is not None:
+                    return driver
+                try:
+                    driver = self._idle.get(timeout=CHECKOUT_POLL)
+                except queue.Empty:
+                    continue
+            if driver is not _VACANT:
+                return driver
+            # A discarded driver's slot: start its replacement here
+            try:
+                driver = self._start()
+            except Exception:
+                self._idle.put(_VACANT)
+                raise
+            if driver is not None:
+                return driver
+
+    def _discard(self, driver):
+        """Drop a broken driver and wake a waiter to start a fresh one in its place."""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        self._idle.put(_VACANT)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @contextmanager
+    def driver(self):
+        """Borrow a warm driver for the duration of the block.
+
+        The driver is replaced only if the browser session failed; a page that
+        times out or lacks an element leaves it in the pool.
+        """
+        driver = self._checkout()
+        broken = False
+        try:
+            yield driver
+        except WebDriverException as e:
+            broken = not isinstance(e, PAGE_ERRORS)
+            raise
+        finally:
+            if broken:
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+
+    def run(self, func, *args, **kwargs):
+        """Call func(*args, driver=<pooled driver>, **kwargs)."""
+        with self.driver() as driver:
+            return func(*args, driver=driver, **kwargs)
+
+    def map(self, func, jobs):
+        """Run func for every argument tuple in jobs across the pool; returns results in order."""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self.run, func, *job) for job in jobs]
+            return [future.result() for future in futures]
+
+    def close(self):
+        """Quit every browser the pool started."""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
@@ -0,0 +1,414 @@
+# Incremental MLB power ratings computed from the TeamRankings game logs instead of scraping each rankings page
+import json
+import logging
+import os
+import sys
+import threading
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import requests
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..')))
+from database.cache_invalidation import invalidate
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from http_cache import cached_get
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../data_pipeline/storage')))
+from parquet_store import game_log_scores, game_logs
+from storage_config import PARQUET_ROOT
+
+logger = logging.getLogger(__name__)
+
+TRENDS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'trends'))
+STATE_PATH = os.getenv("POWER_RATINGS_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "power_ratings_state.npz"))
+# Every game in a date range from one call; the game logs only list games already played
+SCHEDULE_URL = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard?dates={start}-{end}&limit=3000"
+SEASON_END = (9, 30)  # month, day the regular season is over by
+
+DIVISIONS = {
+    "AL East": ("baltimore-orioles", "boston-red-sox", "new-york-yankees", "tampa-bay-rays", "toronto-blue-jays"),
+    "AL Central": ("chicago-white-sox", "cleveland-guardians", "detroit-tigers", "kansas-city-royals", "minnesota-twins"),
+    "AL West": ("houston-astros", "los-angeles-angels", "oakland-athletics", "seattle-mariners", "texas-rangers"),
+    "NL East": ("atlanta-braves", "miami-marlins", "new-york-mets", "philadelphia-phillies", "washington-nationals"),
+    "NL Central": ("chicago-cubs", "cincinnati-reds", "milwaukee-brewers", "pittsburgh-pirates", "st-louis-cardinals"),
+    "NL West": ("arizona-diamondbacks", "colorado-rockies", "los-angeles-dodgers", "san-diego-padres", "san-francisco-giants"),
+}
+TEAMS = tuple(sorted(team for teams in DIVISIONS.values() for team in teams))
+DIVISION_OF = {team: division for division, teams in DIVISIONS.items() for team in teams}
+# Opponent names as the game logs print them
+SHORT_NAMES = {
+    "Arizona": "arizona-diamondbacks", "Atlanta": "atlanta-braves", "Baltimore": "baltimore-orioles",
+    "Boston": "boston-red-sox", "Chi Cubs": "chicago-cubs", "Chi Sox": "chicago-white-sox",
+    "Cincinnati": "cincinnati-reds", "Cleveland": "cleveland-guardians", "Colorado": "colorado-rockies",
+    "Detroit": "detroit-tigers", "Houston": "houston-astros", "Kansas City": "kansas-city-royals",
+    "LA Angels": "los-angeles-angels", "LA Dodgers": "los-angeles-dodgers", "Miami": "miami-marlins",
+    "Milwaukee": "milwaukee-brewers", "Minnesota": "minnesota-twins", "NY Mets": "new-york-mets",
+    "NY Yankees": "new-york-yankees", "Oakland": "oakland-athletics", "Sacramento": "oakland-athletics",
+    "Athletics": "oakland-athletics",
+    "Philadelphia": "philadelphia-phillies", "Pittsburgh": "pittsburgh-pirates", "San Diego": "san-diego-padres",
+    "SF Giants": "san-francisco-giants", "Seattle": "seattle-mariners", "St. Louis": "st-louis-cardinals",
+    "Tampa Bay": "tampa-bay-rays", "Texas": "texas-rangers", "Toronto": "toronto-blue-jays",
+    "Washington": "washington-nationals",
+}
+
+# Opponent rank tiers, by predictive rating when the game was played
+TIERS = ((1, 5), (6, 10), (11, 16), (17, 22), (23, 30))
+TIER_SPLITS = tuple(f"vs_teams_{low}_{high}" for low, high in TIERS)
+SPLITS = ("home", "away", "in_division", "non_division") + TIER_SPLITS
+# One column per rankings/*_power_rating.py script
+RATINGS = ("predictive", "home", "away", "home_advantage", "last_5_games", "last_10_games", "luck", "consistency",
+           "strength_of_schedule", "season_sos", "future_sos", "sos_basic_method", "in_division", "in_division_sos",
+           "non_division", "non_division_sos") + TIER_SPLITS
+
+K_FACTOR = 0.04         # share of the surprise (in runs) moved into the ratings per game
+HOME_ADVANTAGE = 0.2    # runs
+MARGIN_CAP = 7          # blowouts count as 7-run games
+REVERSION = 1 / 3       # pulled this far back to average between seasons
+WIN_SCALE = 2.5         # runs of rating difference per logit of win probability
+PYTHAGOREAN_EXPONENT = 1.83
+RECENT_GAMES = 10
+# Everything save() writes besides the applied game keys and the parameters
+STATE_ARRAYS = ('rating', 'games', 'wins', 'runs_for', 'runs_against', 'performance_sum', 'performance_squares',
+                'opponent_sum', 'split_sum', 'split_opponent_sum', 'split_games', 'recent', 'recent_next', 'played',
+                'remaining')
+
+def team_id(name):
+    """The team slug for a slug, a game-log short name ("NY Yankees") or a full name ("New York Yankees")."""
+    name = " ".join(str(name).split())
+    if name in SHORT_NAMES:
+        return SHORT_NAMES[name]
+    slug = name.lower().replace(".", "").replace(" ", "-")
+    if slug not in DIVISION_OF:
+        raise KeyError(f"Unknown team '{name}'")
+    return slug
+
+def load_games(trends_dir=TRENDS_DIR, root=PARQUET_ROOT):
+    """Every played game in the game logs, once, as (game_date, home, away, scores, neutral, key).
+
+    Each game is in both teams' logs; the two rows share a key of date,
+    teams and the game's number within a doubleheader, so either team's log
+    alone is enough. Neutral-site games are keyed with the teams in name order.
+    """
+    frames = []
+    for team, df, scraped_at in game_logs(trends_dir, root):
+        if not {'Date', 'Opponent', 'H/A/N', 'Score'} <= set(df.columns):
+            logger.warning(f"Skipping {team}: not a game log table")
+            continue
+        opponent = df['Opponent'].astype(str).str.replace(r'^(at|vs)\s+', '', regex=True).map(SHORT_NAMES)
+        venue = df['H/A/N']
+        neutral = (venue == 'Neutral').to_numpy()
+        team_home = ((venue == 'Home') | (venue == 'Neutral') & (opponent > team)).to_numpy()
+        team_runs, opponent_runs = game_log_scores(df)
+        frame = pd.DataFrame({
+            'game_date': pd.to_datetime(df['Date'].astype(str) + f"/{scraped_at.year}", format='%m/%d/%Y', errors='coerce'),
+            'home': np.where(team_home, team, opponent),
+            'away': np.where(team_home, opponent, team),
+            'home_score': np.where(team_home, team_runs, opponent_runs),
+            'away_score': np.where(team_home, opponent_runs, team_runs),
+            'neutral': neutral,
+        }).dropna()
+        frame['game_no'] = frame.groupby(['game_date', 'home', 'away']).cumcount() + 1
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=['game_date', 'home', 'away', 'home_score', 'away_score', 'neutral', 'game_no', 'key'])
+    games = pd.concat(frames, ignore_index=True)
+    games['key'] = (games['game_date'].dt.strftime('%Y-%m-%d') + ':' + games['away'] + '@' + games['home']
+                    + ':' + games['game_no'].astype(str))
+    games = games.drop_duplicates('key').sort_values(['game_date', 'key'], kind='mergesort')
+    return games.reset_index(drop=True)
+
+def load_schedule(since, until=None):
+    """(home, away) slugs of the games from `since` to the end of its season that haven't started."""
+    until = until or date(since.year, *SEASON_END)
+    if until < since:
+        return []
+    response = cached_get(SCHEDULE_URL.format(start=since.strftime("%Y%m%d"), end=until.strftime("%Y%m%d")))
+    response.raise_for_status()
+    schedule = []
+    for event in response.json().get("events", []):
+        if event.get("status", {}).get("type", {}).get("state") != "pre":
+            continue
+        for competition in event.get("competitions", []):
+            sides = {competitor.get("homeAway"): competitor.get("team", {}).get("displayName")
+                     for competitor in competition.get("competitors", [])}
+            try:
+                schedule.append((team_id(sides.get("home")), team_id(sides.get("away"))))
+            except KeyError:
+                continue  # All-Star and exhibition opponents
+    return schedule
+
+class PowerRatings:
+    """Margin-based Elo ratings plus TeamRankings' split ratings, updated one game at a time.
+
+    Ratings are runs better than an average team on a neutral field. After
+    each game the two teams move by K_FACTOR times the difference between the
+    (capped) run margin and the margin the ratings expected. Split ratings
+    (home, last 10, in division, vs top-5 teams, ...) average a team's
+    per-game performance, its margin plus the opponent's rating going in,
+    over the games in that split. Everything is kept as running sums, so a
+    new game costs the same whether it is the first of the season or the
+    last, and the team x rating matrix is always current:
+
+        ratings = PowerRatings.load()
+        ratings.update(load_games())
+        ratings.get("new-york-yankees", "last_10_games")
+        ratings.save()
+    """
+
+    def __init__(self, teams=TEAMS, k=K_FACTOR, home_advantage=HOME_ADVANTAGE, margin_cap=MARGIN_CAP,
+                 reversion=REVERSION):
+        self.teams = tuple(teams)
+        self.index = {team: i for i, team in enumerate(self.teams)}
+        self.columns = {rating: j for j, rating in enumerate(RATINGS)}
+        self.k = k
+        self.home_advantage = home_advantage
+        self.margin_cap = margin_cap
+        self.reversion = reversion
+        n = len(self.teams)
+        division = np.array([DIVISION_OF.get(team, team) for team in self.teams])
+        self.same_division = division[:, None] == division[None, :]
+        self.rating = np.zeros(n)
+        self.season = None
+        self.last_date = None
+        self._lock = threading.Lock()
+        self._reset_season()
+
+    def _reset_season(self):
+        n = len(self.teams)
+        self.games = np.zeros(n)
+        self.wins = np.zeros(n)
+        self.runs_for = np.zeros(n)
+        self.runs_against = np.zeros(n)
+        self.performance_sum = np.zeros(n)
+        self.performance_squares = np.zeros(n)
+        self.opponent_sum = np.zeros(n)  # opponents' ratings when each game was played
+        self.split_sum = np.zeros((n, len(SPLITS)))
+        self.split_opponent_sum = np.zeros((n, len(SPLITS)))
+        self.split_games = np.zeros((n, len(SPLITS)))
+        self.recent = np.full((n, RECENT_GAMES), np.nan)  # ring buffer of performances
+        self.recent_next = np.zeros(n, dtype=np.int64)
+        self.played = np.zeros((n, n))  # games against each opponent
+        self.remaining = np.zeros((n, n))  # scheduled games left against each opponent
+        self.applied = set()
+        self.matrix = np.full((n, len(RATINGS)), np.nan)
+        self._refresh(np.arange(n))
+
+    def new_season(self, season):
+        """Regress ratings toward average and start the season's split ratings from zero."""
+        self.rating *= 1 - self.reversion
+        self.season = season
+        self._reset_season()
+        logger.info(f"Started {season} power ratings")
+
+    def expected_margin(self, home, away, neutral=False):
+        """Run margin the ratings expect for `home` over `away`."""
+        h, a = self.index[team_id(home)], self.index[team_id(away)]
+        return self.rating[h] - self.rating[a] + (0.0 if neutral else self.home_advantage)
+
+    def win_probability(self, home, away, neutral=False):
+        return 1.0 / (1.0 + np.exp(-self.expected_margin(home, away, neutral) / WIN_SCALE))
+
+    def _record(self, i, opponent, performance, opponent_rating, splits, runs_for, runs_against):
+        self.games[i] += 1
+        self.wins[i] += runs_for > runs_against
+        self.runs_for[i] += runs_for
+        self.runs_against[i] += runs_against
+        self.performance_sum[i] += performance
+        self.performance_squares[i] += performance * performance
+        self.opponent_sum[i] += opponent_rating
+        self.split_sum[i, splits] += performance
+        self.split_opponent_sum[i, splits] += opponent_rating
+        self.split_games[i, splits] += 1
+        self.recent[i, self.recent_next[i] % RECENT_GAMES] = performance
+        self.recent_next[i] += 1
+        self.played[i, opponent] += 1
+        if self.remaining[i, opponent] > 0:
+            self.remaining[i, opponent] -= 1
+
+    def apply_game(self, game_date, home, away, home_score, away_score, neutral=False, key=None):
+        """Fold one final score into the ratings; returns False if `key` was already applied."""
+        game_date = pd.Timestamp(game_date)
+        key = key or f"{game_date:%Y-%m-%d}:{away}@{home}:1"
+        with self._lock:
+            if key in self.applied:
+                return False
+            if self.season is not None and game_date.year > self.season:
+                self.new_season(game_date.year)
+            self.season = game_date.year
+            h, a = self.index[team_id(home)], self.index[team_id(away)]
+            advantage = 0.0 if neutral else self.home_advantage
+            margin = float(np.clip(home_score - away_score, -self.margin_cap, self.margin_cap))
+            surprise = margin - (self.rating[h] - self.rating[a] + advantage)
+
+            # Ranks and performances use the ratings going into the game
+            ranks = 1 + (self.rating[None, :] > self.rating[[h, a], None]).sum(axis=1)
+            tiers = [next(t for t, (low, high) in enumerate(TIERS) if rank <= high) for rank in ranks]
+            division = SPLITS.index('in_division' if self.same_division[h, a] else 'non_division')
+            home_splits = [division, len(SPLITS) - len(TIERS) + tiers[1]]
+            away_splits = [division, len(SPLITS) - len(TIERS) + tiers[0]]
+            if not neutral:  # neutral-site games count toward neither home nor away
+                home_splits.append(SPLITS.index('home'))
+                away_splits.append(SPLITS.index('away'))
+            self._record(h, a, margin - advantage + self.rating[a], self.rating[a], home_splits, home_score, away_score)
+            self._record(a, h, -margin + advantage + self.rating[h], self.rating[h], away_splits, away_score, home_score)
+
+            self.rating[h] += self.k * surprise
+            self.rating[a] -= self.k * surprise
+            self.applied.add(key)
+            self.last_date = game_date if self.last_date is None else max(self.last_date, game_date)
+            self._refresh(np.array([h, a]))
+        return True
+
+    def update(self, games):
+        """Apply the games not seen yet, in date order; returns how many were applied.
+
+        Games dated before the latest applied game can't be folded in without
+        replaying the season and are skipped with a warning (see rebuild()).
+        """
+        applied = late = 0
+        games = games.sort_values(['game_date', 'key'], kind='mergesort') if len(games) else games
+        for game in games.itertuples(index=False):
+            if game.key in self.applied:
+                continue
+            if self.last_date is not None and pd.Timestamp(game.game_date) < self.last_date:
+                late += 1
+                continue
+            applied += self.apply_game(game.game_date, game.home, game.away, game.home_score, game.away_score,
+                                       bool(game.neutral), game.key)
+        if late:
+            logger.warning(f"Skipped {late} games older than {self.last_date:%Y-%m-%d}; rebuild() to include them")
+        logger.info(f"Applied {applied} new games to the power ratings")
+        return applied
+
+    @classmethod
+    def rebuild(cls, games, **params):
+        """Ratings replayed from scratch over `games`."""
+        ratings = cls(**params)
+        ratings.update(games)
+        return ratings
+
+    def set_schedule(self, schedule):
+        """Games still to play, as (home, away) pairs, for future_sos."""
+        with self._lock:
+            self.remaining[:] = 0
+            for home, away in schedule:
+                h, a = self.index[team_id(home)], self.index[team_id(away)]
+                self.remaining[h, a] += 1
+                self.remaining[a, h] += 1
+            self._refresh(np.array([], dtype=np.int64))
+
+    def _refresh(self, rows):
+        """Recompute the matrix rows of teams that just played, and the league-wide columns."""
+        m, col = self.matrix, self.columns
+        with np.errstate(divide='ignore', invalid='ignore'):
+            games = self.games[rows]
+            m[rows, col['predictive']] = self.rating[rows]
+            for j, split in enumerate(SPLITS):
+                m[rows, col[split]] = self.split_sum[rows, j] / self.split_games[rows, j]
+            for split in ('in_division', 'non_division'):
+                j = SPLITS.index(split)
+                m[rows, col[f'{split}_sos']] = self.split_opponent_sum[rows, j] / self.split_games[rows, j]
+            m[rows, col['home_advantage']] = self.home_advantage + (m[rows, col['home']] - m[rows, col['away']]) / 2
+            for n in (5, 10):
+                recent = self.recent[rows[:, None], (self.recent_next[rows, None] - 1 - np.arange(n)) % RECENT_GAMES]
+                seen = np.arange(n) < self.recent_next[rows, None]
+                m[rows, col[f'last_{n}_games']] = np.where(seen, recent, 0.0).sum(axis=1) / seen.sum(axis=1)
+            mean = self.performance_sum[rows] / games
+            m[rows, col['consistency']] = np.where(
+                games > 1, np.sqrt(np.maximum(self.performance_squares[rows] / games - mean ** 2, 0) * games / (games - 1)),
+                np.nan)
+            scored = self.runs_for[rows] ** PYTHAGOREAN_EXPONENT
+            allowed = self.runs_against[rows] ** PYTHAGOREAN_EXPONENT
+            m[rows, col['luck']] = self.wins[rows] / games - scored / (scored + allowed)
+            m[rows, col['season_sos']] = self.opponent_sum[rows] / games
+
+            # These depend on every opponent's current rating or record, so all teams move
+            win_pct = np.nan_to_num(self.wins / self.games)
+            m[:, col['strength_of_schedule']] = self.played @ self.rating / self.games
+            m[:, col['sos_basic_method']] = self.played @ win_pct / self.games
+            m[:, col['future_sos']] = self.remaining @ self.rating / self.remaining.sum(axis=1)
+
+    def get(self, team, rating="predictive"):
+        """One team's rating; a dict lookup and an array index."""
+        return float(self.matrix[self.index[team_id(team)], self.columns[rating]])
+
+    def frame(self):
+        """The team x rating matrix as a DataFrame indexed by team slug."""
+        return pd.DataFrame(self.matrix.copy(), index=pd.Index(self.teams, name='team'), columns=list(RATINGS))
+
+    def table(self, rating="predictive"):
+        """One rating for every team, ranked like a TeamRankings rankings page."""
+        values = self.matrix[:, self.columns[rating]]
+        order = np.argsort(-np.nan_to_num(values, nan=-np.inf), kind='stable')
+        return pd.DataFrame({'Rank': np.arange(1, len(order) + 1), 'Team': np.array(self.teams)[order],
+                             'Rating': values[order].round(3)})
+
+    def save(self, path=STATE_PATH):
+        """Write the state atomically so the next run continues from the last applied game."""
+        params = {'k': self.k, 'home_advantage': self.home_advantage, 'margin_cap': self.margin_cap,
+                  'reversion': self.reversion, 'season': self.season,
+                  'last_date': None if self.last_date is None else self.last_date.isoformat()}
+        arrays = {name: getattr(self, name) for name in STATE_ARRAYS}
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with self._lock, open(tmp_path, 'wb') as f:
+            np.savez(f, teams=np.array(self.teams), applied=np.array(sorted(self.applied), dtype=str),
+                     params=np.array(json.dumps(params)), **arrays)
+        os.replace(tmp_path, path)
+        invalidate("power_ratings")
+        logger.info(f"Saved power ratings through {params['last_date']} to {path}")
+        return path
+
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        """Ratings from save(); a fresh, all-average engine if nothing was saved yet."""
+        if not os.path.exists(path):
+            return cls()
+        with np.load(path, allow_pickle=False) as state:
+            params = json.loads(str(state['params']))
+            ratings = cls(teams=[str(team) for team in state['teams']], k=params['k'],
+                          home_advantage=params['home_advantage'], margin_cap=params['margin_cap'],
+                          reversion=params['reversion'])
+            for name in STATE_ARRAYS:
+                setattr(ratings, name, state[name].copy())
+            ratings.applied = set(str(key) for key in state['applied'])
+        ratings.season = params['season']
+        ratings.last_date = pd.Timestamp(params['last_date']) if params['last_date'] else None
+        ratings._refresh(np.arange(len(ratings.teams)))
+        return ratings
+
+_ratings = None
+_ratings_lock = threading.Lock()
+
+def get_power_ratings(refresh=False):
+    """The saved ratings, brought up to date with any new games in the logs (once per process).
+
+    The games left on the schedule, which only future_sos uses, are
+    re-read each time; when ESPN can't be reached the saved ones are kept.
+    """
+    global _ratings
+    with _ratings_lock:
+        if _ratings is None or refresh:
+            ratings = PowerRatings.load()
+            changed = ratings.update(load_games())
+            since = ratings.last_date.date() if ratings.last_date is not None else date.today()
+            try:
+                schedule = load_schedule(since)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f"Keeping the saved schedule for future_sos: {e}")
+            else:
+                remaining = ratings.remaining.copy()
+                ratings.set_schedule(schedule)
+                changed = changed or not np.array_equal(remaining, ratings.remaining)
+            if changed:
+                ratings.save()
+            _ratings = ratings
+    return _ratings
+
+def rating_table(rating, ratings=None):
+    """What the per-rating scripts return: one rating ranked across all teams."""
+    return (ratings or get_power_ratings()).table(rating)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(get_power_ratings().frame().round(3).to_string())
@@ -0,0 +1,15 @@
+# Future strength of schedule power rating for every MLB team, from the local rating engine
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from power_ratings import rating_table
+
+RATING = "future_sos"
+
+def get_future_sos_power_rating(ratings=None):
+    """Teams ranked by their future strength of schedule power rating (see power_ratings.RATINGS)."""
+    return rating_table(RATING, ratings)
+
+if __name__ == "__main__":
+    print(get_future_sos_power_rating().to_string(index=False))
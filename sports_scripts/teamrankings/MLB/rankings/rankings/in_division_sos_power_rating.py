@@ -0,0 +1,15 @@
+# In-division strength of schedule power rating for every MLB team, from the local rating engine
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from power_ratings import rating_table
+
+RATING = "in_division_sos"
+
+def get_in_division_sos_power_rating(ratings=None):
+    """Teams ranked by their in-division strength of schedule power rating (see power_ratings.RATINGS)."""
+    return rating_table(RATING, ratings)
+
+if __name__ == "__main__":
+    print(get_in_division_sos_power_rating().to_string(index=False))
@@ -0,0 +1,15 @@
+# Last 10 games power rating for every MLB team, from the local rating engine
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from power_ratings import rating_table
+
+RATING = "last_10_games"
+
+def get_last_10_games_power_rating(ratings=None):
+    """Teams ranked by their last 10 games power rating (see power_ratings.RATINGS)."""
+    return rating_table(RATING, ratings)
+
+if __name__ == "__main__":
+    print(get_last_10_games_power_rating().to_string(index=False))
@@ -0,0 +1,15 @@
+# Non-division strength of schedule power rating for every MLB team, from the local rating engine
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from power_ratings import rating_table
+
+RATING = "non_division_sos"
+
+def get_non_division_sos_power_rating(ratings=None):
+    """Teams ranked by their non-division strength of schedule power rating (see power_ratings.RATINGS)."""
+    return rating_table(RATING, ratings)
+
+if __name__ == "__main__":
+    print(get_non_division_sos_power_rating().to_string(index=False))
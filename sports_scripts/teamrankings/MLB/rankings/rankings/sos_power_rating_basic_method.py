@@ -0,0 +1,15 @@
+# Strength of schedule (basic method) power rating for every MLB team, from the local rating engine
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from power_ratings import rating_table
+
+RATING = "sos_basic_method"
+
+def get_sos_power_rating_basic_method(ratings=None):
+    """Teams ranked by their strength of schedule (basic method) power rating (see power_ratings.RATINGS)."""
+    return rating_table(RATING, ratings)
+
+if __name__ == "__main__":
+    print(get_sos_power_rating_basic_method().to_string(index=False))
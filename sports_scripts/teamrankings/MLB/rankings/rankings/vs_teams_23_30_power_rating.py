@@ -0,0 +1,15 @@
+# Vs teams ranked 23-30 power rating for every MLB team, from the local rating engine
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from power_ratings import rating_table
+
+RATING = "vs_teams_23_30"
+
+def get_vs_teams_23_30_power_rating(ratings=None):
+    """Teams ranked by their vs teams ranked 23-30 power rating (see power_ratings.RATINGS)."""
+    return rating_table(RATING, ratings)
+
+if __name__ == "__main__":
+    print(get_vs_teams_23_30_power_rating().to_string(index=False))
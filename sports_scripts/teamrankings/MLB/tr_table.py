@@ -0,0 +1,106 @@
+# Browser-free extraction of TeamRankings tr-table pages
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from lxml import html as lxml_html
+
+from driver_pool import new_chrome_driver, wait_for_table
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from http_cache import cached_get
+
+logger = logging.getLogger(__name__)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+}
+HTTP_WORKERS = 8
+
+TR_TABLE_XPATH = '//table[contains(concat(" ", normalize-space(@class), " "), " tr-table ")]'
+
+# One keep-alive session per worker thread
+_thread_state = threading.local()
+
+def get_session():
+    """Return the calling thread's shared HTTP session."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        _thread_state.session = session
+    return session
+
+def parse_tr_table(page_html):
+    """Parse the first populated tr-table in a page into a DataFrame, or None.
+
+    The header row becomes the columns, matching what the Selenium scrapers
+    produced cell by cell.
+    """
+    tree = lxml_html.fromstring(page_html)
+    for table in tree.xpath(TR_TABLE_XPATH):
+        data = []
+        for row in table.xpath(".//tr"):
+            cols = row.xpath("./td") or row.xpath("./th")
+            data.append([col.text_content().strip() for col in cols])
+        if len(data) > 1:
+            return pd.DataFrame(data[1:], columns=data[0])
+    return None
+
+def parse_page(page_html, entry=None):
+    """parse_tr_table, counting bytes and parse time on a run-report entry when given."""
+    if entry is None:
+        return parse_tr_table(page_html)
+    entry.bytes += len(page_html)
+    with entry.parsing():
+        return parse_tr_table(page_html)
+
+def fetch_tr_table(url, entry=None):
+    """Fetch a page over plain HTTP and parse its tr-table; None if there isn't one."""
+    response = cached_get(url, session=get_session())
+    response.raise_for_status()
+    return parse_page(response.text, entry)
+
+def render_tr_table(url, driver, entry=None):
+    """Render a page in a browser and parse its tr-table from one page_source read."""
+    driver.get(url)
+    wait_for_table(driver)
+    if entry is not None:
+        entry.extra["rendered"] = True
+    return parse_page(driver.page_source, entry)
+
+def read_tr_table(url, pool=None, entry=None):
+    """Read a tr-table, falling back to Selenium only when the static HTML has none.
+
+    The fallback borrows a driver from `pool` when given, otherwise it starts
+    and quits a one-off browser.
+    """
+    try:
+        df = fetch_tr_table(url, entry)
+        if df is not None:
+            return df
+        logger.debug(f"No tr-table in static HTML, rendering in browser: {url}")
+    except requests.RequestException as e:
+        logger.debug(f"Static fetch failed ({e}), rendering in browser: {url}")
+
+    if pool is not None:
+        with pool.driver() as driver:
+            return render_tr_table(url, driver, entry)
+    driver = new_chrome_driver()
+    try:
+        return render_tr_table(url, driver, entry)
+    finally:
+        driver.quit()
+
+def scrape_pages(func, jobs, max_workers=HTTP_WORKERS, **context):
+    """Run func(*job, **context) for every job on a thread pool; returns results in order.
+
+    `context` is the run-wide state every job shares (pool=, report=, sink=).
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, *job, **context) for job in jobs]
+        return [future.result() for future in futures]
@@ -1,37 +1,48 @@
-import time
+import sys
 from selenium import webdriver
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
 import os
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from driver_pool import wait_for_table
+
 # Base directory for saving files
 BASE_DIR = "/Users/kamahl/BLOG_AI/sports_scripts/teamrankings/MLB/trends/chicago-cubs"
 os.makedirs(BASE_DIR, exist_ok=True)
 
-def fetch_and_save_chicago_cubs_run_line_trends():
-    """Fetch and save Chicago Cubs Run Line trends from TeamRankings."""
+def fetch_and_save_chicago_cubs_run_line_trends(driver=None):
+    """Fetch and save Chicago Cubs Run Line trends from TeamRankings.
+
+    Pass a pooled driver to reuse a warm browser; otherwise a headless Firefox
+    is started and quit for this page.
+    """
     url = "https://www.teamrankings.com/mlb/team/chicago-cubs/run-line-trends"
 
-    # Set up headless Firefox
-    options = Options()
-    options.headless = True
-    driver = webdriver.Firefox(options=options)
+    own_driver = driver is None
+    if own_driver:
+        # Set up headless Firefox
+        options = Options()
+        options.add_argument("--headless")
+        driver = webdriver.Firefox(options=options)
 
+    try:
+        return scrape_run_line_trends(driver, url)
+    finally:
+        if own_driver:
+            driver.quit()
+
+def scrape_run_line_trends(driver, url):
+    """Scrape the run line trends table on an already-open driver and save it."""
     print("Fetching Run Line trends for Chicago Cubs")
     driver.get(url)
 
-    # Wait for the table to load (up to 10 seconds)
+    # Wait until the table rows are populated (up to 10 seconds)
     try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "tr-table"))
-        )
-        time.sleep(2)
+        wait_for_table(driver)
     except Exception as e:
         print(f"Error waiting for table: {e}")
-        driver.quit()
         return None
 
     tables = driver.find_elements(By.TAG_NAME, "table")
@@ -39,7 +50,6 @@ def fetch_and_save_chicago_cubs_run_line_trends():
 
     if not tables:
         print("No tables found.")
-        driver.quit()
         return None
 
     data = []
@@ -55,8 +65,6 @@ def fetch_and_save_chicago_cubs_run_line_trends():
                     print(f"Row data: {row_data}")
                     data.append(row_data)
 
-    driver.quit()
-
     if not data:
         print("No data extracted.")
         return None
@@ -1,13 +1,17 @@
 # Team Trends Scraper
 import os
-import time
-import pandas as pd
+import sys
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from driver_pool import DriverPool, POOL_SIZE
+from tr_table import read_tr_table, scrape_pages
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from run_report import RunReport, verbose_requested
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../data_pipeline/storage')))
+from parquet_store import keep_csv, scrape_sink
 
 # MLB teams with their URL slugs
 MLB_TEAMS = [
@@ -49,110 +53,60 @@ def get_timestamp():
     """Generate timestamp string for CSV header"""
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-def fetch_and_save_table(url, team_dir, data_type):
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--user-agent=Mozilla/5.0")
-
-    driver = webdriver.Chrome(options=options)
-    print(f"Fetching: {url}")
-    driver.get(url)
+def fetch_and_save_table(url, team_dir, data_type, pool=None, report=None, sink=None):
+    report = report or RunReport("team_trends", log_dir=None)
 
     try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "tr-table"))
-        )
-        time.sleep(2)
-        tables = driver.find_elements(By.CLASS_NAME, "tr-table")
-
-        for table in tables:
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            data = []
-            for row in rows:
-                cols = row.find_elements(By.TAG_NAME, "td")
-                if not cols:
-                    cols = row.find_elements(By.TAG_NAME, "th")
-                data.append([col.text.strip() for col in cols])
-
-            if len(data) > 1:
-                df = pd.DataFrame(data[1:], columns=data[0])
-                
+        with report.job(os.path.basename(team_dir), data_type) as entry:
+            # Static HTML first; a pooled browser is only used if the table isn't there
+            df = read_tr_table(url, pool=pool, entry=entry)
+            if df is not None:
                 # Create filename with team name and data type
                 team_name = team_dir.split('/')[-1].replace('-', '_')
                 filename = f"{team_name}_{data_type.replace('-', '_')}.csv"
                 file_path = os.path.join(team_dir, filename)
-                
-                # Add timestamp to the beginning of the file
-                current_time = get_timestamp()
-                with open(file_path, 'w') as f:
-                    f.write(f"# Data scraped on: {current_time}\n")
-                    df.to_csv(f, index=False)
-                
-                print(f"Saved to: {file_path}\n")
-                print(df.head())
-                break
-        else:
-            print("❌ No valid tables found.")
+            
+                if keep_csv(sink):
+                    # Add timestamp to the beginning of the file
+                    current_time = get_timestamp()
+                    with open(file_path, 'w') as f:
+                        f.write(f"# Data scraped on: {current_time}\n")
+                        df.to_csv(f, index=False)
+                if sink is not None:
+                    sink.add("tr_team_trends", df, season=datetime.now().year, team=os.path.basename(team_dir), data_type=data_type)
+
+                entry.rows = len(df)
+                entry.extra["file"] = file_path
+                report.detail(f"Saved to: {file_path}\n{df.head()}")
+            else:
+                report.detail(f"❌ No valid tables found: {url}")
 
     except Exception as e:
-        print(f"❌ Error: {e}")
-    finally:
-        driver.quit()
+        report.detail(f"❌ Error: {url}: {e}")
 
-if __name__ == "__main__":
-    
+# Trend pages scraped for every team
+TREND_PAGES = [
+    "over-under-trends",
+    "win-trends",
+    "over-under-results",
+    "run-line-results",
+    "game-log",
+    "run-line-trends"
+]
+
+def build_trend_jobs():
+    """Create team folders and list (url, team_dir, data_type) for every team page."""
+    jobs = []
     for team in MLB_TEAMS:
-        print(f"\n{'='*50}")
-        print(f"SCRAPING: {team.upper().replace('-', ' ')}")
-        print(f"{'='*50}")
-        
-        # Create team directory
         team_dir = os.path.join(BASE_DIR, team)
         os.makedirs(team_dir, exist_ok=True)
-        
-        # Over Under Trends
-        fetch_and_save_table(
-            f"https://www.teamrankings.com/mlb/team/{team}/over-under-trends",
-            team_dir,
-            "over-under-trends"
-        )
-        
-        # Win Trends
-        fetch_and_save_table(
-            f"https://www.teamrankings.com/mlb/team/{team}/win-trends",
-            team_dir,
-            "win-trends"
-        )
-        
-        # Over Under Results
-        fetch_and_save_table(
-            f"https://www.teamrankings.com/mlb/team/{team}/over-under-results",
-            team_dir,
-            "over-under-results"
-        )
-        
-        # Run Line Results
-        fetch_and_save_table(
-            f"https://www.teamrankings.com/mlb/team/{team}/run-line-results",
-            team_dir,
-            "run-line-results"
-        )
-        
-        # Game Log
-        fetch_and_save_table(
-            f"https://www.teamrankings.com/mlb/team/{team}/game-log",
-            team_dir,
-            "game-log"
-        )
-        
-        # Run Line Trends
-        fetch_and_save_table(
-            f"https://www.teamrankings.com/mlb/team/{team}/run-line-trends",
-            team_dir,
-            "run-line-trends"
-        )
-        
-        # Add small delay between teams to be respectful
-        time.sleep(1)
\ No newline at end of file
+        for data_type in TREND_PAGES:
+            jobs.append((f"https://www.teamrankings.com/mlb/team/{team}/{data_type}", team_dir, data_type))
+    return jobs
+
+if __name__ == "__main__":
+    jobs = build_trend_jobs()
+    print(f"Scraping {len(jobs)} trend pages for {len(MLB_TEAMS)} teams")
+    # tr_table.HTTP_WORKERS pages are fetched at once; the pool only caps concurrent browser fallbacks
+    with RunReport("team_trends", verbose=verbose_requested()) as report, DriverPool(POOL_SIZE) as pool, scrape_sink() as sink:
+        scrape_pages(fetch_and_save_table, jobs, pool=pool, report=report, sink=sink)
@@ -11,8 +11,13 @@ import pandas as pd
 import re
 import time
 import random
+import os
+import sys
 from datetime import datetime
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../sports_scripts')))
+from http_cache import cached_get
+
 # Set up user agent to mimic a real browser
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
@@ -39,7 +44,7 @@ def fetch_html(url):
     for attempt in range(max_retries):
         try:
             print(f"📡 Fetching {url}...")
-            response = requests.get(url, headers=HEADERS, timeout=10)
+            response = cached_get(url, headers=HEADERS)
             response.raise_for_status()
             return response.text
         except requests.exceptions.RequestException as e:
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+ESPN MLB team job runner
+Fans the six team-level datasets (stats, splits, injuries, news, roster,
+schedule) out across all 30 teams on a bounded thread pool, from one shared
+parse of the team list. The URL pattern that worked for each dataset is
+remembered between runs and tried first; patterns that keep failing are
+tried last.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+import pandas as pd
+import requests
+
+from scrape_team_stats import HEADERS, current_year, parse_team_list
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../sports_scripts')))
+from http_cache import cached_get
+from run_report import RunReport, verbose_requested
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../data_pipeline/storage')))
+from parquet_store import keep_csv, scrape_sink
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = 8
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "team_jobs")
+PATTERN_FILE = os.path.join(OUTPUT_DIR, "url_patterns.json")
+
+def parse_tables(html):
+    """Every table on an ESPN team page as one DataFrame.
+
+    ESPN splits wide tables into a fixed-left name table and a scrolling stats
+    table with the same rows; adjacent tables of equal length are joined back
+    together. A `table` column keeps the tables apart.
+    """
+    try:
+        tables = pd.read_html(StringIO(html))
+    except ValueError:
+        return pd.DataFrame()
+    merged = []
+    i = 0
+    while i < len(tables):
+        table = tables[i]
+        if i + 1 < len(tables) and len(table.columns) <= 2 and len(table) == len(tables[i + 1]):
+            table = pd.concat([table, tables[i + 1]], axis=1)
+            i += 1
+        if isinstance(table.columns, pd.MultiIndex):
+            table.columns = [" ".join(str(level) for level in column if "Unnamed" not in str(level)).strip()
+                             for column in table.columns]
+        merged.append(table.assign(table=len(merged)))
+        i += 1
+    return pd.concat(merged, ignore_index=True, sort=False) if merged else pd.DataFrame()
+
+def parse_news(text):
+    """Headlines from ESPN's news API."""
+    articles = json.loads(text).get("articles", [])
+    return pd.DataFrame([{
+        "headline": article.get("headline"),
+        "description": article.get("description"),
+        "published": article.get("published"),
+        "link": article.get("links", {}).get("web", {}).get("href"),
+    } for article in articles])
+
+# Dataset -> (URL patterns in the order first tried, parser)
+DATASETS = {
+    "stats": ([
+        "https://www.espn.com/mlb/team/stats/_/name/{abbr}/season/{year}/seasontype/2",
+        "https://www.espn.com/mlb/team/stats/_/name/{abbr}",
+    ], parse_tables),
+    "splits": ([
+        "https://www.espn.com/mlb/team/splits/_/name/{abbr}/season/{year}",
+        "https://www.espn.com/mlb/team/stats/splits/_/name/{abbr}/season/{year}",
+        "https://www.espn.com/mlb/team/_/name/{abbr}/season/{year}/splits",
+        "https://www.espn.com/mlb/team/splits/_/name/{abbr}",
+    ], parse_tables),
+    "injuries": ([
+        "https://www.espn.com/mlb/team/injuries/_/name/{abbr}",
+    ], parse_tables),
+    "news": ([
+        "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/news?team={abbr}",
+    ], parse_news),
+    "roster": ([
+        "https://www.espn.com/mlb/team/roster/_/name/{abbr}",
+    ], parse_tables),
+    "schedule": ([
+        "https://www.espn.com/mlb/team/schedule/_/name/{abbr}/season/{year}",
+        "https://www.espn.com/mlb/team/schedule/_/name/{abbr}",
+    ], parse_tables),
+}
+
+class PatternMemory:
+    """Which URL pattern worked for each dataset, kept in a small JSON file.
+
+    order() puts the last pattern that produced rows first and patterns that
+    have only ever failed last, so a normal run costs one request per job.
+    """
+
+    def __init__(self, path=PATTERN_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r") as f:
+                self.state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.state = {}
+
+    def order(self, dataset, patterns):
+        with self._lock:
+            state = self.state.get(dataset, {})
+            working = state.get("working")
+            failures = state.get("failures", {})
+        rank = {pattern: i for i, pattern in enumerate(patterns)}
+        return sorted(patterns, key=lambda p: (p != working, failures.get(p, 0) > 0, rank[p]))
+
+    def record(self, dataset, pattern, ok):
+        with self._lock:
+            state = self.state.setdefault(dataset, {"working": None, "failures": {}})
+            if ok:
+                state["working"] = pattern
+                state["failures"].pop(pattern, None)
+            else:
+                state["failures"][pattern] = state["failures"].get(pattern, 0) + 1
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with self._lock:
+            with open(tmp_path, "w") as f:
+                json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+def run_team_job(team, dataset, memory, entry, year=current_year):
+    """Fetch one dataset for one team, trying remembered patterns first; returns a DataFrame."""
+    patterns, parse = DATASETS[dataset]
+    for pattern in memory.order(dataset, patterns):
+        url = pattern.format(abbr=team["abbr"], year=year)
+        try:
+            response = cached_get(url, headers=HEADERS)
+            response.raise_for_status()
+            entry.bytes += len(response.content)
+            with entry.parsing():
+                df = parse(response.text)
+        except (requests.RequestException, ValueError) as e:
+            logger.debug(f"{dataset} pattern failed for {team['abbr']}: {url}: {e}")
+            memory.record(dataset, pattern, ok=False)
+            continue
+        if df.empty:
+            memory.record(dataset, pattern, ok=False)
+            continue
+        memory.record(dataset, pattern, ok=True)
+        entry.extra["url"] = url
+        return df.assign(team=team["name"], team_abbr=team["abbr"])
+    return pd.DataFrame()
+
+def run_team_jobs(teams=None, datasets=None, max_workers=MAX_WORKERS, output_dir=OUTPUT_DIR, verbose=False):
+    """Run every (team, dataset) job and write one table per dataset; returns {dataset: DataFrame}."""
+    teams = teams if teams is not None else parse_team_list()
+    datasets = datasets or list(DATASETS)
+    memory = PatternMemory(os.path.join(output_dir, "url_patterns.json"))
+    results = {dataset: [] for dataset in datasets}
+
+    def job(report, team, dataset):
+        with report.job(team["abbr"], dataset) as entry:
+            df = run_team_job(team, dataset, memory, entry)
+            entry.rows = len(df)
+            return df
+
+    with RunReport("espn_team_jobs", verbose=verbose) as report:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(job, report, team, dataset): dataset
+                for team in teams for dataset in datasets
+            }
+            for future, dataset in futures.items():
+                try:
+                    df = future.result()
+                except Exception:
+                    continue  # already recorded as failed by the report
+                if not df.empty:
+                    results[dataset].append(df)
+    memory.save()
+
+    frames = {dataset: pd.concat(parts, ignore_index=True, sort=False) for dataset, parts in results.items() if parts}
+    os.makedirs(output_dir, exist_ok=True)
+    with scrape_sink() as sink:
+        for dataset, df in frames.items():
+            if keep_csv(sink):
+                df.to_csv(os.path.join(output_dir, f"espn_mlb_team_{dataset}_{current_year}.csv"), index=False)
+            if sink is not None:
+                sink.add(f"espn_team_{dataset}", df, season=current_year)
+    return frames
+
+def main():
+    teams = parse_team_list()
+    if not teams:
+        print("❌ Failed to retrieve MLB teams list.")
+        return
+    run_team_jobs(teams, verbose=verbose_requested())
+
+if __name__ == "__main__":
+    main()
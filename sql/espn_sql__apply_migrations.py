@@ -39,6 +39,7 @@ def drop_all_tables(supabase):
     DROP TABLE IF EXISTS player_stats CASCADE;
     DROP TABLE IF EXISTS player_splits CASCADE;
     DROP TABLE IF EXISTS odds_data CASCADE;
+    DROP TABLE IF EXISTS odds_snapshots CASCADE;
     DROP TABLE IF EXISTS migration_history CASCADE;
     """
     try:
@@ -55,7 +56,8 @@ def verify_schema(supabase):
         'team_stats': ['season', 'games', 'batting_avg'],
         'player_stats': ['season', 'games', 'batting_avg'],
         'player_splits': ['season', 'split_type', 'batting_avg'],
-        'odds_data': ['home_odds', 'away_odds'],
+        'odds_data': ['event_id', 'home_odds', 'away_odds'],
+        'odds_snapshots': ['event_id', 'bookmaker', 'market', 'captured_at'],
         'migration_history': ['migration_name']
     }
     for table, columns in tables.items():
@@ -75,7 +77,7 @@ def check_existing_tables(supabase):
             SELECT table_name
             FROM information_schema.tables
             WHERE table_schema = 'public'
-            AND table_name IN ('team_stats', 'player_stats', 'player_splits', 'odds_data', 'migration_history')
+            AND table_name IN ('team_stats', 'player_stats', 'player_splits', 'odds_data', 'odds_snapshots', 'migration_history')
             """
         }).execute()
         tables = [row['table_name'] for row in result.data]
@@ -110,7 +112,12 @@ def apply_migrations():
         'sql/migrations/003_create_team_stats_table.sql',
         'sql/migrations/004_create_player_stats_table.sql',
         'sql/migrations/005_create_player_splits_table.sql',
-        'sql/migrations/006_fix_odds_data_table.sql'
+        'sql/migrations/006_fix_odds_data_table.sql',
+        'sql/migrations/007_add_natural_key_constraints.sql',
+        'sql/migrations/008_create_odds_snapshots_table.sql',
+        'sql/migrations/009_add_roster_natural_key.sql',
+        'sql/migrations/010_key_odds_data_on_event_id.sql',
+        'sql/migrations/011_natural_keys_nulls_not_distinct.sql'
     ]
     
     for file in migration_files:
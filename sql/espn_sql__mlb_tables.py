@@ -1,14 +1,15 @@
 from dotenv import load_dotenv
 import os
-from supabase import create_client, Client
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from database.supabase_client import get_client
 
 load_dotenv()
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-
 # Define the tables and columns
 tables = {
     "teams": {
@@ -84,7 +85,7 @@ def create_tables():
         print("❌ Missing Supabase URL or Key.")
         return
 
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    supabase = get_client()
     for table_name, columns in tables.items():
         try:
             columns_sql = ", ".join([f"{name} {datatype}" for name, datatype in columns.items()])
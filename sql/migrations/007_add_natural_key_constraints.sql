@@ -0,0 +1,30 @@
+-- Natural keys used by the batched upsert writer (data_pipeline/fetch/supabase_writer.py).
+-- Remove duplicates left by earlier per-row inserts, keeping the newest row.
+DELETE FROM team_stats a USING team_stats b
+WHERE a.id < b.id
+  AND a.sport = b.sport AND a.team_name = b.team_name AND a.stat_type = b.stat_type
+  AND a.season = b.season AND a.stat_date IS NOT DISTINCT FROM b.stat_date;
+
+DELETE FROM player_stats a USING player_stats b
+WHERE a.id < b.id
+  AND a.sport = b.sport AND a.player_name = b.player_name AND a.team_name = b.team_name
+  AND a.stat_type = b.stat_type AND a.season = b.season AND a.stat_date IS NOT DISTINCT FROM b.stat_date;
+
+DELETE FROM player_splits a USING player_splits b
+WHERE a.id < b.id
+  AND a.sport = b.sport AND a.player_name = b.player_name AND a.split_type = b.split_type
+  AND a.split_value = b.split_value AND a.season = b.season AND a.stat_date IS NOT DISTINCT FROM b.stat_date;
+
+DELETE FROM odds_data a USING odds_data b
+WHERE a.id < b.id
+  AND a.sport = b.sport AND a.home_team = b.home_team AND a.away_team = b.away_team
+  AND a.game_date IS NOT DISTINCT FROM b.game_date;
+
+ALTER TABLE team_stats
+    ADD CONSTRAINT team_stats_natural_key UNIQUE (sport, team_name, stat_type, season, stat_date);
+ALTER TABLE player_stats
+    ADD CONSTRAINT player_stats_natural_key UNIQUE (sport, player_name, team_name, stat_type, season, stat_date);
+ALTER TABLE player_splits
+    ADD CONSTRAINT player_splits_natural_key UNIQUE (sport, player_name, split_type, split_value, season, stat_date);
+ALTER TABLE odds_data
+    ADD CONSTRAINT odds_data_natural_key UNIQUE (sport, home_team, away_team, game_date);
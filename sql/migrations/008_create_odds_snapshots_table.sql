@@ -0,0 +1,26 @@
+-- Line-movement history: one row per (event, bookmaker, market) each time its prices change.
+-- h2h fills home/away_price; spreads adds home/away_point; totals fills over/under_price and total_point.
+CREATE TABLE IF NOT EXISTS odds_snapshots (
+    id SERIAL PRIMARY KEY,
+    sport VARCHAR(50) NOT NULL,
+    event_id VARCHAR(64) NOT NULL,
+    commence_time TIMESTAMP NOT NULL,
+    home_team VARCHAR(100) NOT NULL,
+    away_team VARCHAR(100) NOT NULL,
+    bookmaker VARCHAR(50) NOT NULL,
+    market VARCHAR(20) NOT NULL,
+    home_price INTEGER,
+    away_price INTEGER,
+    home_point NUMERIC(5,1),
+    away_point NUMERIC(5,1),
+    over_price INTEGER,
+    under_price INTEGER,
+    total_point NUMERIC(5,1),
+    last_update TIMESTAMP,
+    captured_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE odds_snapshots
+    ADD CONSTRAINT odds_snapshots_natural_key UNIQUE (event_id, bookmaker, market, captured_at);
+CREATE INDEX IF NOT EXISTS idx_odds_snapshots_commence_time ON odds_snapshots (commence_time);
@@ -0,0 +1,8 @@
+-- Natural key for roster_data, so fetch_roster can upsert players instead of deleting and reinserting the team.
+-- Remove duplicates left by earlier reinserts, keeping one row per player (the table has no migration-declared id).
+DELETE FROM roster_data a USING roster_data b
+WHERE a.ctid < b.ctid
+  AND a.team_name = b.team_name AND a.player_name = b.player_name;
+
+ALTER TABLE roster_data
+    ADD CONSTRAINT roster_data_natural_key UNIQUE (team_name, player_name);
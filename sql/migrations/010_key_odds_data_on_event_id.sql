@@ -0,0 +1,11 @@
+-- Key odds_data on The Odds API event id: (sport, home_team, away_team, game_date)
+-- merged both games of a doubleheader into one row.
+ALTER TABLE odds_data ADD COLUMN IF NOT EXISTS event_id VARCHAR(64);
+
+-- Rows written before event ids were stored keep a unique placeholder so the column can be NOT NULL.
+UPDATE odds_data SET event_id = 'legacy-' || id WHERE event_id IS NULL;
+ALTER TABLE odds_data ALTER COLUMN event_id SET NOT NULL;
+
+ALTER TABLE odds_data DROP CONSTRAINT IF EXISTS odds_data_natural_key;
+ALTER TABLE odds_data
+    ADD CONSTRAINT odds_data_natural_key UNIQUE (sport, event_id);
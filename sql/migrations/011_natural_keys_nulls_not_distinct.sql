@@ -0,0 +1,27 @@
+-- 007's natural keys include the nullable stat_date, and Postgres treats NULLs as distinct,
+-- so rows without a stat_date never conflicted and kept duplicating. Compare NULLs as equal
+-- (Postgres 15+), as 007's dedupe and the local warehouse's unique indexes already do.
+DELETE FROM team_stats a USING team_stats b
+WHERE a.id < b.id
+  AND a.sport = b.sport AND a.team_name = b.team_name AND a.stat_type = b.stat_type
+  AND a.season = b.season AND a.stat_date IS NOT DISTINCT FROM b.stat_date;
+
+DELETE FROM player_stats a USING player_stats b
+WHERE a.id < b.id
+  AND a.sport = b.sport AND a.player_name = b.player_name AND a.team_name = b.team_name
+  AND a.stat_type = b.stat_type AND a.season = b.season AND a.stat_date IS NOT DISTINCT FROM b.stat_date;
+
+DELETE FROM player_splits a USING player_splits b
+WHERE a.id < b.id
+  AND a.sport = b.sport AND a.player_name = b.player_name AND a.split_type = b.split_type
+  AND a.split_value = b.split_value AND a.season = b.season AND a.stat_date IS NOT DISTINCT FROM b.stat_date;
+
+ALTER TABLE team_stats DROP CONSTRAINT IF EXISTS team_stats_natural_key;
+ALTER TABLE team_stats
+    ADD CONSTRAINT team_stats_natural_key UNIQUE NULLS NOT DISTINCT (sport, team_name, stat_type, season, stat_date);
+ALTER TABLE player_stats DROP CONSTRAINT IF EXISTS player_stats_natural_key;
+ALTER TABLE player_stats
+    ADD CONSTRAINT player_stats_natural_key UNIQUE NULLS NOT DISTINCT (sport, player_name, team_name, stat_type, season, stat_date);
+ALTER TABLE player_splits DROP CONSTRAINT IF EXISTS player_splits_natural_key;
+ALTER TABLE player_splits
+    ADD CONSTRAINT player_splits_natural_key UNIQUE NULLS NOT DISTINCT (sport, player_name, split_type, split_value, season, stat_date);
@@ -0,0 +1,66 @@
+import os
+import sys
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../data_pipeline/model_training')))
+from backtest import american_to_decimal, build_candidates, evaluate, load_results, past_residual, prepare, replay
+
+def games(home_open, home_won, days):
+    odds = pd.DataFrame({
+        "event_id": [f"e{i}" for i in range(len(days))], "home_team": "Kansas City Royals", "away_team": "Cleveland Guardians",
+        "game_date": pd.to_datetime(days), "home_open": home_open, "away_open": [2.0] * len(days),
+        "home_close": [1.8] * len(days), "away_close": [2.1] * len(days),
+    })
+    results = pd.DataFrame({"game_date": pd.to_datetime(days), "home_team": "Kansas City Royals",
+                            "home_score": [5 if won else 1 for won in home_won], "away_score": 3})
+    return build_candidates(odds, results)
+
+def test_american_to_decimal():
+    assert american_to_decimal([-150, 130]).round(3).tolist() == [1.667, 2.3]
+
+def test_load_results_reads_the_latest_parquet_game_log(tmp_path):
+    from parquet_store import ParquetSink
+    columns = ["Date", "Opponent", "Opp Rank", "H/A/N", "Score"]
+    with ParquetSink(str(tmp_path / "parquet")) as sink:
+        for scraped_at, rows in (("2025-04-02 09:00", [["04/01", "Cleveland", "12", "Home", "W 5-3"]]),
+                                 ("2025-04-04 09:00", [["04/01", "Cleveland", "12", "Home", "W 5-3"],
+                                                       ["04/02", "Cleveland", "12", "Home", "L 1-3"],
+                                                       ["04/03", "at Detroit", "8", "Away", "W 2-0"]])):
+            sink.add("tr_team_trends", pd.DataFrame(rows, columns=columns), season=2025,
+                     scraped_at=scraped_at, team="kansas-city-royals", data_type="game-log")
+    legacy = tmp_path / "trends" / "st-louis-cardinals"
+    os.makedirs(legacy)
+    (legacy / "st_louis_cardinals_game_log.csv").write_text(
+        "# Data scraped on: 2025-04-04 09:00:00\nDate,Opponent,Opp Rank,H/A/N,Score\n04/01,Cincinnati,20,Home,L 0-1\n")
+    results = load_results(str(tmp_path / "trends"), root=str(tmp_path / "parquet"))
+    results = results.sort_values(["home_team", "game_date"])
+    assert results["home_team"].tolist() == ["Kansas City Royals", "Kansas City Royals", "St. Louis Cardinals"]
+    assert results["game_date"].dt.strftime("%Y-%m-%d").tolist() == ["2025-04-01", "2025-04-02", "2025-04-01"]
+    assert results[["home_score", "away_score"]].values.tolist() == [[5, 3], [1, 3], [0, 1]]
+
+def test_past_residual_excludes_same_day():
+    data = prepare(games([2.0, 2.0, 2.0], [True, False, True], ["2025-04-01", "2025-04-02", "2025-04-03"]))
+    estimate = past_residual(data, data["home"].astype(int))
+    # Day one has no history, day two sees day one's win (1 - 0.5), day three a win and a loss
+    assert estimate[data["home"]].tolist() == [0.0, 0.5, 0.0]
+
+def test_kelly_replay_compounds_by_day():
+    data = prepare(games([2.0, 2.0], [True, False], ["2025-04-01", "2025-04-02"]))
+    probability = np.where(data["home"], 0.6, 0.4)
+    run = replay(data, probability, kelly_fraction=1.0, max_fraction=1.0)
+    # Full Kelly at even money with p=0.6 stakes 20%: win to 1.2, then lose 20% of 1.2
+    assert run["bankroll"].round(4).tolist() == [1.0, 1.2, 0.96]
+    assert run["bet"][data["home"]].all() and not run["bet"][~data["home"]].any()
+
+def test_evaluate_reports_clv_and_drawdown():
+    metrics, calibration, bets = evaluate(
+        games([2.0, 2.0], [True, False], ["2025-04-01", "2025-04-02"]),
+        strategy=lambda data, params: np.where(data["home"], 0.6, 0.4),
+    )
+    assert metrics["bets"] == 2
+    assert metrics["clv"] > 0  # home bet at 2.0, closed at 1.8
+    assert metrics["max_drawdown"] == pytest.approx(0.05)  # capped 5% stakes: a win, then 5% of the peak lost
+    assert list(bets["side"]) == ["home", "home"]
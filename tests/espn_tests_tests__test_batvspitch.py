@@ -0,0 +1,60 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("aiohttp")
+pytest.importorskip("bs4")
+pytest.importorskip("lxml")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../sports_scripts/espn/MLB')))
+from mlb_batvspitch import BatVsPitchMatrix, MatchupCache, parse_batvspitch
+
+PAGE = """
+<div class="ResponsiveTable"><table><tbody>
+<tr><td><a href="https://www.espn.com/mlb/player/_/id/32081/gerrit-cole">Gerrit Cole</a></td>
+    <td>12</td><td>4</td><td>1</td><td>0</td><td>1</td><td>3</td><td>2</td><td>5</td>
+    <td>.333</td><td>.429</td><td>.667</td><td>1.095</td></tr>
+<tr><td>Clarke Schmidt</td>
+    <td>3</td><td>0</td><td>0</td><td>0</td><td>0</td><td>0</td><td>0</td><td>1</td>
+    <td>.000</td><td>.000</td><td>.000</td><td>--</td></tr>
+<tr><td>Totals</td>
+    <td>15</td><td>4</td><td>1</td><td>0</td><td>1</td><td>3</td><td>2</td><td>6</td>
+    <td>.267</td><td>.353</td><td>.533</td><td>.886</td></tr>
+</tbody></table></div>
+"""
+
+def test_parse_batvspitch_keeps_pitcher_ids():
+    matchups = parse_batvspitch(PAGE)
+    assert [(m["pitcher_id"], m["pitcher_name"]) for m in matchups] == [("32081", "Gerrit Cole"),
+                                                                        (None, "Clarke Schmidt")]
+    assert matchups[0]["AB"] == "12" and matchups[0]["OPS"] == "1.095"
+
+def test_matrix_lookups_are_numeric():
+    matrix = BatVsPitchMatrix()
+    matrix.add("33", "Test Batter", "10", parse_batvspitch(PAGE))
+    assert matrix.matchup(33, 32081) == {"AB": 12, "H": 4, "2B": 1, "3B": 0, "HR": 1, "RBI": 3, "BB": 2, "SO": 5,
+                                         "AVG": 0.333, "OBP": 0.429, "SLG": 0.667, "OPS": 1.095, "team_id": "10"}
+    # A row without a pitcher link is keyed by name; a blank rate stays missing
+    assert matrix.matchup("33", "name:Clarke Schmidt")["OPS"] is None
+    assert matrix.lineup_vs(["33", "34"], "32081")["batter_name"].tolist() == ["Test Batter"]
+
+def test_matrix_save_load_round_trip(tmp_path):
+    matrix = BatVsPitchMatrix()
+    matrix.add("33", "Test Batter", "10", parse_batvspitch(PAGE))
+    path = str(tmp_path / "matrix.csv")
+    matrix.save(path)
+    loaded = BatVsPitchMatrix.load(path)
+    assert loaded.cells == matrix.cells
+    assert loaded.batters == matrix.batters and loaded.pitchers == matrix.pitchers
+
+def test_matchup_cache_prunes_old_days(tmp_path):
+    for day in ("2025-05-01", "2025-05-03", "2025-05-04"):
+        os.makedirs(tmp_path / day)
+    os.makedirs(tmp_path / "notes")
+    cache = MatchupCache(str(tmp_path), day=date(2025, 5, 4))
+    assert sorted(os.listdir(tmp_path)) == ["2025-05-03", "2025-05-04", "notes"]
+    cache.put("33", "10", [{"pitcher_id": "32081", "pitcher_name": "Gerrit Cole"}])
+    assert MatchupCache(str(tmp_path), day=date(2025, 5, 4)).get("33", "10")[0]["pitcher_id"] == "32081"
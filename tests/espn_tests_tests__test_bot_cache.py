@@ -0,0 +1,78 @@
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("supabase")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from database.cache_invalidation import invalidate
+from discord_bot.utils.db import TTLCache
+
+def test_concurrent_requests_share_one_load(tmp_path):
+    cache = TTLCache(str(tmp_path / "versions.json"))
+    calls = []
+    release = threading.Event()
+
+    def load():
+        calls.append(1)
+        release.wait(1)
+        return ["Chicago Cubs"]
+
+    async def spam():
+        waiters = [asyncio.create_task(cache.get("odds", "Cubs", load, ttl=30)) for _ in range(50)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*waiters)
+
+    results = asyncio.run(spam())
+    assert len(calls) == 1
+    assert all(result == ["Chicago Cubs"] for result in results)
+    assert cache.stats["coalesced"] == 49
+
+def test_ttl_and_pipeline_invalidation(tmp_path):
+    path = str(tmp_path / "versions.json")
+    cache = TTLCache(path)
+    calls = []
+
+    def load():
+        calls.append(1)
+        return len(calls)
+
+    async def run():
+        first = await cache.get("roster", "Cubs", load, ttl=60)
+        cached = await cache.get("roster", " cubs", load, ttl=60)
+        invalidate("roster", "Yankees", path=path)
+        unrelated = await cache.get("roster", "Cubs", load, ttl=60)
+        invalidate("roster", "Cubs", path=path)
+        reloaded = await cache.get("roster", "Cubs", load, ttl=60)
+        expired = await cache.get("roster", "Mets", load, ttl=0)
+        again = await cache.get("roster", "Mets", load, ttl=0)
+        return first, cached, unrelated, reloaded, expired, again
+
+    assert asyncio.run(run()) == (1, 1, 1, 2, 3, 4)
+
+def test_failed_load_is_not_cached(tmp_path):
+    cache = TTLCache(str(tmp_path / "versions.json"))
+
+    def fail():
+        raise RuntimeError("supabase down")
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await cache.get("odds", "Cubs", fail, ttl=30)
+        return await cache.get("odds", "Cubs", lambda: "ok", ttl=30)
+
+    assert asyncio.run(run()) == "ok"
+
+def test_empty_result_can_skip_the_cache(tmp_path):
+    cache = TTLCache(str(tmp_path / "versions.json"))
+    rosters = iter([[], ["Aaron Judge"]])
+
+    async def run():
+        first = await cache.get("roster", "yankees", lambda: next(rosters), ttl=3600, cache_empty=False)
+        second = await cache.get("roster", "Yankees", lambda: next(rosters), ttl=3600, cache_empty=False)
+        return first, second
+
+    assert asyncio.run(run()) == ([], ["Aaron Judge"])
@@ -0,0 +1,56 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../data_pipeline')))
+from dag import DAG
+
+def test_independent_stages_overlap():
+    dag = DAG("test")
+    dag.add("a", lambda: time.sleep(0.2) or 1)
+    dag.add("b", lambda: time.sleep(0.2) or 2)
+    dag.add("sum", lambda a, b: a + b, deps=("a", "b"))
+    run = dag.run()
+    assert run.ok
+    assert run.value("sum") == 3
+    assert run.seconds < 0.35
+    assert run.critical_path[-1] == "sum"
+
+def test_retry_then_success():
+    calls = []
+    def flaky():
+        calls.append(1)
+        if len(calls) < 2:
+            raise ValueError("boom")
+        return "ok"
+    dag = DAG("test")
+    dag.add("flaky", flaky, retries=1, retry_delay=0)
+    run = dag.run()
+    assert run.ok and run.results["flaky"].attempts == 2
+
+def test_failure_skips_downstream_only():
+    dag = DAG("test")
+    dag.add("bad", lambda: 1 / 0)
+    dag.add("good", lambda: 1)
+    dag.add("after_bad", lambda bad: bad, deps=("bad",))
+    run = dag.run()
+    assert run.results["bad"].status == "failed"
+    assert run.results["after_bad"].status == "skipped"
+    assert run.results["good"].status == "ok"
+    assert sorted(run.failed()) == ["after_bad", "bad"]
+
+def test_timeout():
+    dag = DAG("test")
+    dag.add("slow", lambda: time.sleep(1), timeout=0.1, retries=2, retry_delay=0)
+    run = dag.run()
+    assert run.results["slow"].status == "timeout"
+    # The abandoned attempt is still running, so it isn't started a second time
+    assert run.results["slow"].attempts == 1
+
+def test_unknown_dependency_rejected():
+    dag = DAG("test")
+    try:
+        dag.add("x", lambda y: y, deps=("y",))
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
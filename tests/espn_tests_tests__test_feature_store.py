@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../data_pipeline/model_training')))
+import feature_store
+from feature_store import COUNT_STATS, build_features, features_as_of, materialize, training_set
+
+def gamelog(player_id, dates, hits):
+    return pd.DataFrame([
+        dict({stat: 0 for stat in COUNT_STATS}, AB=4, H=h, player_id=player_id, game_id=f"{player_id}-{i}", game_date=d)
+        for i, (d, h) in enumerate(zip(dates, hits))
+    ])
+
+GAMES = pd.concat([
+    gamelog("1", ["2025-04-01", "2025-04-02", "2025-04-02", "2025-04-20"], [1, 2, 0, 3]),
+    gamelog("2", ["2025-04-01", "2025-04-05"], [4, 1]),
+], ignore_index=True)
+
+def test_windows_match_hand_counts():
+    features = build_features(GAMES, game_windows=(2,), day_windows=(7,)).set_index(["player_id", "as_of_date"])
+    # Doubleheader on 04-02 collapses into one row covering both games
+    row = features.loc[("1", pd.Timestamp("2025-04-03"))]
+    assert (row.season_games, row.season_H, row.g2_H, row.d7_H) == (3, 3, 2, 3)
+    row = features.loc[("1", pd.Timestamp("2025-04-21"))]
+    assert (row.g2_H, row.d7_H, row.d7_games) == (3, 3, 1)
+    assert row.g2_AVG == pytest.approx(3 / 8)
+    assert features.loc[("2", pd.Timestamp("2025-04-06"))].season_H == 5
+
+def test_point_in_time_reads(tmp_path, monkeypatch):
+    monkeypatch.setattr(feature_store, "invalidate", lambda namespace: None)
+    features = build_features(GAMES)
+    materialize(features, str(tmp_path))
+    latest = features_as_of("2025-04-10", root=str(tmp_path)).set_index("player_id")
+    assert latest.loc["1", "season_H"] == 3 and latest.loc["1", "days_since_last_game"] == 8
+    X, y = training_set(GAMES, features)
+    # Each player's first game has no history; the rest only see earlier days
+    assert len(X) == 4 and sorted(y) == [0, 1, 2, 3]
+    assert sorted(X["season_H"]) == [1, 1, 3, 4]
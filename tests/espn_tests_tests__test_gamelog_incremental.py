@@ -0,0 +1,98 @@
+import csv
+import os
+import sys
+from datetime import date
+
+import pytest
+
+pytest.importorskip("dateutil")
+pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("aiohttp")
+pytest.importorskip("bs4")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../sports_scripts/espn/MLB')))
+import mlb_gamelog_incremental as incremental
+from mlb_gamelog_incremental import Watermarks, merge_rows, needs_refresh, new_rows, refresh_athlete, seed_marks
+from mlb_gamelog_parser import parse_gamelog
+
+STATS = ['4', '1', '2', '0', '0', '1', '2', '0', '0', '1', '0', '0', '.500', '.500', '1.250', '1.750']
+
+def gamelog(*games):
+    """A gamelog response with one event per (event id, ISO date) plus season totals."""
+    events = {event_id: {'id': event_id, 'gameDate': f'{day}T23:05Z', 'opponent': {'displayName': 'Texas Rangers'},
+                         'atVs': '@', 'homeTeamId': '13', 'homeTeamScore': '2', 'awayTeamScore': '5', 'stats': STATS}
+              for event_id, day in games}
+    return {'events': events, 'summary': {'stats': STATS}}
+
+def athlete(tmp_path):
+    return {"player_id": "33", "player_name": "Test Player", "player_name_dir": "test_player",
+            "team_id": "16", "team_name": "Cubs", "output_dir": str(tmp_path / "cubs" / "test_player")}
+
+def write_csv(path, data):
+    rows, _ = parse_gamelog(data, '16', 'Cubs', 2025)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    merge_rows(path, [row for row in rows if row.month != "Total"], rows[-1])
+
+def read_csv(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+def test_watermarks_round_trip(tmp_path):
+    marks = Watermarks(path=str(tmp_path / "marks.json"))
+    assert marks.get(33) == (None, set())
+    marks.advance(33, date(2025, 5, 2), {"402", "403"})
+    marks.save()
+    assert Watermarks(path=str(tmp_path / "marks.json")).get("33") == (date(2025, 5, 2), {"402", "403"})
+
+def test_new_rows_skips_seen_games_on_the_mark_date():
+    rows, _ = parse_gamelog(gamelog(('401', '2025-05-01'), ('402', '2025-05-02'), ('403', '2025-05-02')),
+                            '16', 'Cubs', 2025)
+    fresh = new_rows(rows, date(2025, 5, 2), {"402"})
+    assert [row.game_id for row in fresh] == ["403"]
+    assert [row.game_id for row in new_rows(rows, None, set())] == ["401", "402", "403"]
+
+def test_merge_rows_skips_rows_already_in_the_csv(tmp_path):
+    path = str(tmp_path / "test_player_gamelog.csv")
+    data = gamelog(('401', '2025-05-01'), ('402', '2025-05-02'))
+    write_csv(path, data)
+    rows, _ = parse_gamelog(gamelog(('401', '2025-05-01'), ('402', '2025-05-02'), ('403', '2025-05-03')),
+                            '16', 'Cubs', 2025)
+    added = merge_rows(path, [row for row in rows if row.month != "Total"], rows[-1])
+    assert [row.game_id for row in added] == ["403"]
+    assert [row["Date"] for row in read_csv(path)] == ["2025-05-01", "2025-05-02", "2025-05-03", "N/A"]
+
+def test_first_refresh_over_an_existing_csv(tmp_path, monkeypatch):
+    player = athlete(tmp_path)
+    path = os.path.join(player["output_dir"], "test_player_gamelog.csv")
+    data = gamelog(('401', '2025-05-01'), ('402', '2025-05-02'))
+    write_csv(path, data)
+    monkeypatch.setattr(incremental, "fetch_json", lambda url: data)
+    marks = Watermarks(path=str(tmp_path / "marks.json"))
+
+    # The full run already wrote both games, so nothing is appended
+    assert refresh_athlete(player, marks, 2025, checked_on=date(2025, 5, 1)) == 0
+    assert len(read_csv(path)) == 3
+    assert marks.get("33") == (date(2025, 5, 2), {"402"})
+
+def test_player_without_games_is_marked_at_the_check(tmp_path, monkeypatch):
+    player = athlete(tmp_path)
+    monkeypatch.setattr(incremental, "fetch_json", lambda url: {})
+    marks = Watermarks(path=str(tmp_path / "marks.json"))
+    assert refresh_athlete(player, marks, 2025, checked_on=date(2025, 5, 3)) == 0
+    assert marks.get("33") == (date(2025, 5, 3), set())
+    assert not needs_refresh(player, marks, {"16": date(2025, 5, 2)})
+    assert needs_refresh(player, marks, {"16": date(2025, 5, 4)})
+    assert not needs_refresh(player, marks, {})
+
+def test_seed_marks_from_parquet(tmp_path):
+    from parquet_store import ParquetSink
+    from mlb_athlete_engine import sink_gamelog_rows
+    rows, _ = parse_gamelog(gamelog(('401', '2025-05-01'), ('402', '2025-05-02')), '16', 'Cubs', 2025)
+    root = str(tmp_path / "parquet")
+    with ParquetSink(root) as sink:
+        sink_gamelog_rows(sink, athlete(tmp_path), rows, 2025)
+    marks = Watermarks(path=str(tmp_path / "marks.json"))
+    marks.advance("34", date(2025, 4, 1), set())
+    assert seed_marks(marks, 2025, root) == 1
+    assert marks.get("33") == (date(2025, 5, 2), {"402"})
+    assert marks.get("34") == (date(2025, 4, 1), set())
@@ -0,0 +1,39 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+
+pytest.importorskip("dateutil")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../sports_scripts/espn/MLB')))
+from mlb_gamelog_parser import format_stat, parse_game_date, parse_gamelog, parse_stat
+
+STATS = ['4', '1', '2', '0', '0', '1', '2', '0', '0', '1', '0', '0', '.500', '.500', '1.250', '1.750']
+
+def test_events_filled_from_index():
+    data = {
+        'events': {
+            '401': {'id': '401', 'gameDate': '2025-04-01T23:05Z', 'opponent': {'displayName': 'Texas Rangers'},
+                    'atVs': '@', 'homeTeamId': '13', 'homeTeamScore': '2', 'awayTeamScore': '5'},
+        },
+        'seasonTypes': [{'displayName': '2025 Regular Season', 'categories': [
+            {'type': 'event', 'events': [{'eventId': '401', 'stats': STATS}]},
+        ]}],
+    }
+    rows, problematic = parse_gamelog(data, '16', 'Cubs', 2025)
+    assert problematic == {}
+    row = rows[0]
+    assert row.date == date(2025, 4, 1) and row.month == 'April'
+    assert row.stats['AB'] == 4 and row.stats['OPS'] == 1.75
+    assert row.csv_row()['Result'] == 'W 5-2'
+    assert row.csv_row()['Batting Average'] == '.500'
+
+def test_parse_game_date_fallback():
+    assert parse_game_date('2025-09-28T18:10Z') == date(2025, 9, 28)
+    assert parse_game_date('Sep 28, 2025') == date(2025, 9, 28)
+    assert parse_game_date(None) is None
+
+def test_parse_stat_keeps_pitcher_innings():
+    # Pitcher gamelogs put IP where batters have AB
+    assert parse_stat('AB', '5.1') == 5.1 and format_stat('AB', 5.1) == '5.1'
+    assert parse_stat('AB', '4') == 4 and parse_stat('AB', '--') is None
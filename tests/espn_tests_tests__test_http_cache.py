@@ -0,0 +1,57 @@
+import http.server
+import os
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("requests")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../sports_scripts')))
+from http_cache import HttpCache, OfflineCacheMiss
+
+class ETagHandler(http.server.BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = b'{"events": {}}'
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    ETagHandler.requests_seen = []
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+def test_fresh_hit_then_conditional_revalidation(server, tmp_path):
+    url = f"{server}/gamelog"
+    cache = HttpCache(str(tmp_path), ttl_rules=[], default_ttl=3600)
+    assert cache.get(url).json() == {"events": {}}
+    assert cache.get(url).from_cache
+    assert ETagHandler.requests_seen == [None]
+
+    stale = HttpCache(str(tmp_path), ttl_rules=[], default_ttl=0)
+    assert stale.get(url).json() == {"events": {}}
+    assert ETagHandler.requests_seen == [None, '"v1"']
+    assert stale.stats()["revalidated"] == 1
+
+def test_offline_replay(server, tmp_path):
+    HttpCache(str(tmp_path)).get(f"{server}/roster")
+    offline = HttpCache(str(tmp_path), offline=True)
+    assert offline.get(f"{server}/roster").from_cache
+    with pytest.raises(OfflineCacheMiss):
+        offline.get(f"{server}/never-fetched")
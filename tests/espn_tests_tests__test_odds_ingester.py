@@ -0,0 +1,89 @@
+import os
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("requests")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../data_pipeline/fetch')))
+import odds_ingester
+from odds_ingester import OddsIngester, game_date, snapshot_rows
+
+def game(home_price, total_point=8.5):
+    return {
+        "id": "evt1", "commence_time": "2025-06-01T02:10:00Z",
+        "home_team": "San Diego Padres", "away_team": "New York Mets",
+        "bookmakers": [{"key": "draftkings", "markets": [
+            {"key": "h2h", "outcomes": [{"name": "San Diego Padres", "price": home_price},
+                                        {"name": "New York Mets", "price": 110}]},
+            {"key": "spreads", "outcomes": [{"name": "San Diego Padres", "price": 150, "point": -1.5},
+                                            {"name": "New York Mets", "price": -170, "point": 1.5}]},
+            {"key": "totals", "outcomes": [{"name": "Over", "price": -105, "point": total_point},
+                                           {"name": "Under", "price": -115, "point": total_point}]},
+        ]}],
+    }
+
+class FakeQuery:
+    def __init__(self, client, table):
+        self.client, self.table = client, table
+
+    def upsert(self, rows, on_conflict):
+        if self.table in self.client.failing:
+            raise RuntimeError(f"{self.table} is down")
+        self.client.written.setdefault(self.table, []).extend(rows)
+        return self
+
+    def execute(self):
+        return self
+
+class FakeClient:
+    def __init__(self, failing=()):
+        self.written = {}
+        self.failing = set(failing)
+
+    def table(self, table):
+        return FakeQuery(self, table)
+
+def test_snapshot_rows_are_compact_per_market():
+    rows = snapshot_rows([game(-130)], datetime(2025, 5, 31, tzinfo=timezone.utc))
+    by_market = {row["market"]: row for row in rows}
+    assert set(by_market) == {"h2h", "spreads", "totals"}
+    assert by_market["h2h"]["home_price"] == -130 and by_market["h2h"]["total_point"] is None
+    assert by_market["spreads"]["home_point"] == -1.5
+    assert by_market["totals"]["over_price"] == -105 and by_market["totals"]["total_point"] == 8.5
+
+def test_game_date_uses_eastern_slate():
+    assert game_date("2025-06-01T02:10:00Z") == "2025-05-31"
+
+def test_only_changed_prices_are_written(monkeypatch):
+    invalidations = []
+    monkeypatch.setattr(odds_ingester, "invalidate", invalidations.append)
+    client = FakeClient()
+    ingester = OddsIngester(client, "key")
+    ingester.last = {}  # skip seeding from Supabase
+    first = ingester.poll(games=[game(-130)])
+    second = ingester.poll(games=[game(-130)])
+    third = ingester.poll(games=[game(-140, total_point=9.0)])
+    assert (first["changed"], second["changed"], third["changed"]) == (3, 0, 2)
+    assert len(client.written["odds_snapshots"]) == 5
+    assert client.written["odds_data"][0]["game_date"] == "2025-05-31"
+    assert invalidations == ["odds", "odds"]
+
+def test_failed_odds_data_upsert_does_not_resend_snapshots(monkeypatch):
+    monkeypatch.setattr(odds_ingester, "invalidate", lambda namespace: None)
+    client = FakeClient(failing={"odds_data"})
+    ingester = OddsIngester(client, "key")
+    ingester.last = {}
+    assert ingester.poll(games=[game(-130)])["written"] == 3
+    assert ingester.poll(games=[game(-130)])["changed"] == 0
+    assert len(client.written["odds_snapshots"]) == 3
+
+def test_doubleheader_odds_rows_are_keyed_by_event(monkeypatch):
+    monkeypatch.setattr(odds_ingester, "invalidate", lambda namespace: None)
+    second = dict(game(-120), id="evt2", commence_time="2025-05-31T17:10:00Z")
+    client = FakeClient()
+    ingester = OddsIngester(client, "key")
+    ingester.last = {}
+    ingester.poll(games=[game(-130), second])
+    rows = client.written["odds_data"]
+    assert [(row["event_id"], row["game_date"]) for row in rows] == [("evt1", "2025-05-31"), ("evt2", "2025-05-31")]
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../data_pipeline/storage')))
+from parquet_store import ParquetSink, read_dataset, read_scraped_csv
+
+def write_legacy_csv(path):
+    with open(path, "w") as f:
+        f.write("# Data scraped on: 2025-06-01 10:00:00\n")
+        pd.DataFrame({"Rank": ["1", "2"], "Team": ["Cubs", "Mets"], "2025": ["45.2%", "--"]}).to_csv(f, index=False)
+
+def test_scraped_csv_header_becomes_timestamp(tmp_path):
+    path = tmp_path / "batting-average.csv"
+    write_legacy_csv(path)
+    df, scraped_at = read_scraped_csv(path)
+    assert scraped_at == pd.Timestamp("2025-06-01 10:00:00")
+    assert list(df.columns) == ["Rank", "Team", "2025"]
+
+def test_partitions_types_and_pushdown(tmp_path):
+    path = tmp_path / "batting-average.csv"
+    write_legacy_csv(path)
+    df, scraped_at = read_scraped_csv(path)
+    with ParquetSink(str(tmp_path / "parquet")) as sink:
+        sink.add("team_stats", df, season=2025, scraped_at=scraped_at, stat="batting-average")
+        sink.add("team_stats", pd.DataFrame({"Rank": ["1"], "Team": ["Cubs"], "Last 3": ["0.5"]}), season=2024, stat="era")
+
+    assert (tmp_path / "parquet" / "dataset=team_stats" / "season=2025" / "scrape_date=2025-06-01").is_dir()
+    season = read_dataset("team_stats", filters={"season": 2025}, root=str(tmp_path / "parquet"))
+    assert list(season["Team"]) == ["Cubs", "Mets"]
+    assert season["2025"].iloc[0] == pytest.approx(45.2)
+    assert pd.isna(season["2025"].iloc[1])
+    assert season["scraped_at"].iloc[0] == pd.Timestamp("2025-06-01 10:00:00")
+
+    both = read_dataset("team_stats", columns=["Team", "Last 3", "season"], root=str(tmp_path / "parquet"))
+    assert sorted(both["season"]) == [2024, 2025, 2025]
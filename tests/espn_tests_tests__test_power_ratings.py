@@ -0,0 +1,128 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../sports_scripts/teamrankings/MLB/rankings')))
+import power_ratings
+from power_ratings import PowerRatings, load_games
+
+def write_log(root, team, rows):
+    os.makedirs(root / team)
+    lines = ["# Data scraped on: 2025-05-22 19:44:39", "Date,Opponent,Opp Rank,H/A/N,Score"] + rows
+    (root / team / f"{team.replace('-', '_')}_game_log.csv").write_text("\n".join(lines) + "\n")
+
+def test_load_games_merges_both_logs(tmp_path):
+    write_log(tmp_path, "new-york-yankees", ["05/17,NY Mets,3,Home,L 2-3", "05/18,NY Mets,3,Home,W 8-2",
+                                             "05/18,NY Mets,3,Home,W 1-0", "03/18,vs Chi Cubs,5,Neutral,W 4-1"])
+    write_log(tmp_path, "new-york-mets", ["05/17,at NY Yankees,1,Away,W 3-2", "05/18,at NY Yankees,1,Away,L 2-8"])
+    games = load_games(str(tmp_path), root=str(tmp_path / "parquet"))
+    # Game 2 of the doubleheader is only in the Yankees' log; game 1 is in both
+    assert games["key"].tolist() == [
+        "2025-03-18:new-york-yankees@chicago-cubs:1",
+        "2025-05-17:new-york-mets@new-york-yankees:1",
+        "2025-05-18:new-york-mets@new-york-yankees:1",
+        "2025-05-18:new-york-mets@new-york-yankees:2",
+    ]
+    neutral = games.iloc[0]
+    assert neutral["neutral"] and (neutral["home_score"], neutral["away_score"]) == (1, 4)
+
+def test_load_games_prefers_the_latest_parquet_scrape(tmp_path):
+    from parquet_store import ParquetSink
+    columns = ["Date", "Opponent", "Opp Rank", "H/A/N", "Score"]
+    with ParquetSink(str(tmp_path / "parquet")) as sink:
+        for scraped_at, rows in (("2025-05-17 09:00", [["05/16", "NY Mets", "3", "Home", "L 2-3"]]),
+                                 ("2025-05-19 09:00", [["05/17", "NY Mets", "3", "Home", "W 8-2"],
+                                                       ["05/18", "NY Mets", "3", "Home", "W 1-0"]])):
+            sink.add("tr_team_trends", pd.DataFrame(rows, columns=columns), season=2025,
+                     scraped_at=scraped_at, team="new-york-yankees", data_type="game-log")
+        sink.add("tr_team_trends", pd.DataFrame({"Trend": ["All Games"], "ATS Record": ["10-5-0"]}),
+                 season=2025, team="new-york-yankees", data_type="ats-results")
+    # The Yankees' CSV is superseded by Parquet; the Mets only have a legacy CSV
+    write_log(tmp_path / "trends", "new-york-yankees", ["05/10,Boston,2,Home,W 5-0"])
+    write_log(tmp_path / "trends", "new-york-mets", ["05/20,at NY Yankees,1,Away,W 4-3"])
+    games = load_games(str(tmp_path / "trends"), root=str(tmp_path / "parquet"))
+    assert games["key"].tolist() == [
+        "2025-05-17:new-york-mets@new-york-yankees:1",
+        "2025-05-18:new-york-mets@new-york-yankees:1",
+        "2025-05-20:new-york-mets@new-york-yankees:1",
+    ]
+
+def random_games(n=300, seed=3):
+    rng = np.random.default_rng(seed)
+    teams = np.array(power_ratings.TEAMS)
+    pairs = np.array([rng.choice(len(teams), 2, replace=False) for _ in range(n)])
+    dates = pd.Timestamp("2025-04-01") + pd.to_timedelta(np.arange(n) // 10, unit="D")
+    games = pd.DataFrame({"game_date": dates, "home": teams[pairs[:, 0]], "away": teams[pairs[:, 1]],
+                          "home_score": rng.integers(0, 10, n), "away_score": rng.integers(0, 10, n),
+                          "neutral": False})
+    games["key"] = [f"{d:%Y-%m-%d}:{a}@{h}:{i}" for i, (d, h, a) in enumerate(zip(games.game_date, games.home, games.away))]
+    return games
+
+def test_incremental_updates_match_a_rebuild(tmp_path, monkeypatch):
+    monkeypatch.setattr(power_ratings, "invalidate", lambda *args, **kwargs: None)
+    games = random_games()
+    full = PowerRatings.rebuild(games)
+
+    ratings = PowerRatings()
+    assert ratings.update(games.iloc[:200]) == 200
+    path = ratings.save(str(tmp_path / "state.npz"))
+    resumed = PowerRatings.load(path)
+    assert resumed.update(games) == 100  # the first 200 are recognized by key
+    np.testing.assert_allclose(resumed.matrix, full.matrix, equal_nan=True)
+    assert resumed.get("NY Yankees", "last_5_games") == full.get("new-york-yankees", "last_5_games")
+
+    # A result dated before the last applied game would need a replay
+    late = games.iloc[:1].assign(key="late")
+    assert resumed.update(late) == 0
+
+def test_split_ratings_for_one_game():
+    ratings = PowerRatings(home_advantage=0.5, k=0.1)
+    ratings.apply_game("2025-04-01", "new-york-yankees", "boston-red-sox", 6, 2)
+    frame = ratings.frame()
+    yankees, red_sox = frame.loc["new-york-yankees"], frame.loc["boston-red-sox"]
+    assert yankees["predictive"] == pytest.approx(0.1 * (4 - 0.5))
+    assert red_sox["predictive"] == pytest.approx(-0.1 * (4 - 0.5))
+    assert yankees["home"] == yankees["in_division"] == yankees["last_5_games"] == pytest.approx(3.5)
+    assert np.isnan(yankees["away"]) and np.isnan(yankees["non_division"])
+    assert red_sox["away"] == pytest.approx(-3.5)
+    # Everyone started even, so both teams faced a tied-for-first opponent
+    assert yankees["vs_teams_1_5"] == pytest.approx(3.5)
+    assert yankees["strength_of_schedule"] == pytest.approx(red_sox["predictive"])
+    assert ratings.win_probability("New York Yankees", "Boston Red Sox") > 0.5
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+def event(state, home, away):
+    return {"status": {"type": {"state": state}},
+            "competitions": [{"competitors": [{"homeAway": "home", "team": {"displayName": home}},
+                                              {"homeAway": "away", "team": {"displayName": away}}]}]}
+
+def test_future_sos_from_the_remaining_schedule(monkeypatch):
+    urls = []
+    events = [event("post", "Boston Red Sox", "New York Yankees"), event("pre", "Boston Red Sox", "New York Yankees"),
+              event("pre", "Athletics", "New York Yankees"), event("pre", "American League", "National League")]
+    monkeypatch.setattr(power_ratings, "cached_get", lambda url: urls.append(url) or FakeResponse({"events": events}))
+    schedule = power_ratings.load_schedule(date(2025, 9, 20))
+    assert "dates=20250920-20250930" in urls[0]
+    assert schedule == [("boston-red-sox", "new-york-yankees"), ("oakland-athletics", "new-york-yankees")]
+    assert power_ratings.load_schedule(date(2025, 10, 15)) == []
+
+    ratings = PowerRatings(k=0.1)
+    ratings.apply_game("2025-09-19", "boston-red-sox", "new-york-yankees", 9, 1)
+    assert np.isnan(ratings.get("new-york-yankees", "future_sos"))
+    ratings.set_schedule(schedule)
+    expected = (ratings.get("boston-red-sox") + ratings.get("oakland-athletics")) / 2
+    assert ratings.get("new-york-yankees", "future_sos") == pytest.approx(expected)
+    assert ratings.get("boston-red-sox", "future_sos") == pytest.approx(ratings.get("new-york-yankees"))
@@ -0,0 +1,47 @@
+import os
+import sys
+import time
+from datetime import date
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("sklearn")
+pytest.importorskip("pyarrow")
+pytest.importorskip("dotenv")
+from sklearn.linear_model import LogisticRegression
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+from app.services import predict_model
+from app.services.predict_model import PredictionService, save_model
+from database.cache_invalidation import invalidate
+
+FEATURES = pd.DataFrame({"player_id": ["1", "2", "3"], "g7_AVG": [0.2, 0.4, 0.3],
+                         "days_since_last_game": [1, 1, 30]})
+
+def test_slate_scored_once_until_invalidated(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(predict_model, "features_as_of", lambda slate_date: calls.append(slate_date) or FEATURES)
+    estimator = LogisticRegression().fit([[0.1], [0.2], [0.4], [0.5]], [0, 0, 1, 1])
+    model_path = save_model(estimator, ["g7_AVG"], str(tmp_path / "model.joblib"))
+    versions_path = str(tmp_path / "versions.json")
+    service = PredictionService(model_path, versions_path)
+    service.load()
+
+    first = service.predictions(date(2025, 6, 1))
+    second = service.predictions(date(2025, 6, 1))
+    assert (first["cached"], second["cached"]) == (False, True)
+    # Player 3 hasn't played in a month and isn't on the slate
+    assert [row["player_id"] for row in first["predictions"]] == ["2", "1"]
+    assert len(calls) == 1
+
+    time.sleep(0.01)
+    invalidate("odds", path=versions_path)
+    assert service.predictions(date(2025, 6, 1))["cached"] is False
+    assert len(calls) == 2
+
+
+    time.sleep(0.01)
+    invalidate("roster", "Cubs", path=versions_path)
+    assert service.predictions(date(2025, 6, 1))["cached"] is False
+    assert len(calls) == 3
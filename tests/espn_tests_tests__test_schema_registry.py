@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("supabase")
+pytest.importorskip("dotenv")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from database.schema_registry import SchemaRegistry, load_migration_columns
+
+class CountingClient:
+    def __init__(self):
+        self.probes = 0
+
+    def table(self, name):
+        return self
+
+    def select(self, columns):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def execute(self):
+        self.probes += 1
+
+def test_migration_columns():
+    tables = load_migration_columns()
+    assert {'season', 'games', 'batting_avg'} <= tables['player_stats']
+    assert {'home_odds', 'away_odds'} <= tables['odds_data']
+
+def test_probe_once_per_ttl():
+    client = CountingClient()
+    registry = SchemaRegistry(ttl=3600, client_getter=lambda: client)
+    for _ in range(100):
+        assert registry.validate('player_stats', ['season', 'games', 'batting_avg'])
+    assert client.probes == 1
+    assert not registry.validate('player_stats', ['no_such_column'])
+    registry.invalidate('player_stats')
+    registry.validate('player_stats', ['season'])
+    assert client.probes == 2
@@ -0,0 +1,46 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../data_pipeline/storage')))
+from snapshot_store import SnapshotStore, at
+
+def stat_row(hits, stat_date):
+    return {"sport": "MLB", "player_name": "Pete Alonso", "team_name": "New York Mets",
+            "stat_type": "batting", "season": 2025, "hits": hits, "stat_date": stat_date}
+
+def test_versions_only_on_change_and_as_of(tmp_path):
+    store = SnapshotStore(str(tmp_path / "sports_data.db"))
+    assert store.record("player_stats", [stat_row(10, "2025-05-01")], observed_at="2025-05-01T09:00:00") == 1
+    # Same values on a later scrape: nothing new, only stat_date moved
+    assert store.record("player_stats", [stat_row(10, "2025-05-02")], observed_at="2025-05-02T09:00:00") == 0
+    assert store.record("player_stats", [stat_row(14, "2025-05-03")], observed_at="2025-05-03T09:00:00") == 1
+
+    assert store.as_of("player_stats", "2025-05-01") == []
+    assert [row["hits"] for row in store.as_of("player_stats", "2025-05-03")] == [10]
+    assert [row["hits"] for row in store.as_of("player_stats", "2025-05-04")] == [14]
+    assert store.as_of("player_stats", "2025-05-04", filters={"player_name": "Juan Soto"}) == []
+
+    history = store.history("player_stats", stat_row(None, None))
+    assert [(row["hits"], row["valid_to"]) for row in history] == [(10, "2025-05-03T09:00:00"), (14, None)]
+
+def test_timeline_and_old_observations(tmp_path):
+    store = SnapshotStore(str(tmp_path / "sports_data.db"))
+    store.record("player_stats", [stat_row(10, None)], observed_at="2025-05-01")
+    store.record("player_stats", [stat_row(14, None)], observed_at="2025-05-10")
+    # A late backfill older than the current version doesn't rewrite history
+    assert store.record("player_stats", [stat_row(12, None)], observed_at="2025-05-05") == 0
+
+    timeline = store.timeline("player_stats", "2025-05-02", "2025-05-31")
+    assert [row["hits"] for row in at(timeline, "2025-05-09")] == [10]
+    assert [row["hits"] for row in at(timeline, "2025-05-11")] == [14]
+
+def test_filters_run_in_sql(tmp_path):
+    store = SnapshotStore(str(tmp_path / "sports_data.db"))
+    soto = dict(stat_row(12, None), player_name="Juan Soto")
+    store.record("player_stats", [stat_row(10, None), soto], observed_at="2025-05-01")
+    # An entity key column, a data column and a None filter that matches a missing value
+    assert [row["hits"] for row in store.as_of("player_stats", "2025-05-02", filters={"player_name": "Juan Soto"})] == [12]
+    assert [row["player_name"] for row in store.as_of("player_stats", "2025-05-02", filters={"hits": 10})] == ["Pete Alonso"]
+    assert len(store.as_of("player_stats", "2025-05-02", filters={"stat_date": None, "team_name": "New York Mets"})) == 2
+    timeline = store.timeline("player_stats", "2025-05-01", "2025-05-31", filters={"player_name": "Pete Alonso", "season": 2025})
+    assert [(row["hits"], row["valid_to"]) for row in timeline] == [(10, None)]
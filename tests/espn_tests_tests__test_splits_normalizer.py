@@ -0,0 +1,45 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("dateutil")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../sports_scripts/espn/MLB')))
+from mlb_splits_normalizer import normalize_splits, splits_table, to_wide
+
+def payload(home_hits):
+    return {
+        'names': ['atBats', 'hits', 'avg'],
+        'labels': ['AB', 'H', 'AVG'],
+        'splitCategories': [
+            {'name': 'split', 'displayName': 'Split', 'splits': [
+                {'displayName': 'All Splits', 'abbreviation': 'Total', 'stats': ['10', '3', '.300']},
+            ]},
+            {'name': 'homeAway', 'displayName': 'Home/Away', 'splits': [
+                {'displayName': 'Home', 'abbreviation': 'H', 'stats': ['5', str(home_hits), '--']},
+                {'displayName': 'Away', 'abbreviation': 'A', 'stats': []},
+            ]},
+        ],
+    }
+
+def test_long_frame_for_many_players():
+    long = normalize_splits({'1': payload(2), '2': payload(1)})
+    assert list(long.columns) == ['player_id', 'category', 'split', 'abbreviation', 'stat', 'value']
+    assert len(long) == 2 * 3 * 3  # All Splits, Overall, Home per player; Away has no stats
+    home_hits = long[(long['split'] == 'Home') & (long['stat'] == 'H')].set_index('player_id')['value']
+    assert home_hits['1'] == 2 and home_hits['2'] == 1
+    assert long[(long['split'] == 'Home') & (long['stat'] == 'AVG')]['value'].isna().all()
+
+def test_split_and_category_filters():
+    assert set(normalize_splits({'1': payload(2)}, splits={'Home'})['split']) == {'Home'}
+    assert set(normalize_splits({'1': payload(2)}, categories={'Overall'})['split']) == {'Overall'}
+    wide = to_wide(normalize_splits({'1': payload(2)}))
+    assert list(wide['split']) == ['All Splits', 'Overall', 'Home']
+
+def test_legacy_table_layout():
+    df = splits_table(payload(2))
+    assert list(df.columns) == ['Category', 'Split', 'Abbreviation', 'AB', 'H', 'AVG']
+    assert list(df['Split']) == ['All Splits', 'Overall', 'Home']
+    assert df['AB'].tolist() == [10, 10, 5]
+    assert df['AVG'].tolist() == ['.300', '.300', 'N/A']
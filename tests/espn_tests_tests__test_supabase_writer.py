@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../data_pipeline/fetch')))
+from supabase_writer import UpsertBuffer
+
+class FakeQuery:
+    def __init__(self, client, table):
+        self.client, self.table = client, table
+
+    def upsert(self, rows, on_conflict):
+        if self.table in self.client.failing:
+            raise RuntimeError(f"{self.table} is down")
+        self.client.written.setdefault(self.table, []).extend(rows)
+        return self
+
+    def execute(self):
+        return self
+
+class FakeClient:
+    def __init__(self, failing=()):
+        self.written = {}
+        self.failing = set(failing)
+
+    def table(self, table):
+        return FakeQuery(self, table)
+
+def team_row(team_name, stat_date=None):
+    return {"sport": "MLB", "team_name": team_name, "stat_type": "batting", "season": 2025, "stat_date": stat_date}
+
+def test_rows_merge_on_natural_key():
+    client = FakeClient()
+    with UpsertBuffer(client) as buffer:
+        buffer.add_many("team_stats", [team_row("Chicago Cubs"), team_row("Chicago Cubs"), team_row("New York Mets")])
+    assert len(client.written["team_stats"]) == 2
+
+def test_failed_flush_on_exit_raises():
+    with pytest.raises(RuntimeError, match="team_stats"):
+        with UpsertBuffer(FakeClient(failing={"team_stats"})) as buffer:
+            buffer.add("team_stats", team_row("Chicago Cubs"))
+
+def test_explicit_flush_reports_earlier_chunk_failures():
+    # The first chunk is written (and fails) inside add(); flush() still reports it, so exit doesn't raise
+    with UpsertBuffer(FakeClient(failing={"team_stats"}), chunk_size=1) as buffer:
+        buffer.add("team_stats", team_row("Chicago Cubs"))
+        assert not buffer.flush()
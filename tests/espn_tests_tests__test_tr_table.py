@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("lxml")
+pytest.importorskip("selenium")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../sports_scripts/teamrankings/MLB')))
+from tr_table import parse_tr_table
+
+PAGE = """
+<html><body>
+<table class="datatable"><tr><th>Ignore</th></tr><tr><td>me</td></tr></table>
+<table class="tr-table datatable scrollable">
+  <thead><tr><th>Rank</th><th>Team</th><th>2025</th></tr></thead>
+  <tbody>
+    <tr><td>1</td><td><a href="/mlb/team/chicago-cubs">Chicago Cubs</a></td><td> 5.12 </td></tr>
+    <tr><td>2</td><td>NY Yankees</td><td>4.98</td></tr>
+  </tbody>
+</table>
+</body></html>
+"""
+
+def test_parse_tr_table():
+    df = parse_tr_table(PAGE)
+    assert list(df.columns) == ["Rank", "Team", "2025"]
+    assert df.values.tolist() == [["1", "Chicago Cubs", "5.12"], ["2", "NY Yankees", "4.98"]]
+
+def test_parse_tr_table_missing():
+    assert parse_tr_table("<html><body><p>Loading...</p></body></html>") is None
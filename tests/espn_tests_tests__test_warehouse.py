@@ -0,0 +1,89 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("supabase")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../data_pipeline/storage')))
+from warehouse import Warehouse
+
+def stat_row(player_name, season, hits):
+    return {"sport": "MLB", "player_name": player_name, "team_name": "New York Mets",
+            "stat_type": "batting", "season": season, "hits": hits, "stat_date": None}
+
+def test_tables_mirror_migrations(tmp_path):
+    warehouse = Warehouse(str(tmp_path / "sports_data.db"))
+    for table in ("team_stats", "player_stats", "player_splits", "odds_data"):
+        assert "sport" in warehouse.columns[table]
+    assert "split_value" in warehouse.columns["player_splits"]
+
+def test_reload_replaces_on_natural_key(tmp_path):
+    warehouse = Warehouse(str(tmp_path / "sports_data.db"))
+    warehouse.bulk_load("player_stats", [stat_row("Pete Alonso", 2025, 10), stat_row("Pete Alonso", 2024, 150)])
+    warehouse.bulk_load("player_stats", [stat_row("Pete Alonso", 2025, 12)])
+    assert warehouse.count("player_stats") == 2
+    rows = warehouse.select("player_stats", columns=["hits"], filters={"player_name": "Pete Alonso", "season": 2025})
+    assert rows == [{"hits": 12}]
+    plan = warehouse.query("EXPLAIN QUERY PLAN SELECT * FROM player_stats WHERE player_name = ? AND season = ?", ("x", 1))
+    assert "idx_player_stats_player_name_season" in plan[0]["detail"]
+
+class FakeQuery:
+    def __init__(self, table):
+        self.table = table
+        self.rows = list(table.rows)
+
+    def select(self, _columns):
+        return self
+
+    def gt(self, column, value):
+        self.rows = [row for row in self.rows if row[column] > value]
+        return self
+
+    def order(self, column):
+        self.rows.sort(key=lambda row: row[column])
+        return self
+
+    def range(self, start, end):
+        self.rows = self.rows[start:end + 1]
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self.table.upserted.extend(rows)
+        return self
+
+    def execute(self):
+        return type("Response", (), {"data": [dict(row) for row in self.rows]})()
+
+class FakeClient:
+    def __init__(self, rows):
+        self.rows = rows
+        self.upserted = []
+
+    def table(self, _name):
+        return FakeQuery(self)
+
+def test_doubleheader_odds_keep_their_own_rows(tmp_path):
+    path = str(tmp_path / "sports_data.db")
+    with Warehouse(path) as warehouse:
+        # A database created while odds_data was keyed on (sport, teams, date)
+        warehouse._db.execute("DROP INDEX odds_data_natural_key")
+        warehouse._db.execute("CREATE UNIQUE INDEX odds_data_natural_key ON odds_data (sport, home_team, away_team, game_date)")
+        warehouse.bulk_load("odds_data", [{"sport": "MLB", "home_team": "New York Mets", "away_team": "Atlanta Braves",
+                                           "home_odds": -120, "away_odds": 110, "game_date": "2025-06-01"}])
+    games = [{"sport": "MLB", "event_id": event_id, "home_team": "New York Mets", "away_team": "Atlanta Braves",
+              "home_odds": home_odds, "away_odds": 110, "game_date": "2025-06-01"}
+             for event_id, home_odds in (("evt1", -130), ("evt2", -115))]
+    with Warehouse(path) as warehouse:
+        warehouse.bulk_load("odds_data", games)
+        rows = warehouse.select("odds_data", columns=["event_id", "home_odds"], order_by="id")
+    assert [row["event_id"] for row in rows] == ["legacy-1", "evt1", "evt2"]
+
+def test_pulled_rows_are_not_synced_back(tmp_path):
+    warehouse = Warehouse(str(tmp_path / "sports_data.db"))
+    client = FakeClient([dict(stat_row("Pete Alonso", 2025, 10), id=41), dict(stat_row("Juan Soto", 2025, 9), id=42)])
+    assert warehouse.pull_from_supabase(client, "player_stats") == 2
+    assert warehouse.sync_to_supabase(client, tables=["player_stats"]) == {}
+
+    warehouse.bulk_load("player_stats", [stat_row("Francisco Lindor", 2025, 8)])
+    assert warehouse.sync_to_supabase(client, tables=["player_stats"]) == {"player_stats": 1}
+    assert [row["player_name"] for row in client.upserted] == ["Francisco Lindor"]